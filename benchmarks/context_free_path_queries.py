@@ -0,0 +1,105 @@
+"""
+Compares the engines of the context-free path queries
+
+Each case is a graph and a grammar, queried for all the pairs and then \
+from some sources only, with each engine. The graphs are random but seeded, \
+so the timings can be compared between runs. Run it from the root of the \
+repository:
+
+    python -m benchmarks.context_free_path_queries [--large] [--engines ...]
+
+The case of 100k edges is only run with --large, as it takes several \
+minutes.
+"""
+
+import argparse
+import random
+import time
+
+import networkx as nx
+
+from pyformlang.cfg import CFG
+from pyformlang.path_query import context_free_path_query
+
+ENGINES = ["hellings", "matrix", "tensor"]
+
+
+def get_random_graph(n_nodes, n_edges, labels="ab"):
+    """ A random labeled graph """
+    graph = nx.MultiDiGraph()
+    graph.add_nodes_from(range(n_nodes))
+    for _ in range(n_edges):
+        graph.add_edge(random.randrange(n_nodes), random.randrange(n_nodes),
+                       label=random.choice(labels))
+    return graph
+
+
+def get_two_cycles(length_a, length_b):
+    """ A cycle labeled by a and a cycle labeled by b, sharing node 0 """
+    graph = nx.MultiDiGraph()
+    for i in range(length_a):
+        graph.add_edge(i, (i + 1) % length_a, label="a")
+    nodes_b = [0] + list(range(length_a, length_a + length_b - 1))
+    for i, node in enumerate(nodes_b):
+        graph.add_edge(node, nodes_b[(i + 1) % length_b], label="b")
+    return graph
+
+
+def get_hierarchy(n_nodes, n_edges):
+    """ A random graph whose edges sub have an inverse edge sub_r, as \
+    queried by same-generation queries """
+    graph = nx.MultiDiGraph()
+    graph.add_nodes_from(range(n_nodes))
+    for _ in range(n_edges // 2):
+        parent = random.randrange(n_nodes)
+        child = random.randrange(n_nodes)
+        graph.add_edge(parent, child, label="sub")
+        graph.add_edge(child, parent, label="sub_r")
+    return graph
+
+
+def get_cases(large):
+    """ The cases, as (name, graph, grammar, number of sources) """
+    random.seed(25)
+    dyck = CFG.from_text("S -> a S b S | epsilon")
+    a_n_b_n = CFG.from_text("S -> a S b | a b")
+    same_generation = CFG.from_text("S -> sub_r S sub | sub_r sub")
+    cases = [
+        ("random Dyck, 300 nodes / 600 edges",
+         get_random_graph(300, 600), dyck, 10),
+        ("a^n b^n, two cycles of 60 and 59 edges",
+         get_two_cycles(60, 59), a_n_b_n, 1),
+        ("same generation, 10k nodes / 20k edges",
+         get_hierarchy(10000, 20000), same_generation, 100)]
+    if large:
+        cases.append(("same generation, 50k nodes / 100k edges",
+                      get_hierarchy(50000, 100000), same_generation, 100))
+    return cases
+
+
+def main():
+    """ Runs the benchmark and prints the timings """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--large", action="store_true",
+                        help="also run the case of 100k edges")
+    parser.add_argument("--engines", nargs="+", default=ENGINES,
+                        choices=ENGINES, help="the engines to compare")
+    arguments = parser.parse_args()
+    for name, graph, cfg, n_sources in get_cases(arguments.large):
+        print(name + ", " + str(n_sources) + " source(s)")
+        sources = list(graph.nodes)[:n_sources]
+        for engine in arguments.engines:
+            start = time.perf_counter()
+            pairs = context_free_path_query(graph, cfg, engine=engine)
+            all_pairs_time = time.perf_counter() - start
+            start = time.perf_counter()
+            context_free_path_query(graph, cfg, sources=sources,
+                                    engine=engine)
+            sources_time = time.perf_counter() - start
+            print(f"  {engine:9} all pairs {all_pairs_time:7.2f} s, "
+                  f"sources {sources_time:7.2f} s ({len(pairs)} pairs)",
+                  flush=True)
+
+
+if __name__ == "__main__":
+    main()
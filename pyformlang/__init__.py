@@ -23,6 +23,8 @@ Indexed Grammar
     Indexed Grammar
 rsa
     Recursive automaton
+path_query
+    Path queries over labeled graphs
 
 """
 
@@ -32,4 +34,5 @@ __all__ = ["finite_automaton",
            "fst",
            "indexed_grammar",
            "pda",
-           "rsa"]
+           "rsa",
+           "path_query"]
@@ -2,15 +2,20 @@
 
 from typing import Any
 
+from pyformlang.interning import InternedObject
 
-class CFGObject:  # pylint: disable=too-few-public-methods
+
+class CFGObject(InternedObject):
     """ An object in a CFG
 
+    The objects are interned: equal values usually give the same object.
+
     Parameters
     -----------
     value : any
         The value of the object
     """
+    # pylint: disable=too-few-public-methods
 
     __slots__ = ["_value", "_hash"]
 
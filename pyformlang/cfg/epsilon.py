@@ -4,9 +4,11 @@ from .terminal import Terminal
 
 
 class Epsilon(Terminal):
-    """ An epsilon terminal """
+    """ An epsilon terminal, of which there is a single instance """
     # pylint: disable=too-few-public-methods
 
+    __slots__ = []
+
     def __init__(self):
         super().__init__("epsilon")
 
@@ -12,8 +12,11 @@ class Terminal(CFGObject):  # pylint: disable=too-few-public-methods
         The value of the terminal
     """
 
+    __slots__ = []
+
     def __eq__(self, other):
-        return isinstance(other, Terminal) and self.value == other.value
+        return self is other or \
+            isinstance(other, Terminal) and self._value == other.value
 
     def __repr__(self):
         return "Terminal(" + str(self.value) + ")"
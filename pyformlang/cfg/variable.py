@@ -13,12 +13,11 @@ class Variable(CFGObject):  # pylint: disable=too-few-public-methods
         The value of the variable
     """
 
-    def __init__(self, value):
-        super().__init__(value)
-        self._hash = None
-        self.index_cfg_converter = None
+    __slots__ = []
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, CFGObject):
             return self._value == other.value
         return self._value == other
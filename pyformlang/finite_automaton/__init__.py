@@ -15,6 +15,41 @@ Available Classes
     A non-deterministic finite automaton, without epsilon transitions
 :class:`~pyformlang.finite_automaton.EpsilonNFA`
     A non-deterministic finite automaton, with epsilon transitions
+:class:`~pyformlang.finite_automaton.CompiledDFA`
+    An immutable deterministic finite automaton, optimized for membership \
+    queries
+:class:`~pyformlang.finite_automaton.CompiledNFA`
+    An immutable automaton running directly on a file written by save, \
+    possibly memory-mapped
+:class:`~pyformlang.finite_automaton.LazyDFA`
+    A deterministic finite automaton built on the fly from an epsilon NFA
+:class:`~pyformlang.finite_automaton.LazyView`
+    A view of a language, determinized on demand, which can be combined \
+    with other views. Cannot be used directly.
+:class:`~pyformlang.finite_automaton.LazyAutomatonView`
+    A view of the language of an epsilon NFA
+:class:`~pyformlang.finite_automaton.LazyComplement`
+    A view of the complement of a view
+:class:`~pyformlang.finite_automaton.LazyUnion`
+    A view of the union of two views
+:class:`~pyformlang.finite_automaton.LazyDifference`
+    A view of the difference of two views
+:class:`~pyformlang.finite_automaton.Matcher`
+    An incremental matcher, reading a word by chunks
+:class:`~pyformlang.finite_automaton.DFAMatcher`
+    An incremental matcher for deterministic automata
+:class:`~pyformlang.finite_automaton.NFAMatcher`
+    An incremental matcher for non-deterministic automata
+:class:`~pyformlang.finite_automaton.LazyDFAMatcher`
+    An incremental matcher for lazy deterministic automata
+:class:`~pyformlang.finite_automaton.LazyViewMatcher`
+    An incremental matcher for lazy views
+:class:`~pyformlang.finite_automaton.CompiledNFAMatcher`
+    An incremental matcher for automata loaded from a file
+:class:`~pyformlang.finite_automaton.AutomatonMatrices`
+    An automaton decomposed into one sparse boolean matrix per symbol
+:class:`~pyformlang.finite_automaton.BooleanMatrix`
+    A sparse boolean matrix, in compressed sparse row format
 :class:`~pyformlang.finite_automaton.TransitionFunction`
     A deterministic transition function
 :class:`~pyformlang.finite_automaton.NondeterministicTransitionFunction`
@@ -32,12 +67,33 @@ Available Classes
     An exception that occurs when adding an epsilon transition to a \
     non-epsilon NFA.
 
+Available Functions
+-------------------
+
+:func:`~pyformlang.finite_automaton.intersection_is_empty`
+    Checks whether the intersection of several automata is empty, without \
+    building their product
+:func:`~pyformlang.finite_automaton.get_intersection_witness`
+    Gives a shortest word accepted by several automata
+:func:`~pyformlang.finite_automaton.load`
+    Loads an automaton written by save, without parsing it
+
 """
 
 from .finite_automaton import FiniteAutomaton
 from .deterministic_finite_automaton import DeterministicFiniteAutomaton
 from .nondeterministic_finite_automaton import NondeterministicFiniteAutomaton
 from .epsilon_nfa import EpsilonNFA
+from .compiled_dfa import CompiledDFA
+from .matcher import Matcher, DFAMatcher, NFAMatcher
+from .lazy_dfa import LazyDFA, LazyDFAMatcher
+from .lazy_views import LazyView, LazyAutomatonView, LazyComplement, \
+    LazyUnion, LazyDifference, LazyViewMatcher
+from .compiled_nfa import CompiledNFA, CompiledNFAMatcher
+from .binary_format import load
+from .boolean_matrix import BooleanMatrix
+from .automaton_matrices import AutomatonMatrices
+from .intersection import intersection_is_empty, get_intersection_witness
 from .state import State
 from .symbol import Symbol
 from .epsilon import Epsilon
@@ -51,10 +107,29 @@ __all__ = ["FiniteAutomaton",
            "DeterministicFiniteAutomaton",
            "NondeterministicFiniteAutomaton",
            "EpsilonNFA",
+           "CompiledDFA",
+           "CompiledNFA",
+           "LazyDFA",
+           "LazyView",
+           "LazyAutomatonView",
+           "LazyComplement",
+           "LazyUnion",
+           "LazyDifference",
+           "Matcher",
+           "DFAMatcher",
+           "NFAMatcher",
+           "LazyDFAMatcher",
+           "LazyViewMatcher",
+           "CompiledNFAMatcher",
+           "AutomatonMatrices",
+           "BooleanMatrix",
            "State",
            "Symbol",
            "Epsilon",
            "TransitionFunction",
            "NondeterministicTransitionFunction",
            "DuplicateTransitionError",
-           "InvalidEpsilonTransition"]
+           "InvalidEpsilonTransition",
+           "intersection_is_empty",
+           "get_intersection_witness",
+           "load"]
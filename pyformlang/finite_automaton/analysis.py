@@ -0,0 +1,125 @@
+"""
+Structural analyses of an automaton, computed from its strongly connected \
+components
+"""
+
+import math
+from collections import deque
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from .epsilon import Epsilon
+from .strongly_connected_components import get_strongly_connected_components
+
+
+class AutomatonAnalysis(NamedTuple):
+    """ Structural properties of an automaton """
+    # The states reachable from a start state and from which a final state
+    # can be reached
+    useful_states: FrozenSet["State"]
+    # Whether no cycle can be reached from a start state
+    is_acyclic: bool
+    # Whether the language is finite
+    is_finite: bool
+    # The length of a shortest accepted word, None if the language is empty
+    shortest_word_length: Optional[int]
+    # The length of a longest accepted word, None if the language is empty
+    # and infinity if it is infinite
+    longest_word_length: Optional[float]
+
+
+def analyze(automaton: "FiniteAutomaton") -> AutomatonAnalysis:
+    """ Analyzes the structure of an automaton in linear time
+
+    The strongly connected components of the states reachable from a start \
+    state are computed once. They are then processed in reverse \
+    topological order, so that the successors of a component are known \
+    before it: a component is useful if one of its states is final or if \
+    it leads to a useful component. The language is infinite when a \
+    useful component has an internal transition which is not an epsilon \
+    transition. The longest word is found along the same order, and the \
+    shortest one by a breadth-first search counting only the non-epsilon \
+    transitions.
+
+    Parameters
+    ----------
+    automaton : :class:`~pyformlang.finite_automaton.FiniteAutomaton`
+        The automaton to analyze
+
+    Returns
+    ----------
+    analysis : \
+    :class:`~pyformlang.finite_automaton.analysis.AutomatonAnalysis`
+        The properties of the automaton
+    """
+    # pylint: disable=too-many-locals
+    # The successors of each state, with the length read on the way
+    successors: Dict["State", List[Tuple["State", int]]] = {}
+    for s_from, symbol, s_to in automaton:
+        successors.setdefault(s_from, []).append(
+            (s_to, 0 if symbol == Epsilon() else 1))
+    components = get_strongly_connected_components(
+        automaton.start_states,
+        lambda state: (s_to for s_to, _ in successors.get(state, ())))
+    component_ids = {}
+    for i, component in enumerate(components):
+        for state in component:
+            component_ids[state] = i
+    is_acyclic = True
+    is_finite = True
+    # For each component, the length of a longest word leading from it to
+    # a final state, None if there is no such word
+    longest: List[Optional[float]] = []
+    for i, component in enumerate(components):
+        has_cycle = len(component) > 1
+        has_symbol_cycle = False
+        length = None
+        if not automaton.final_states.isdisjoint(component):
+            length = 0
+        for state in component:
+            for s_to, weight in successors.get(state, ()):
+                j = component_ids[s_to]
+                if j == i:
+                    has_cycle = True
+                    has_symbol_cycle = has_symbol_cycle or weight == 1
+                elif longest[j] is not None and \
+                        (length is None or longest[j] + weight > length):
+                    length = longest[j] + weight
+        is_acyclic = is_acyclic and not has_cycle
+        if length is not None and has_symbol_cycle:
+            is_finite = False
+            length = math.inf
+        longest.append(length)
+    useful_states = frozenset(state
+                              for i, component in enumerate(components)
+                              if longest[i] is not None
+                              for state in component)
+    start_lengths = [longest[component_ids[state]]
+                     for state in automaton.start_states
+                     if longest[component_ids[state]] is not None]
+    return AutomatonAnalysis(
+        useful_states, is_acyclic, is_finite,
+        _get_shortest_word_length(automaton, successors, useful_states),
+        max(start_lengths, default=None))
+
+
+def _get_shortest_word_length(automaton, successors, useful_states) \
+        -> Optional[int]:
+    """ Finds the length of a shortest accepted word, with a breadth-first \
+    search in which the epsilon transitions have no length """
+    distances = {state: 0 for state in automaton.start_states
+                 if state in useful_states}
+    to_process = deque(distances)
+    while to_process:
+        current = to_process.popleft()
+        if current in automaton.final_states:
+            return distances[current]
+        for s_to, weight in successors.get(current, ()):
+            distance = distances[current] + weight
+            if s_to in useful_states and \
+                    distance < distances.get(s_to, math.inf):
+                distances[s_to] = distance
+                if weight == 0:
+                    to_process.appendleft(s_to)
+                else:
+                    to_process.append(s_to)
+    return None
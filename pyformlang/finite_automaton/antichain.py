@@ -0,0 +1,292 @@
+""" Language inclusion with antichains and simulations
+For internal usage
+"""
+
+from typing import Dict, List
+
+# pylint: disable=cyclic-import
+from pyformlang import finite_automaton
+
+from .bitset_nfa import BitsetNFA, iterate_bits
+from .symbol import Symbol
+
+# Above this number of states, the simulation is not computed and only the
+# inclusion of sets is used for the subsumption
+MAX_STATES_SIMULATION = 1000
+
+
+class InclusionChecker:
+    # pylint: disable=too-many-instance-attributes, too-few-public-methods
+    """ Checks whether the language of an epsilon NFA is included in the \
+    language of another one
+
+    The states of the two automata are numbered together and the sets of \
+    states are bitsets. An epsilon transition is followed by reading the \
+    closure of the states, so that each state stands for its closure.
+
+    The search explores pairs (p, S) of a state of the first automaton and \
+    a set of states of the second one reached by the same word, as in the \
+    antichain algorithm of De Wulf et al. A pair is a counterexample when p \
+    is final and S is not. The pairs are compared with the maximal forward \
+    simulation between the states, as in Abdulla et al.: only the minimal \
+    pairs are explored, the sets are reduced to their maximal states, and a \
+    pair (p, S) in which p is simulated by a state of S is dropped.
+
+    For internal usage.
+
+    Parameters
+    ----------
+    enfa0 : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+        The automaton whose language should be included
+    enfa1 : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+        The automaton whose language should include the other one
+    """
+
+    def __init__(self, enfa0: "EpsilonNFA", enfa1: "EpsilonNFA"):
+        bitset_nfa0 = BitsetNFA(enfa0)
+        bitset_nfa1 = BitsetNFA(enfa1)
+        shift = len(bitset_nfa0.states)
+        self._n_states = shift + len(bitset_nfa1.states)
+        symbols = set(bitset_nfa0.symbols)
+        symbols.update(bitset_nfa1.symbols)
+        # For each symbol, the successors of the closure of each state
+        self._posts = {}
+        for symbol in symbols:
+            self._posts[symbol] = _get_posts(bitset_nfa0, symbol, 0) + \
+                _get_posts(bitset_nfa1, symbol, shift)
+        self._finals = _get_finals(bitset_nfa0, 0) | \
+            _get_finals(bitset_nfa1, shift)
+        self._useful = bitset_nfa0.useful | bitset_nfa1.useful << shift
+        self._start0 = bitset_nfa0.start
+        self._start1 = bitset_nfa1.start << shift
+        if self._n_states <= MAX_STATES_SIMULATION:
+            self._simulating = self._get_simulation()
+        else:
+            self._simulating = [1 << i for i in range(self._n_states)]
+        # The states simulated by each state
+        self._simulated = [0] * self._n_states
+        for i, simulating in enumerate(self._simulating):
+            for j in iterate_bits(simulating):
+                self._simulated[j] |= 1 << i
+
+    def _get_simulation(self) -> List[int]:
+        """ Computes the maximal forward simulation
+
+        A state q is simulated by a state r if r is final when q is, and if \
+        each move of q can be matched by a move of r on the same symbol, \
+        between states simulating each other. The language of q is then \
+        included in the one of r.
+
+        Returns
+        ----------
+        simulating : list of int
+            For each state, the bitset of the states simulating it
+        """
+        all_states = (1 << self._n_states) - 1
+        simulating = [self._finals if self._finals >> i & 1 else all_states
+                      for i in range(self._n_states)]
+        previous = {}
+        for symbol, posts in self._posts.items():
+            previous[symbol] = [0] * self._n_states
+            for i, post in enumerate(posts):
+                for j in iterate_bits(post):
+                    previous[symbol][j] |= 1 << i
+        changed = True
+        while changed:
+            changed = False
+            for symbol, posts in self._posts.items():
+                previous_symbol = previous[symbol]
+                # The states having a move to a state simulating each state
+                matching = {}
+                for i, post in enumerate(posts):
+                    allowed = simulating[i]
+                    for j in iterate_bits(post):
+                        matching_j = matching.get(j)
+                        if matching_j is None:
+                            matching_j = _get_union(previous_symbol,
+                                                    simulating[j])
+                            matching[j] = matching_j
+                        allowed &= matching_j
+                    if allowed != simulating[i]:
+                        simulating[i] = allowed
+                        changed = True
+        return simulating
+
+    def _get_post(self, current: int, symbol: Symbol) -> int:
+        """ Gives the successors of a set of states by a symbol """
+        return _get_union(self._posts[symbol], current)
+
+    def _reduce(self, current: int) -> int:
+        """ Removes the states simulated by other states of the set, and \
+        those from which no final state can be reached """
+        res = current & self._useful
+        for i in iterate_bits(res):
+            if self._simulating[i] & res & ~(1 << i):
+                res &= ~(1 << i)
+        return res
+
+    def _get_simulated(self, current: int) -> int:
+        """ Gives the states simulated by a state of a set """
+        return _get_union(self._simulated, current)
+
+    def is_included(self) -> bool:
+        """ Whether the language of the first automaton is included in the \
+        one of the second automaton
+
+        Returns
+        ----------
+        is_included : bool
+            Whether the inclusion holds
+        """
+        # The pairs to keep, by state of the first automaton, with the
+        # states simulated by their set
+        antichain: Dict[int, Dict[int, int]] = {}
+        to_process = []
+        start1 = self._reduce(self._start1)
+        for state in iterate_bits(self._start0):
+            if not self._add(antichain, to_process, state, start1):
+                return False
+        while to_process:
+            state, current = to_process.pop()
+            if current not in antichain.get(state, {}):
+                # Removed by a smaller pair
+                continue
+            for symbol, posts in self._posts.items():
+                next_states0 = posts[state]
+                if not next_states0:
+                    continue
+                next_current = self._reduce(self._get_post(current, symbol))
+                for next_state in iterate_bits(next_states0):
+                    if not self._add(antichain, to_process, next_state,
+                                     next_current):
+                        return False
+        return True
+
+    def _add(self, antichain, to_process, state: int, current: int) -> bool:
+        """ Adds a pair to explore, unless a smaller one is already there
+
+        Returns
+        ----------
+        is_valid : bool
+            False if the pair is a counterexample
+        """
+        if not self._useful >> state & 1:
+            return True
+        if self._finals >> state & 1 and not current & self._finals:
+            return False
+        if self._simulating[state] & current:
+            return True
+        simulated = self._get_simulated(current)
+        # A pair (r, R) is smaller if r simulates state and the states of R
+        # are simulated by some state of current
+        for other_state in iterate_bits(self._simulating[state]):
+            for other_current in antichain.get(other_state, ()):
+                if not other_current & ~simulated:
+                    return True
+        for other_state in iterate_bits(self._simulated[state]):
+            others = antichain.get(other_state)
+            if not others:
+                continue
+            for other_current, other_simulated in list(others.items()):
+                if not current & ~other_simulated:
+                    del others[other_current]
+        antichain.setdefault(state, {})[current] = simulated
+        to_process.append((state, current))
+        return True
+
+
+def _get_posts(bitset_nfa: BitsetNFA, symbol: Symbol, shift: int) \
+        -> List[int]:
+    """ Gives the successors of the closure of each state by a symbol """
+    return [bitset_nfa.get_next(bitset_nfa.close(1 << i), symbol) << shift
+            for i in range(len(bitset_nfa.states))]
+
+
+def _get_finals(bitset_nfa: BitsetNFA, shift: int) -> int:
+    """ Gives the states whose closure contains a final state """
+    res = 0
+    for i in range(len(bitset_nfa.states)):
+        if bitset_nfa.is_final(bitset_nfa.close(1 << i)):
+            res |= 1 << i
+    return res << shift
+
+
+def _get_union(bitsets: List[int], indexes: int) -> int:
+    """ Gives the union of the bitsets whose indexes are in a bitset """
+    res = 0
+    for i in iterate_bits(indexes):
+        res |= bitsets[i]
+    return res
+
+
+class InclusionMixin:
+    """ Gives the inclusion and universality checks of epsilon NFAs """
+
+    def is_included_in(self, other: "EpsilonNFA") -> bool:
+        """ Checks whether the language of the current automaton is included \
+        in the language of another one
+
+        The check uses antichains: it explores pairs of a state of the \
+        current automaton and a set of states of the other one, keeping \
+        only the pairs which are minimal for a simulation preorder, and \
+        stops at the first counterexample. Neither automaton is \
+        determinized nor complemented.
+
+        Parameters
+        ----------
+        other : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+            The other automaton
+
+        Returns
+        ----------
+        is_included : bool
+            Whether the inclusion holds
+
+        Examples
+        --------
+
+        >>> enfa0 = finite_automaton.EpsilonNFA()
+        >>> enfa0.add_transitions([(0, "a", 1), (1, "b", 2)])
+        >>> enfa0.add_start_state(0)
+        >>> enfa0.add_final_state(2)
+        >>> enfa1 = finite_automaton.EpsilonNFA()
+        >>> enfa1.add_transitions([(0, "a", 0), (0, "b", 0)])
+        >>> enfa1.add_start_state(0)
+        >>> enfa1.add_final_state(0)
+        >>> enfa0.is_included_in(enfa1)
+        True
+        >>> enfa1.is_included_in(enfa0)
+        False
+
+        """
+        return InclusionChecker(self, other).is_included()
+
+    def is_universal(self) -> bool:
+        """ Checks whether the automaton accepts all the words over its \
+        symbols
+
+        The check uses antichains, see :meth:`is_included_in`.
+
+        Returns
+        ----------
+        is_universal : bool
+            Whether all the words are accepted
+
+        Examples
+        --------
+
+        >>> enfa = finite_automaton.EpsilonNFA()
+        >>> enfa.add_transitions([(0, "a", 0), (0, "b", 1), (1, "b", 0), \
+        (0, "epsilon", 1)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> enfa.is_universal()
+        True
+
+        """
+        universal = finite_automaton.EpsilonNFA()
+        universal.add_start_state(0)
+        universal.add_final_state(0)
+        for symbol in self._input_symbols:
+            universal.add_transition(0, symbol, 0)
+        return universal.is_included_in(self)
@@ -0,0 +1,300 @@
+"""
+The decomposition of an automaton into one boolean matrix per symbol
+"""
+
+from typing import Dict, Hashable, Iterable, Sequence
+
+import numpy as np
+
+# pylint: disable=cyclic-import
+from pyformlang import finite_automaton
+
+from .boolean_matrix import BooleanMatrix
+from .epsilon import Epsilon
+from .state import State
+from .symbol import Symbol
+
+
+class AutomatonMatrices:
+    """ An automaton decomposed into boolean matrices
+
+    The states are numbered, and each symbol has a sparse adjacency \
+    matrix: its entry (i, j) is true when the symbol leads from the state \
+    i to the state j. The epsilon transitions, if any, have their own \
+    matrix too. The start and the final states are boolean vectors.
+
+    The operations on automata are then operations on matrices: the \
+    intersection is the Kronecker product of the matrices of each symbol, \
+    the epsilon closure is the transitive closure of the epsilon matrix \
+    and the reachable states are found by repeated products of a vector \
+    by the matrices.
+
+    Parameters
+    ----------
+    states : sequence of :class:`~pyformlang.finite_automaton.State`
+        The states, indexed by their number
+    matrices : dict of :class:`~pyformlang.finite_automaton.Symbol` to \
+    :class:`~pyformlang.finite_automaton.BooleanMatrix`
+        The adjacency matrix of each symbol
+    start_states : numpy.ndarray of bool
+        Which states are start states
+    final_states : numpy.ndarray of bool
+        Which states are final
+
+    Examples
+    --------
+
+    >>> enfa = EpsilonNFA()
+    >>> enfa.add_transitions([(0, "a", 1), (1, "epsilon", 2)])
+    >>> enfa.add_start_state(0)
+    >>> enfa.add_final_state(2)
+    >>> matrices = enfa.to_matrices()
+    >>> matrices.get_state_index(1)
+    1
+    >>> matrices.matrices[Symbol("a")].to_pairs()
+    (array([0]), array([1]))
+    >>> matrices.get_reachable_states().tolist()
+    [True, True, True]
+
+    """
+
+    def __init__(self,
+                 states: Sequence[State],
+                 matrices: Dict[Symbol, BooleanMatrix],
+                 start_states: np.ndarray,
+                 final_states: np.ndarray):
+        self._states = tuple(finite_automaton.finite_automaton.to_state(state)
+                             for state in states)
+        self._state_ids = {state: i for i, state in enumerate(self._states)}
+        self._matrices = {finite_automaton.finite_automaton.to_symbol(symbol):
+                          matrix
+                          for symbol, matrix in matrices.items()}
+        size = len(self._states)
+        for matrix in self._matrices.values():
+            if matrix.shape != (size, size):
+                raise ValueError("The matrices must have one row and one "
+                                 "column per state")
+        self._start_states = _to_mask(start_states, size)
+        self._final_states = _to_mask(final_states, size)
+
+    @classmethod
+    def from_automaton(cls, automaton: "FiniteAutomaton") \
+            -> "AutomatonMatrices":
+        """ Decomposes an automaton into matrices
+
+        Parameters
+        ----------
+        automaton : :class:`~pyformlang.finite_automaton.FiniteAutomaton`
+            The automaton
+
+        Returns
+        ----------
+        matrices : :class:`~pyformlang.finite_automaton.AutomatonMatrices`
+            The decomposition of the automaton
+        """
+        state_ids = {}
+        for state in automaton.states:
+            state_ids.setdefault(state, len(state_ids))
+        transitions: Dict[Symbol, list] = {symbol: []
+                                           for symbol in automaton.symbols}
+        for s_from, symbol, s_to in automaton:
+            state_ids.setdefault(s_from, len(state_ids))
+            state_ids.setdefault(s_to, len(state_ids))
+            transitions.setdefault(symbol, []).append(
+                (state_ids[s_from], state_ids[s_to]))
+        size = len(state_ids)
+        matrices = {}
+        for symbol, pairs in transitions.items():
+            pairs = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+            matrices[symbol] = BooleanMatrix.from_pairs(
+                pairs[:, 0], pairs[:, 1], (size, size))
+        return cls(list(state_ids), matrices,
+                   _get_mask(automaton.start_states, state_ids),
+                   _get_mask(automaton.final_states, state_ids))
+
+    @property
+    def states(self) -> tuple:
+        """ The states, indexed by their number """
+        return self._states
+
+    @property
+    def matrices(self) -> Dict[Symbol, BooleanMatrix]:
+        """ The adjacency matrix of each symbol, epsilon included """
+        return dict(self._matrices)
+
+    @property
+    def start_states(self) -> np.ndarray:
+        """ A boolean vector telling which states are start states """
+        return self._start_states.copy()
+
+    @property
+    def final_states(self) -> np.ndarray:
+        """ A boolean vector telling which states are final """
+        return self._final_states.copy()
+
+    def get_state_index(self, state: Hashable) -> int:
+        """ Gives the number of a state
+
+        Parameters
+        ----------
+        state : :class:`~pyformlang.finite_automaton.State`
+            The state, or its value
+
+        Returns
+        ----------
+        index : int
+            The row and column of the state in the matrices
+
+        Raises
+        ----------
+        KeyError
+            If the state is unknown
+        """
+        return self._state_ids[finite_automaton.finite_automaton.to_state(
+            state)]
+
+    def _get_matrix(self, symbol: Symbol) -> BooleanMatrix:
+        """ Gives the matrix of a symbol, empty if it has no transition """
+        matrix = self._matrices.get(symbol)
+        if matrix is None:
+            size = len(self._states)
+            matrix = BooleanMatrix(np.zeros(size + 1), [], (size, size))
+        return matrix
+
+    def get_epsilon_closure(self) -> BooleanMatrix:
+        """ Gives the epsilon closure of the states, as the reflexive and \
+        transitive closure of the epsilon matrix
+
+        Returns
+        ----------
+        closure : :class:`~pyformlang.finite_automaton.BooleanMatrix`
+            The matrix whose entry (i, j) is true when the state j is in \
+            the epsilon closure of the state i
+        """
+        return self._get_matrix(Epsilon()).transitive_closure()
+
+    def remove_epsilon_transitions(self) -> "AutomatonMatrices":
+        """ Gives an equivalent decomposition without epsilon transitions
+
+        Each symbol matrix A becomes A.C, where C is the epsilon closure. \
+        The start states are replaced by their closure.
+
+        Returns
+        ----------
+        matrices : :class:`~pyformlang.finite_automaton.AutomatonMatrices`
+            The decomposition without epsilon matrix
+        """
+        closure = self.get_epsilon_closure()
+        matrices = {symbol: matrix @ closure
+                    for symbol, matrix in self._matrices.items()
+                    if symbol != Epsilon()}
+        return AutomatonMatrices(self._states, matrices,
+                                 closure.get_successors(self._start_states),
+                                 self._final_states)
+
+    def intersect(self, other: "AutomatonMatrices") -> "AutomatonMatrices":
+        """ Intersects two decompositions with Kronecker products
+
+        The state i0 * n1 + i1 of the product, where n1 is the number of \
+        states of the other decomposition, is the pair of the states i0 \
+        and i1. The epsilon transitions are removed first.
+
+        Parameters
+        ----------
+        other : :class:`~pyformlang.finite_automaton.AutomatonMatrices`
+            The other decomposition
+
+        Returns
+        ----------
+        intersection : \
+        :class:`~pyformlang.finite_automaton.AutomatonMatrices`
+            The decomposition of the intersection, whose states are the \
+            pairs of states
+        """
+        left = self.remove_epsilon_transitions()
+        right = other.remove_epsilon_transitions()
+        states = [State((state0.value, state1.value))
+                  for state0 in left.states for state1 in right.states]
+        right_matrices = right.matrices
+        matrices = {
+            symbol: matrix.kron(right_matrices[symbol])
+            for symbol, matrix in left.matrices.items()
+            if symbol in right_matrices}
+        return AutomatonMatrices(
+            states, matrices,
+            np.outer(left.start_states, right.start_states).ravel(),
+            np.outer(left.final_states, right.final_states).ravel())
+
+    def get_reachable_states(self, sources: Iterable[Hashable] = None) \
+            -> np.ndarray:
+        """ Gives the states reachable from some states, by repeated \
+        products of a vector by the matrices
+
+        Parameters
+        ----------
+        sources : iterable of :class:`~pyformlang.finite_automaton.State`, \
+        optional
+            The states to start from, the start states by default
+
+        Returns
+        ----------
+        reachable : numpy.ndarray of bool
+            Which states are reachable, the sources included
+        """
+        if sources is None:
+            reachable = self._start_states.copy()
+        else:
+            reachable = np.zeros(len(self._states), dtype=bool)
+            for source in sources:
+                reachable[self.get_state_index(source)] = True
+        frontier = reachable
+        while frontier.any():
+            successors = np.zeros(len(self._states), dtype=bool)
+            for matrix in self._matrices.values():
+                successors |= matrix.get_successors(frontier)
+            frontier = successors & ~reachable
+            reachable |= frontier
+        return reachable
+
+    def to_automaton(self) -> "EpsilonNFA":
+        """ Rebuilds an automaton from the decomposition
+
+        Returns
+        ----------
+        enfa : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+            The automaton
+        """
+        enfa = finite_automaton.EpsilonNFA(
+            states=set(self._states),
+            input_symbols={symbol for symbol in self._matrices
+                           if symbol != Epsilon()},
+            start_state={state for state, is_start
+                         in zip(self._states, self._start_states)
+                         if is_start},
+            final_states={state for state, is_final
+                          in zip(self._states, self._final_states)
+                          if is_final})
+        for symbol, matrix in self._matrices.items():
+            rows, columns = matrix.to_pairs()
+            for i_from, i_to in zip(rows.tolist(), columns.tolist()):
+                enfa.add_transition(self._states[i_from], symbol,
+                                    self._states[i_to])
+        return enfa
+
+
+def _get_mask(states: Iterable[State], state_ids: Dict[State, int]) \
+        -> np.ndarray:
+    """ Gives the boolean vector of some states """
+    mask = np.zeros(len(state_ids), dtype=bool)
+    for state in states:
+        mask[state_ids[state]] = True
+    return mask
+
+
+def _to_mask(mask, size: int) -> np.ndarray:
+    """ Checks the size of a boolean vector """
+    mask = np.array(mask, dtype=bool).ravel()
+    if len(mask) != size:
+        raise ValueError("The vectors of states must have one element per "
+                         "state")
+    return mask
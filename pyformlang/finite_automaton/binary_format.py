@@ -0,0 +1,281 @@
+"""
+A compact binary file format for finite automata
+
+A file starts with a fixed-size header, followed by sections aligned on 8 \
+bytes. All the integers are little-endian.
+
+The header holds, in this order:
+
+* the magic bytes ``PYFLAUTO``
+* the version of the format, the kind of automaton (0 for a deterministic \
+automaton, 1 for a nondeterministic one, 2 for an epsilon NFA), the size in \
+bytes of the state indexes (4 or 8) and a reserved field, as 32-bit integers
+* the number of states, symbols and transitions, as 64-bit integers
+* the offset and the size in bytes of each section, as 64-bit integers
+
+The sections are:
+
+* the symbol table: the values of the symbols, as a JSON array
+* the state table: the values of the states, as a JSON array
+* the row pointers: for each state, the index of its first transition, \
+then the total number of transitions (64-bit integers)
+* the labels: the id of the symbol of each transition (32-bit integers). \
+The id of epsilon is the number of symbols.
+* the targets: the id of the target of each transition. The transitions \
+are sorted by source, then by label, so those of a state form a row which \
+can be searched by label.
+* the final states: a bitmap with one bit per state, least significant bit \
+first
+* the start states: their ids
+"""
+
+import json
+import os
+import struct
+import uuid
+from mmap import mmap as memory_map, ACCESS_READ
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+# pylint: disable=cyclic-import
+from pyformlang import finite_automaton
+
+from .epsilon import Epsilon
+
+FORMAT_MAGIC = b"PYFLAUTO"
+FORMAT_VERSION = 1
+
+KIND_DFA = 0
+KIND_NFA = 1
+KIND_ENFA = 2
+
+SECTIONS = ("symbols", "states", "row_pointers", "labels", "targets",
+            "finals", "starts")
+HEADER = struct.Struct("<8sIIIIQQQ" + "QQ" * len(SECTIONS))
+ALIGNMENT = 8
+
+# The values which can be stored in the symbol and state tables
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+class Header(NamedTuple):
+    """ The header of a file """
+    kind: int
+    index_size: int
+    n_states: int
+    n_symbols: int
+    n_transitions: int
+    # The offset and the size of each section, by name
+    sections: Dict[str, Tuple[int, int]]
+
+
+def save(automaton: "EpsilonNFA", path: str):
+    """ Writes an automaton into a binary file
+
+    Parameters
+    ----------
+    automaton : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+        The automaton to write. Its kind, deterministic, nondeterministic \
+        or with epsilon transitions, is kept.
+    path : str
+        The path of the file
+
+    Raises
+    ----------
+    ValueError
+        If the value of a state or of a symbol is not a string, a number \
+        or a boolean
+
+    Examples
+    --------
+
+    >>> dfa = DeterministicFiniteAutomaton()
+    >>> dfa.add_transitions([(0, "a", 1), (1, "b", 0)])
+    >>> dfa.add_start_state(0)
+    >>> dfa.add_final_state(1)
+    >>> from os.path import join
+    >>> from tempfile import mkdtemp
+    >>> path = join(mkdtemp(), "automaton.bin")
+    >>> save(dfa, path)
+    >>> load(path).accepts(["a", "b", "a"])
+    True
+
+    """
+    # pylint: disable=too-many-locals
+    edges = list(automaton)
+    # The states and the symbols are numbered in the order of the
+    # transitions, so that the file does not depend on the hash seed
+    state_ids = {}
+    symbol_ids = {}
+    for s_from, symbol, s_to in edges:
+        state_ids.setdefault(s_from, len(state_ids))
+        state_ids.setdefault(s_to, len(state_ids))
+        if symbol != Epsilon():
+            symbol_ids.setdefault(symbol, len(symbol_ids))
+    for state in automaton.states:
+        state_ids.setdefault(state, len(state_ids))
+    for symbol in automaton.symbols:
+        symbol_ids.setdefault(symbol, len(symbol_ids))
+    epsilon_id = len(symbol_ids)
+    index_type = np.dtype("<u4") if len(state_ids) < 2 ** 32 \
+        else np.dtype("<u8")
+    sources = np.fromiter((state_ids[s_from] for s_from, _, _ in edges),
+                          dtype=np.int64, count=len(edges))
+    labels = np.fromiter((symbol_ids.get(symbol, epsilon_id)
+                          for _, symbol, _ in edges),
+                         dtype="<u4", count=len(edges))
+    targets = np.fromiter((state_ids[s_to] for _, _, s_to in edges),
+                          dtype=index_type, count=len(edges))
+    order = np.lexsort((targets, labels, sources))
+    row_pointers = np.zeros(len(state_ids) + 1, dtype="<u8")
+    np.cumsum(np.bincount(sources, minlength=len(state_ids)),
+              out=row_pointers[1:])
+    finals = np.zeros(len(state_ids), dtype=bool)
+    for state in automaton.final_states:
+        finals[state_ids[state]] = True
+    starts = np.array([state_ids[state] for state in automaton.start_states],
+                      dtype=index_type)
+    sections = {
+        "symbols": _to_json([symbol.value for symbol in symbol_ids]),
+        "states": _to_json([state.value for state in state_ids]),
+        "row_pointers": row_pointers.tobytes(),
+        "labels": labels[order].tobytes(),
+        "targets": targets[order].tobytes(),
+        "finals": np.packbits(finals, bitorder="little").tobytes(),
+        "starts": starts.tobytes()}
+    _write(path, _get_kind(automaton), index_type.itemsize,
+           (len(state_ids), len(symbol_ids), len(edges)), sections)
+
+
+def load(path: str, mmap: bool = True) -> "CompiledNFA":
+    """ Reads an automaton written by :func:`save`
+
+    Parameters
+    ----------
+    path : str
+        The path of the file
+    mmap : bool, optional
+        Whether to map the file into memory (default), instead of reading \
+        it. A mapped file is not parsed: the automaton runs directly on \
+        its pages, which the processes mapping the same file share.
+
+    Returns
+    ----------
+    compiled : :class:`~pyformlang.finite_automaton.CompiledNFA`
+        The automaton, ready to match words
+
+    Raises
+    ----------
+    ValueError
+        If the file is not an automaton, or has an unknown version
+
+    Examples
+    --------
+
+    >>> dfa = DeterministicFiniteAutomaton()
+    >>> dfa.add_transitions([(0, "a", 1), (1, "b", 0)])
+    >>> dfa.add_start_state(0)
+    >>> dfa.add_final_state(1)
+    >>> from os.path import join
+    >>> from tempfile import mkdtemp
+    >>> path = join(mkdtemp(), "automaton.bin")
+    >>> dfa.save(path)
+    >>> compiled = load(path, mmap=True)
+    >>> compiled.accepts(["a"])
+    True
+    >>> compiled.to_automaton().is_equivalent_to(dfa)
+    True
+
+    """
+    with open(path, "rb") as file:
+        if mmap:
+            buffer = memory_map(file.fileno(), 0, access=ACCESS_READ)
+        else:
+            buffer = file.read()
+    return finite_automaton.CompiledNFA(buffer)
+
+
+def read_header(buffer) -> Header:
+    """ Reads and checks the header of a file
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        The content of the file
+
+    Returns
+    ----------
+    header : :class:`~pyformlang.finite_automaton.binary_format.Header`
+        The header
+
+    Raises
+    ----------
+    ValueError
+        If the buffer is not an automaton, or has an unknown version
+    """
+    if len(buffer) < HEADER.size:
+        raise ValueError("The file is too short to be an automaton")
+    fields = HEADER.unpack_from(buffer)
+    if fields[0] != FORMAT_MAGIC:
+        raise ValueError("The file is not an automaton")
+    if fields[1] != FORMAT_VERSION:
+        raise ValueError("Unsupported version of the format: " +
+                         str(fields[1]))
+    positions = fields[8:]
+    sections = {name: (positions[2 * i], positions[2 * i + 1])
+                for i, name in enumerate(SECTIONS)}
+    return Header(fields[2], fields[3], fields[5], fields[6], fields[7],
+                  sections)
+
+
+def _get_kind(automaton) -> int:
+    """ Gives the kind of an automaton """
+    if isinstance(automaton, finite_automaton.DeterministicFiniteAutomaton):
+        return KIND_DFA
+    if isinstance(automaton,
+                  finite_automaton.NondeterministicFiniteAutomaton):
+        return KIND_NFA
+    return KIND_ENFA
+
+
+def _to_json(values: List[Any]) -> bytes:
+    """ Encodes the values of a table """
+    for value in values:
+        if not isinstance(value, _SCALAR_TYPES):
+            raise ValueError("Cannot save the value " + repr(value) +
+                             ", only strings, numbers and booleans can "
+                             "be saved")
+    return json.dumps(values).encode("utf-8")
+
+
+def _write(path, kind, index_size, counts, sections):
+    """ Writes the header and the sections
+
+    The file is written next to the path, then moved over it, so that the \
+    automata loaded from a previous version of the file keep their pages.
+    """
+    positions = []
+    offset = HEADER.size
+    for name in SECTIONS:
+        offset += -offset % ALIGNMENT
+        positions += [offset, len(sections[name])]
+        offset += len(sections[name])
+    temporary_path = os.path.join(
+        os.path.dirname(os.path.abspath(path)),
+        "." + os.path.basename(path) + "." + uuid.uuid4().hex + ".tmp")
+    try:
+        with open(temporary_path, "xb") as file:
+            file.write(HEADER.pack(FORMAT_MAGIC, FORMAT_VERSION, kind,
+                                   index_size, 0, *counts, *positions))
+            offset = HEADER.size
+            for name in SECTIONS:
+                file.write(bytes(-offset % ALIGNMENT))
+                offset += -offset % ALIGNMENT
+                file.write(sections[name])
+                offset += len(sections[name])
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
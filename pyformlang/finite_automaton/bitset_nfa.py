@@ -0,0 +1,148 @@
+""" A representation of epsilon NFAs where sets of states are bitsets
+For internal usage
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from .epsilon import Epsilon
+from .state import State
+from .symbol import Symbol
+
+
+class BitsetNFA:  # pylint: disable=too-many-instance-attributes
+    """ A representation of an epsilon NFA where sets of states are bitsets
+
+    The states are numbered densely and a set of states is a Python integer \
+    whose i-th bit tells whether the i-th state is in the set. For each \
+    symbol, the successors of each state are precomputed, epsilon closure \
+    included, so that moving a set of states by a symbol is a union of \
+    bitsets.
+
+    For internal usage.
+
+    Parameters
+    ----------
+    enfa : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+        The automaton to represent
+    eclose : bool, optional
+        Whether to apply the epsilon closure after each move
+    """
+
+    def __init__(self, enfa: "EpsilonNFA", eclose: bool = True):
+        edges = list(enfa)
+        self._state_ids = {}
+        for state in enfa.states:
+            self._state_ids.setdefault(state, len(self._state_ids))
+        for s_from, _, s_to in edges:
+            self._state_ids.setdefault(s_from, len(self._state_ids))
+            self._state_ids.setdefault(s_to, len(self._state_ids))
+        self._states = list(self._state_ids)
+        self._symbols = list(enfa.symbols)
+        self._closures = self._get_closures(enfa, eclose)
+        # For each symbol, the successors of the states having some
+        self._successors = {symbol: {} for symbol in self._symbols}
+        for s_from, symbol, s_to in edges:
+            if symbol == Epsilon():
+                continue
+            successors = self._successors.setdefault(symbol, {})
+            i_from = self._state_ids[s_from]
+            successors[i_from] = successors.get(i_from, 0) \
+                | self._closures[self._state_ids[s_to]]
+        # The states having at least one successor for each symbol
+        self._sources = {symbol: self.from_ids(successors)
+                         for symbol, successors in self._successors.items()}
+        self._finals = self.from_states(enfa.final_states)
+        self._start = self.close(self.from_states(enfa.start_states))
+        self._useful = self.from_states(enfa.get_useful_states())
+
+    def _get_closures(self, enfa, eclose) -> List[int]:
+        """ Gives the epsilon closure of each state as a bitset """
+        if not eclose:
+            return [1 << i for i in range(len(self._states))]
+        return [self.from_states(enfa.eclose(state))
+                for state in self._states]
+
+    @property
+    def states(self) -> List[State]:
+        """ The states, indexed by their id """
+        return self._states
+
+    @property
+    def symbols(self) -> List[Symbol]:
+        """ The symbols """
+        return self._symbols
+
+    @property
+    def start(self) -> int:
+        """ The closure of the start states """
+        return self._start
+
+    @property
+    def finals(self) -> int:
+        """ The final states """
+        return self._finals
+
+    @property
+    def useful(self) -> int:
+        """ The states reachable from a start state and from which a final \
+        state can be reached """
+        return self._useful
+
+    def from_ids(self, state_ids: Iterable[int]) -> int:
+        """ Gives the bitset of some state ids """
+        res = 0
+        for i in state_ids:
+            res |= 1 << i
+        return res
+
+    def from_states(self, states: Iterable[State]) -> int:
+        """ Gives the bitset of some states, ignoring the unknown ones """
+        return self.from_ids(self._state_ids[state] for state in states
+                             if state in self._state_ids)
+
+    def to_states(self, current: int) -> List[State]:
+        """ Gives the states in a bitset """
+        return [self._states[i] for i in iterate_bits(current)]
+
+    def close(self, current: int) -> int:
+        """ Gives the epsilon closure of a bitset """
+        res = current
+        for i in iterate_bits(current):
+            res |= self._closures[i]
+        return res
+
+    def get_next(self, current: int, symbol: Symbol) -> int:
+        """ Gives the states reached from a bitset by reading a symbol """
+        successors = self._successors.get(symbol)
+        if successors is None:
+            return 0
+        return move(current, self._sources[symbol], successors)
+
+    def get_tables(self) -> List[Tuple[int, Dict[int, int]]]:
+        """ Gives, for each symbol in the order of symbols, the states \
+        having successors and the successors of each of them, as needed by \
+        :func:`move` """
+        return [(self._sources[symbol], self._successors[symbol])
+                for symbol in self._symbols]
+
+    def is_final(self, current: int) -> bool:
+        """ Whether a bitset contains a final state """
+        return (current & self._finals) != 0
+
+
+def move(current: int, sources: int, successors: Dict[int, int]) -> int:
+    """ Gives the states reached from a bitset by reading a symbol, given \
+    the states having successors for it and their successors """
+    res = 0
+    for i in iterate_bits(current & sources):
+        res |= successors[i]
+    return res
+
+
+def iterate_bits(current: int) -> Iterable[int]:
+    """ Gives the positions of the bits set in an integer, in increasing \
+    order """
+    while current:
+        lowest = current & -current
+        yield lowest.bit_length() - 1
+        current ^= lowest
@@ -0,0 +1,274 @@
+"""
+Sparse boolean matrices, stored in compressed sparse row format
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+class BooleanMatrix:
+    """ A sparse boolean matrix, in compressed sparse row (CSR) format
+
+    The columns of the true entries of row i are \
+    indices[indptr[i]:indptr[i + 1]], sorted and without duplicates. These \
+    arrays follow the layout of the CSR matrices of other libraries, like \
+    scipy.sparse.csr_matrix((np.ones(len(indices), dtype=bool), indices, \
+    indptr), shape), and can be given to them without conversion.
+
+    Parameters
+    ----------
+    indptr : numpy.ndarray
+        The offsets of the rows in indices, with one more element than \
+        the number of rows
+    indices : numpy.ndarray
+        The columns of the true entries, row by row
+    shape : (int, int)
+        The number of rows and of columns
+
+    Examples
+    --------
+
+    >>> matrix = BooleanMatrix.from_pairs([0, 1], [1, 2], (3, 3))
+    >>> (matrix @ matrix).to_pairs()
+    (array([0]), array([2]))
+
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray,
+                 shape: Tuple[int, int]):
+        self._indptr = np.asarray(indptr, dtype=np.int64)
+        self._indices = np.asarray(indices, dtype=np.int64)
+        self._shape = (int(shape[0]), int(shape[1]))
+        self._indptr.flags.writeable = False
+        self._indices.flags.writeable = False
+
+    @classmethod
+    def from_pairs(cls, rows, columns, shape: Tuple[int, int]) \
+            -> "BooleanMatrix":
+        """ Builds a matrix from the coordinates of its true entries
+
+        Parameters
+        ----------
+        rows : array-like of int
+            The rows of the true entries
+        columns : array-like of int
+            The columns of the true entries, in the same order. The \
+            duplicated entries are merged.
+        shape : (int, int)
+            The number of rows and of columns
+
+        Returns
+        ----------
+        matrix : :class:`~pyformlang.finite_automaton.BooleanMatrix`
+            The matrix
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        return cls._from_keys(np.sort(rows * shape[1] + columns), shape)
+
+    @classmethod
+    def _from_keys(cls, keys: np.ndarray, shape: Tuple[int, int]) \
+            -> "BooleanMatrix":
+        """ Builds a matrix from the sorted keys row * n_columns + column \
+        of its true entries """
+        # Dropping the repeated keys after sorting is much faster than
+        # np.unique, which hashes the keys in recent versions of numpy
+        is_first = np.ones(len(keys), dtype=bool)
+        np.not_equal(keys[1:], keys[:-1], out=is_first[1:])
+        keys = keys[is_first]
+        rows, columns = np.divmod(keys, max(shape[1], 1))
+        indptr = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(indptr, columns, shape)
+
+    @classmethod
+    def from_dense(cls, dense) -> "BooleanMatrix":
+        """ Builds a matrix from a dense array
+
+        Parameters
+        ----------
+        dense : array-like of bool
+            A two-dimensional array
+
+        Returns
+        ----------
+        matrix : :class:`~pyformlang.finite_automaton.BooleanMatrix`
+            The matrix
+        """
+        dense = np.asarray(dense, dtype=bool)
+        rows, columns = np.nonzero(dense)
+        return cls.from_pairs(rows, columns, dense.shape)
+
+    @classmethod
+    def identity(cls, size: int) -> "BooleanMatrix":
+        """ Gives the identity matrix of a size """
+        return cls(np.arange(size + 1), np.arange(size), (size, size))
+
+    @property
+    def indptr(self) -> np.ndarray:
+        """ The offsets of the rows in indices, as a read-only array """
+        return self._indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        """ The columns of the true entries, as a read-only array """
+        return self._indices
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """ The number of rows and of columns """
+        return self._shape
+
+    @property
+    def nnz(self) -> int:
+        """ The number of true entries """
+        return len(self._indices)
+
+    def to_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """ Gives the rows and the columns of the true entries """
+        rows = np.repeat(np.arange(self._shape[0]), np.diff(self._indptr))
+        return rows, self._indices.copy()
+
+    def to_dense(self) -> np.ndarray:
+        """ Gives the matrix as a dense array of booleans """
+        dense = np.zeros(self._shape, dtype=bool)
+        dense[self.to_pairs()] = True
+        return dense
+
+    @property
+    def T(self) -> "BooleanMatrix":  # pylint: disable=invalid-name
+        """ The transposed matrix """
+        rows, columns = self.to_pairs()
+        return BooleanMatrix.from_pairs(columns, rows,
+                                        (self._shape[1], self._shape[0]))
+
+    def _get_keys(self) -> np.ndarray:
+        """ Gives the sorted keys row * n_columns + column of the true \
+        entries """
+        rows, columns = self.to_pairs()
+        return rows * self._shape[1] + columns
+
+    def __or__(self, other: "BooleanMatrix") -> "BooleanMatrix":
+        """ The union of the true entries of two matrices """
+        if not other.nnz:
+            return self
+        if not self.nnz:
+            return other
+        # The keys are two sorted runs, which a stable sort merges in
+        # linear time
+        keys = np.concatenate([self._get_keys(), other._get_keys()])
+        return BooleanMatrix._from_keys(np.sort(keys, kind="stable"),
+                                        self._shape)
+
+    def __sub__(self, other: "BooleanMatrix") -> "BooleanMatrix":
+        """ The true entries of a matrix which are false in another one """
+        if not self.nnz or not other.nnz:
+            return self
+        keys = self._get_keys()
+        other_keys = other._get_keys()
+        positions = np.searchsorted(other_keys, keys)
+        is_in_other = np.zeros(len(keys), dtype=bool)
+        is_valid = positions < len(other_keys)
+        is_in_other[is_valid] = \
+            other_keys[positions[is_valid]] == keys[is_valid]
+        return BooleanMatrix._from_keys(keys[~is_in_other], self._shape)
+
+    def __matmul__(self, other: "BooleanMatrix") -> "BooleanMatrix":
+        """ The boolean product of two matrices """
+        if not self.nnz or not other.nnz:
+            return BooleanMatrix(np.zeros(self._shape[0] + 1), [],
+                                 (self._shape[0], other.shape[1]))
+        rows, middles = self.to_pairs()
+        lengths = other.indptr[middles + 1] - other.indptr[middles]
+        rows = np.repeat(rows, lengths)
+        # The position in other.indices of each product term
+        positions = np.repeat(other.indptr[middles] - np.cumsum(lengths)
+                              + lengths, lengths) + np.arange(lengths.sum())
+        return BooleanMatrix.from_pairs(rows, other.indices[positions],
+                                        (self._shape[0], other.shape[1]))
+
+    def __eq__(self, other):
+        if not isinstance(other, BooleanMatrix):
+            return False
+        return self._shape == other.shape \
+            and np.array_equal(self._indptr, other.indptr) \
+            and np.array_equal(self._indices, other.indices)
+
+    def __hash__(self):
+        return hash((self._shape, self._indices.tobytes()))
+
+    def __repr__(self):
+        return "BooleanMatrix(shape=" + str(self._shape) + ", nnz=" + \
+            str(self.nnz) + ")"
+
+    def kron(self, other: "BooleanMatrix") -> "BooleanMatrix":
+        """ The Kronecker product of two matrices
+
+        The entry (i0 * n1 + i1, j0 * m1 + j1) is true when the entries \
+        (i0, j0) of the current matrix and (i1, j1) of the other one, of \
+        shape (n1, m1), are both true.
+
+        Parameters
+        ----------
+        other : :class:`~pyformlang.finite_automaton.BooleanMatrix`
+            The other matrix
+
+        Returns
+        ----------
+        product : :class:`~pyformlang.finite_automaton.BooleanMatrix`
+            The Kronecker product
+        """
+        rows0, columns0 = self.to_pairs()
+        rows1, columns1 = other.to_pairs()
+        n_rows, n_columns = other.shape
+        rows = (rows0[:, np.newaxis] * n_rows + rows1).ravel()
+        columns = (columns0[:, np.newaxis] * n_columns + columns1).ravel()
+        return BooleanMatrix.from_pairs(
+            rows, columns,
+            (self._shape[0] * n_rows, self._shape[1] * n_columns))
+
+    def get_successors(self, mask: np.ndarray) -> np.ndarray:
+        """ Gives the columns reached from some rows, as the boolean \
+        product of a vector by the matrix
+
+        Parameters
+        ----------
+        mask : numpy.ndarray of bool
+            The rows
+
+        Returns
+        ----------
+        successors : numpy.ndarray of bool
+            The columns having a true entry in one of the rows
+        """
+        rows = np.flatnonzero(mask)
+        lengths = self._indptr[rows + 1] - self._indptr[rows]
+        positions = np.repeat(self._indptr[rows] - np.cumsum(lengths)
+                              + lengths, lengths) + np.arange(lengths.sum())
+        successors = np.zeros(self._shape[1], dtype=bool)
+        successors[self._indices[positions]] = True
+        return successors
+
+    def transitive_closure(self, reflexive: bool = True) -> "BooleanMatrix":
+        """ The transitive closure of a square matrix, by repeated squaring
+
+        Parameters
+        ----------
+        reflexive : bool, optional
+            Whether to add the identity, to get the reflexive and \
+            transitive closure (default)
+
+        Returns
+        ----------
+        closure : :class:`~pyformlang.finite_automaton.BooleanMatrix`
+            The closure
+        """
+        closure = self
+        if reflexive:
+            closure = closure | BooleanMatrix.identity(self._shape[0])
+        while True:
+            squared = closure | closure @ closure
+            if squared.nnz == closure.nnz:
+                return closure
+            closure = squared
@@ -0,0 +1,261 @@
+"""
+A compiled, integer-indexed representation of a deterministic finite automaton
+"""
+
+from itertools import chain, repeat
+from typing import Iterable, Any, List
+
+import numpy as np
+
+from .matcher import DFAMatcher
+from .symbol import Symbol
+
+
+class CompiledDFA:  # pylint: disable=too-many-instance-attributes
+    """ A frozen version of a deterministic finite automaton, optimized for \
+    membership queries
+
+    The states and the symbols are numbered densely and the transitions are \
+    stored in a dense table. An additional column is reserved for the symbols \
+    which are not in the alphabet of the automaton, and an additional row for \
+    the dead state. The states from which no final state can be reached are \
+    all merged into the dead state, so that a run can stop as soon as it \
+    enters it. Internally, a last column maps every state to itself and is \
+    used to pad words in batched queries.
+
+    Once built, a compiled DFA cannot be modified and does not depend on the \
+    automaton it comes from anymore.
+
+    Parameters
+    ----------
+    dfa : :class:`~pyformlang.finite_automaton.DeterministicFiniteAutomaton`
+        The automaton to compile
+
+    Examples
+    --------
+
+    >>> dfa = DeterministicFiniteAutomaton()
+    >>> dfa.add_transitions([(0, "abc", 1), (0, "d", 1)])
+    >>> dfa.add_start_state(0)
+    >>> dfa.add_final_state(1)
+    >>> compiled = dfa.compile()
+    >>> compiled.accepts(["abc"])
+    True
+
+    """
+
+    def __init__(self, dfa: "DeterministicFiniteAutomaton"):
+        edges = list(dfa)
+        state_ids = {}
+        for state in dfa.states:
+            state_ids.setdefault(state, len(state_ids))
+        for s_from, _, s_to in edges:
+            state_ids.setdefault(s_from, len(state_ids))
+            state_ids.setdefault(s_to, len(state_ids))
+        states = list(state_ids)
+        symbols = list(dfa.symbols.union(symbol for _, symbol, _ in edges))
+        self._states = tuple(states)
+        self._symbol_ids = {symbol.value: i
+                            for i, symbol in enumerate(symbols)}
+        self._dead_state = len(states)
+        self._unknown_symbol = len(symbols)
+        useful = dfa.get_useful_states()
+        self._padding_symbol = len(symbols) + 1
+        table = np.full((len(states) + 1, len(symbols) + 2),
+                        self._dead_state,
+                        dtype=_get_index_type(len(states) + 1))
+        table[:, self._padding_symbol] = np.arange(len(states) + 1)
+        for s_from, symbol, s_to in edges:
+            if s_to in useful:
+                table[state_ids[s_from], self._symbol_ids[symbol.value]] = \
+                    state_ids[s_to]
+        finals = np.zeros(len(states) + 1, dtype=bool)
+        for state in dfa.final_states:
+            finals[state_ids[state]] = True
+        self._start = self._dead_state
+        for state in dfa.start_states:
+            if state in useful:
+                self._start = state_ids[state]
+        table.flags.writeable = False
+        finals.flags.writeable = False
+        self._table = table
+        self._finals = finals
+        # Plain lists are faster than numpy arrays for scalar accesses
+        self._rows = table.tolist()
+        self._finals_list = finals.tolist()
+
+    @property
+    def transition_table(self) -> np.ndarray:
+        """ The transition table, a read-only array indexed by state id and \
+        symbol id """
+        return self._table[:, :self._padding_symbol]
+
+    @property
+    def final_states_mask(self) -> np.ndarray:
+        """ A read-only boolean array telling which state ids are final """
+        return self._finals
+
+    @property
+    def start_state_id(self) -> int:
+        """ The id of the start state """
+        return self._start
+
+    @property
+    def dead_state_id(self) -> int:
+        """ The id of the dead state """
+        return self._dead_state
+
+    @property
+    def states(self) -> tuple:
+        """ The original states, indexed by their id """
+        return self._states
+
+    def get_symbol_id(self, symbol: Any) -> int:
+        """ Gives the id of a symbol
+
+        Parameters
+        ----------
+        symbol : any
+            A symbol or the value of a symbol
+
+        Returns
+        ----------
+        symbol_id : int
+            The column of the symbol in the transition table. Unknown \
+            symbols share the last column.
+        """
+        if isinstance(symbol, Symbol):
+            symbol = symbol.value
+        return self._symbol_ids.get(symbol, self._unknown_symbol)
+
+    def accepts(self, word: Iterable[Any]) -> bool:
+        """ Checks whether the compiled automaton accepts a given word
+
+        Parameters
+        ----------
+        word : iterable of :class:`~pyformlang.finite_automaton.Symbol`
+            A sequence of input symbols, or of their values
+
+        Returns
+        ----------
+        is_accepted : bool
+            Whether the word is accepted or not
+
+        Examples
+        --------
+
+        >>> dfa = DeterministicFiniteAutomaton()
+        >>> dfa.add_transitions([(0, "abc", 1), (0, "d", 1)])
+        >>> dfa.add_start_state(0)
+        >>> dfa.add_final_state(1)
+        >>> compiled = dfa.compile()
+        >>> compiled.accepts(["d"])
+        True
+
+        """
+        rows = self._rows
+        get_id = self._symbol_ids.get
+        unknown = self._unknown_symbol
+        dead = self._dead_state
+        current_state = self._start
+        if current_state == dead:
+            return False
+        for symbol in word:
+            # Symbols hash and compare like their values
+            current_state = rows[current_state][get_id(symbol, unknown)]
+            if current_state == dead:
+                return False
+        return self._finals_list[current_state]
+
+    def matcher(self) -> DFAMatcher:
+        """ Gives an incremental matcher running on the compiled automaton
+
+        Returns
+        ----------
+        matcher : :class:`~pyformlang.finite_automaton.DFAMatcher`
+            A new matcher, at the beginning of the input
+
+        Examples
+        --------
+
+        >>> dfa = DeterministicFiniteAutomaton()
+        >>> dfa.add_transitions([(0, "a", 1), (1, "b", 0)])
+        >>> dfa.add_start_state(0)
+        >>> dfa.add_final_state(1)
+        >>> matcher = dfa.compile().matcher()
+        >>> matcher.feed("aba")
+        True
+        >>> matcher.is_accepting()
+        True
+
+        """
+        return DFAMatcher(self)
+
+    def accepts_many(self, words: Iterable[Iterable[Any]],
+                     batch_size: int = 4096) -> np.ndarray:
+        """ Checks which words of a collection are accepted
+
+        The words are encoded into a padded array of symbol ids and all the \
+        words of a batch advance together, one symbol at a time.
+
+        Parameters
+        ----------
+        words : iterable of iterables of \
+        :class:`~pyformlang.finite_automaton.Symbol`
+            The words to check
+        batch_size : int, optional
+            The number of words processed together
+
+        Returns
+        ----------
+        are_accepted : numpy.ndarray of bool
+            For each word, whether it is accepted or not
+
+        Examples
+        --------
+
+        >>> dfa = DeterministicFiniteAutomaton()
+        >>> dfa.add_transitions([(0, "abc", 1), (0, "d", 1)])
+        >>> dfa.add_start_state(0)
+        >>> dfa.add_final_state(1)
+        >>> compiled = dfa.compile()
+        >>> compiled.accepts_many([["abc"], ["d", "d"], ["d"]])
+        array([ True, False,  True])
+
+        """
+        words = [list(word) for word in words]
+        res = np.zeros(len(words), dtype=bool)
+        for begin in range(0, len(words), batch_size):
+            batch = words[begin:begin + batch_size]
+            res[begin:begin + len(batch)] = self._accepts_batch(batch)
+        return res
+
+    def _accepts_batch(self, words: List[List[Any]]) -> np.ndarray:
+        """ Runs a batch of words on the transition table """
+        lengths = np.fromiter(map(len, words),
+                              dtype=np.intp, count=len(words))
+        max_length = int(lengths.max(initial=0))
+        # The mapping is done in C by map, without a Python loop per symbol
+        flat = chain.from_iterable(words)
+        encoded = np.fromiter(map(self._symbol_ids.get, flat,
+                                  repeat(self._unknown_symbol)),
+                              dtype=np.intp,
+                              count=int(lengths.sum()))
+        padded = np.full((len(words), max_length),
+                         self._padding_symbol,
+                         dtype=np.intp)
+        padded[np.arange(max_length) < lengths[:, np.newaxis]] = encoded
+        current_states = np.full(len(words), self._start,
+                                 dtype=self._table.dtype)
+        for position in range(max_length):
+            current_states = self._table[current_states, padded[:, position]]
+            if (current_states == self._dead_state).all():
+                break
+        return self._finals[current_states]
+
+
+def _get_index_type(size: int):
+    """ Gives the smallest integer type able to index a given size """
+    if size < np.iinfo(np.int32).max:
+        return np.int32
+    return np.int64
@@ -0,0 +1,408 @@
+"""
+An automaton running directly on the content of a binary file
+"""
+
+import json
+import sys
+from bisect import bisect_left, bisect_right
+from typing import Any, FrozenSet, Iterable, List
+
+import numpy as np
+
+# pylint: disable=cyclic-import
+from pyformlang import finite_automaton
+
+from .binary_format import read_header, KIND_DFA, KIND_NFA, KIND_ENFA
+from .epsilon import Epsilon
+from .matcher import Matcher
+from .symbol import Symbol
+
+
+class CompiledNFA:  # pylint: disable=too-many-instance-attributes
+    """ A frozen automaton, stored in the binary format of \
+    :mod:`~pyformlang.finite_automaton.binary_format`
+
+    The transitions are read directly from the buffer given, without any \
+    parsing step: the transitions of a state form a row sorted by symbol, \
+    which is searched by bisection. Only the symbol table is decoded when \
+    the automaton is created, the state table being decoded on demand.
+
+    This class should not be created directly, use \
+    :func:`~pyformlang.finite_automaton.load` instead. A memory-mapped file \
+    stays mapped until :meth:`close` is called, or until the end of a \
+    ``with`` block on the automaton.
+
+    Parameters
+    ----------
+    buffer : bytes-like
+        The content of a file, possibly memory-mapped
+
+    Raises
+    ----------
+    ValueError
+        If the buffer is not an automaton, or has an unknown version
+
+    Examples
+    --------
+
+    >>> enfa = EpsilonNFA()
+    >>> enfa.add_transitions([(0, "a", 1), (1, "epsilon", 0)])
+    >>> enfa.add_start_state(0)
+    >>> enfa.add_final_state(1)
+    >>> from os.path import join
+    >>> from tempfile import mkdtemp
+    >>> path = join(mkdtemp(), "automaton.bin")
+    >>> enfa.save(path)
+    >>> with load(path) as compiled:
+    ...     compiled.accepts(["a", "a"])
+    True
+
+    """
+
+    def __init__(self, buffer):
+        header = read_header(buffer)
+        self._buffer = buffer
+        self._memory = memoryview(buffer)
+        self._header = header
+        self._kind = header.kind
+        self._symbol_values = json.loads(bytes(self._get_bytes("symbols")))
+        self._symbol_ids = {value: i
+                            for i, value in enumerate(self._symbol_values)}
+        self._epsilon = header.n_symbols
+        self._unknown_symbol = header.n_symbols + 1
+        self._states = None
+        index_code = "I" if header.index_size == 4 else "Q"
+        self._row_pointers = self._get_array("row_pointers", "Q")
+        self._labels = self._get_array("labels", "I")
+        self._targets = self._get_array("targets", index_code)
+        self._finals = self._get_bytes("finals")
+        self._starts = self._get_array("starts", index_code)
+
+    def _get_bytes(self, section: str) -> memoryview:
+        """ Gives the bytes of a section, without copying them """
+        offset, size = self._header.sections[section]
+        return self._memory[offset:offset + size]
+
+    def _get_array(self, section: str, code: str):
+        """ Gives the integers of a section, without copying them if the \
+        machine is little-endian """
+        data = self._get_bytes(section)
+        if sys.byteorder == "little":
+            return data.cast(code)
+        dtype = np.dtype("<u4") if code == "I" else np.dtype("<u8")
+        return np.frombuffer(data, dtype=dtype).astype(dtype.newbyteorder(
+            "=")).tolist()
+
+    def _get_view(self, section: str, dtype: str) -> np.ndarray:
+        """ Gives a read-only numpy view of a section """
+        view = np.frombuffer(self._get_bytes(section), dtype=dtype)
+        view.flags.writeable = False
+        return view
+
+    def close(self):
+        """ Releases the buffer, unmapping the file if it was mapped
+
+        The automaton cannot be used afterwards.
+
+        Raises
+        ----------
+        BufferError
+            If an array given by the automaton, like \
+            :attr:`transition_targets`, is still referenced
+        """
+        for view in [self._row_pointers, self._labels, self._targets,
+                     self._finals, self._starts, self._memory]:
+            if isinstance(view, memoryview):
+                view.release()
+        if hasattr(self._buffer, "close"):
+            self._buffer.close()
+
+    def __enter__(self) -> "CompiledNFA":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def row_pointers(self) -> np.ndarray:
+        """ For each state id, the index of its first transition, then the \
+        number of transitions, as a read-only array """
+        return self._get_view("row_pointers", "<u8")
+
+    @property
+    def transition_labels(self) -> np.ndarray:
+        """ The symbol id of each transition, as a read-only array. The id \
+        of epsilon is the number of symbols. """
+        return self._get_view("labels", "<u4")
+
+    @property
+    def transition_targets(self) -> np.ndarray:
+        """ The target state id of each transition, as a read-only array """
+        return self._get_view("targets",
+                              "<u4" if self._header.index_size == 4
+                              else "<u8")
+
+    @property
+    def states(self) -> tuple:
+        """ The values of the states, indexed by their id """
+        if self._states is None:
+            self._states = tuple(json.loads(bytes(self._get_bytes("states"))))
+        return self._states
+
+    @property
+    def symbols(self) -> tuple:
+        """ The values of the symbols, indexed by their id """
+        return tuple(self._symbol_values)
+
+    def is_deterministic(self) -> bool:
+        """ Whether the automaton was saved as a deterministic one """
+        return self._kind == KIND_DFA
+
+    def get_symbol_id(self, symbol: Any) -> int:
+        """ Gives the id of a symbol
+
+        Parameters
+        ----------
+        symbol : any
+            A symbol or the value of a symbol
+
+        Returns
+        ----------
+        symbol_id : int
+            The label of the symbol in the transitions. All the unknown \
+            symbols share an id which labels no transition.
+        """
+        if isinstance(symbol, Symbol):
+            symbol = symbol.value
+        return self._symbol_ids.get(symbol, self._unknown_symbol)
+
+    def get_next_states(self, state_id: int, symbol_id: int) -> List[int]:
+        """ Gives the targets of the transitions from a state by a symbol
+
+        Parameters
+        ----------
+        state_id : int
+            The id of the source state
+        symbol_id : int
+            The id of the symbol, as given by get_symbol_id
+
+        Returns
+        ----------
+        next_states : list of int
+            The ids of the target states
+        """
+        begin = self._row_pointers[state_id]
+        end = self._row_pointers[state_id + 1]
+        begin = bisect_left(self._labels, symbol_id, begin, end)
+        end = bisect_right(self._labels, symbol_id, begin, end)
+        return list(self._targets[begin:end])
+
+    def is_final(self, state_id: int) -> bool:
+        """ Whether a state is final
+
+        Parameters
+        ----------
+        state_id : int
+            The id of the state
+
+        Returns
+        ----------
+        is_final : bool
+            Whether the state is final
+        """
+        return bool(self._finals[state_id >> 3] >> (state_id & 7) & 1)
+
+    def _get_start(self) -> FrozenSet[int]:
+        """ The ids of the start states, closed by epsilon """
+        return self._close(self._starts)
+
+    def _close(self, state_ids: Iterable[int]) -> FrozenSet[int]:
+        """ Closes a set of state ids by the epsilon transitions """
+        if self._kind != KIND_ENFA:
+            return frozenset(state_ids)
+        closure = set(state_ids)
+        to_process = list(closure)
+        while to_process:
+            for state_id in self.get_next_states(to_process.pop(),
+                                                 self._epsilon):
+                if state_id not in closure:
+                    closure.add(state_id)
+                    to_process.append(state_id)
+        return frozenset(closure)
+
+    def _get_next(self, current: FrozenSet[int], symbol: Any) \
+            -> FrozenSet[int]:
+        """ The ids of the states reached from some states by a symbol """
+        symbol_id = self.get_symbol_id(symbol)
+        if symbol_id == self._unknown_symbol:
+            return frozenset()
+        return self._close(state_id
+                           for current_id in current
+                           for state_id in self.get_next_states(current_id,
+                                                                symbol_id))
+
+    def accepts(self, word: Iterable[Any]) -> bool:
+        """ Checks whether the automaton accepts a given word
+
+        Parameters
+        ----------
+        word : iterable of :class:`~pyformlang.finite_automaton.Symbol`
+            A sequence of input symbols, or of their values
+
+        Returns
+        ----------
+        is_accepted : bool
+            Whether the word is accepted or not
+
+        Examples
+        --------
+
+        >>> dfa = DeterministicFiniteAutomaton()
+        >>> dfa.add_transitions([(0, "a", 1), (1, "b", 0)])
+        >>> dfa.add_start_state(0)
+        >>> dfa.add_final_state(1)
+        >>> from os.path import join
+        >>> from tempfile import mkdtemp
+        >>> path = join(mkdtemp(), "automaton.bin")
+        >>> dfa.save(path)
+        >>> load(path).accepts(["a", "b"])
+        False
+
+        """
+        if self._kind == KIND_DFA:
+            return self._accepts_deterministic(word)
+        current = self._get_start()
+        for symbol in word:
+            current = self._get_next(current, symbol)
+            if not current:
+                return False
+        return any(self.is_final(state_id) for state_id in current)
+
+    def _accepts_deterministic(self, word: Iterable[Any]) -> bool:
+        """ Runs a word on a deterministic automaton """
+        if len(self._starts) == 0:
+            return False
+        row_pointers = self._row_pointers
+        labels = self._labels
+        get_id = self._symbol_ids.get
+        unknown = self._unknown_symbol
+        current = self._starts[0]
+        for symbol in word:
+            # Symbols hash and compare like their values
+            symbol_id = get_id(symbol, unknown)
+            end = row_pointers[current + 1]
+            position = bisect_left(labels, symbol_id,
+                                   row_pointers[current], end)
+            if position == end or labels[position] != symbol_id:
+                return False
+            current = self._targets[position]
+        return self.is_final(current)
+
+    def matcher(self) -> "CompiledNFAMatcher":
+        """ Gives an incremental matcher running on the automaton
+
+        Returns
+        ----------
+        matcher : :class:`~pyformlang.finite_automaton.CompiledNFAMatcher`
+            A new matcher, at the beginning of the input
+
+        Examples
+        --------
+
+        >>> dfa = DeterministicFiniteAutomaton()
+        >>> dfa.add_transitions([(0, "a", 1), (1, "b", 0)])
+        >>> dfa.add_start_state(0)
+        >>> dfa.add_final_state(1)
+        >>> from os.path import join
+        >>> from tempfile import mkdtemp
+        >>> path = join(mkdtemp(), "automaton.bin")
+        >>> dfa.save(path)
+        >>> matcher = load(path).matcher()
+        >>> matcher.feed("aba")
+        True
+        >>> matcher.is_accepting()
+        True
+
+        """
+        return CompiledNFAMatcher(self)
+
+    def to_automaton(self) -> "EpsilonNFA":
+        """ Rebuilds the automaton which was saved
+
+        Returns
+        ----------
+        automaton : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+            A new automaton of the kind saved, deterministic, \
+            nondeterministic or with epsilon transitions
+
+        Examples
+        --------
+
+        >>> dfa = DeterministicFiniteAutomaton()
+        >>> dfa.add_transitions([(0, "a", 1), (1, "b", 0)])
+        >>> dfa.add_start_state(0)
+        >>> dfa.add_final_state(1)
+        >>> from os.path import join
+        >>> from tempfile import mkdtemp
+        >>> path = join(mkdtemp(), "automaton.bin")
+        >>> dfa.save(path)
+        >>> load(path).to_automaton().is_equivalent_to(dfa)
+        True
+
+        """
+        if self._kind == KIND_DFA:
+            automaton_class = finite_automaton.DeterministicFiniteAutomaton
+        elif self._kind == KIND_NFA:
+            automaton_class = \
+                finite_automaton.NondeterministicFiniteAutomaton
+        else:
+            automaton_class = finite_automaton.EpsilonNFA
+        states = self.states
+        symbols = [Symbol(value) for value in self._symbol_values] + \
+            [Epsilon()]
+        automaton = automaton_class(
+            states=set(states),
+            input_symbols=set(symbols[:-1]),
+            final_states={states[i]
+                          for i in range(len(states)) if self.is_final(i)})
+        row_pointers = self.row_pointers.tolist()
+        labels = self.transition_labels.tolist()
+        targets = self.transition_targets.tolist()
+        for i_from, state in enumerate(states):
+            for position in range(row_pointers[i_from],
+                                  row_pointers[i_from + 1]):
+                automaton.add_transition(state, symbols[labels[position]],
+                                         states[targets[position]])
+        for i_start in self._starts:
+            automaton.add_start_state(states[i_start])
+        return automaton
+
+
+class CompiledNFAMatcher(Matcher):
+    """ An incremental matcher running on an automaton loaded from a file
+
+    The current configuration is the set of the ids of the current states.
+
+    Parameters
+    ----------
+    compiled : :class:`~pyformlang.finite_automaton.CompiledNFA`
+        The loaded automaton
+    """
+
+    def __init__(self, compiled: CompiledNFA):
+        self._compiled = compiled
+        super().__init__()
+
+    def _get_start(self):
+        # pylint: disable=protected-access
+        return self._compiled._get_start()
+
+    def _get_next(self, current, symbol):
+        # pylint: disable=protected-access
+        return self._compiled._get_next(current, symbol)
+
+    def _is_final(self, current):
+        return any(self._compiled.is_final(state_id) for state_id in current)
+
+    def _is_dead(self, current):
+        return not current
@@ -2,14 +2,15 @@
 Representation of a deterministic finite automaton
 """
 
-from typing import AbstractSet, Iterable
+from typing import AbstractSet, Iterable, List
 
 import numpy as np
 
 # pylint: disable=cyclic-import
-from .epsilon_nfa import to_single_state
+from .minimization import MINIMIZATION_ALGORITHMS
 from .finite_automaton import to_state, to_symbol
-from .hopcroft_processing_list import HopcroftProcessingList
+from .compiled_dfa import CompiledDFA
+from .matcher import DFAMatcher
 # pylint: disable=cyclic-import
 from .nondeterministic_finite_automaton import NondeterministicFiniteAutomaton
 from .partition import Partition
@@ -17,38 +18,45 @@ from .state import State
 from .symbol import Symbol
 from .transition_function import TransitionFunction
 
+# Below this number of transitions per state and symbol, "auto" minimizes
+# with Valmari's algorithm, which does not complete the automaton
+SPARSE_DENSITY = 0.5
+# Up to this number of cells in the transition table, "auto" minimizes
+# with Moore's algorithm
+SMALL_TABLE_SIZE = 1024
 
-class PreviousTransitions:
-    """For internal usage"""
 
-    def __init__(self, states, symbols):
-        self._to_index_state = {}
-        self._to_index_state[None] = 0
-        for i, state in enumerate(states):
-            self._to_index_state[state] = i + 1
-        self._to_index_symbol = {}
-        for i, symbol in enumerate(symbols):
-            self._to_index_symbol[symbol] = i
-        self._conversion = np.empty((len(states) + 1, len(symbols)),
-                                    dtype=object)
-
-    def add(self, next0, symbol, state):
-        """ Internal """
-        i_next0 = self._to_index_state[next0]
-        i_symbol = self._to_index_symbol[symbol]
-        if self._conversion[i_next0, i_symbol] is None:
-            self._conversion[i_next0, i_symbol] = [state]
-        else:
-            self._conversion[i_next0, i_symbol].append(state)
+class PreviousTransitions:  # pylint: disable=too-few-public-methods
+    """ The inverse transitions of a complete DFA whose states and symbols \
+    are integers
+
+    The predecessors are stored in compressed sparse rows: the \
+    predecessors of the state q by the symbol a are \
+    previous[offsets[a * n_states + q]:offsets[a * n_states + q + 1]].
+
+    For internal usage.
+
+    Parameters
+    ----------
+    next_states : numpy.ndarray of int
+        The transition table, of shape (n_states, n_symbols)
+    """
 
-    def get(self, next0, symbol):
-        """ Internal """
-        i_next0 = self._to_index_state[next0]
-        i_symbol = self._to_index_symbol[symbol]
-        return self._conversion[i_next0, i_symbol] or []
+    def __init__(self, next_states: np.ndarray):
+        n_states, n_symbols = next_states.shape
+        keys = (np.arange(n_symbols) * n_states + next_states).ravel()
+        self.n_states = n_states
+        self.offsets, previous = _to_csr(keys, n_states * n_symbols)
+        self.previous = [i // n_symbols for i in previous]
+
+    def get(self, next0: int, symbol: int) -> List[int]:
+        """ Gives the predecessors of a state by a symbol """
+        key = symbol * self.n_states + next0
+        return self.previous[self.offsets[key]:self.offsets[key + 1]]
 
 
 class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
+    # pylint: disable=too-many-ancestors
     """ Represents a deterministic finite automaton
 
     This class represents a deterministic finite automaton.
@@ -140,6 +148,7 @@ class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
 
         """
         state = to_state(state)
+        self._invalidate_cache()
         self._start_state = {state}
         self._states.add(state)
         return 1
@@ -167,6 +176,7 @@ class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
         """
         state = to_state(state)
         if {state} == self._start_state:
+            self._invalidate_cache()
             self._start_state = {}
             return 1
         return 0
@@ -209,6 +219,89 @@ class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
                 current_state = None
         return current_state is not None and self.is_final_state(current_state)
 
+    def compile(self) -> CompiledDFA:
+        """ Freezes the dfa into integer-indexed transition tables, for \
+        fast membership queries
+
+        The compiled automaton is a snapshot: later modifications of the \
+        current dfa are not reflected in it.
+
+        Returns
+        ----------
+        compiled : :class:`~pyformlang.finite_automaton.CompiledDFA`
+            An immutable compiled version of the current dfa
+
+        Examples
+        --------
+
+        >>> dfa = DeterministicFiniteAutomaton()
+        >>> dfa.add_transitions([(0, "abc", 1), (0, "d", 1)])
+        >>> dfa.add_start_state(0)
+        >>> dfa.add_final_state(1)
+        >>> compiled = dfa.compile()
+        >>> compiled.accepts(["abc"])
+        True
+
+        """
+        return CompiledDFA(self)
+
+    def matcher(self) -> DFAMatcher:
+        """ Gives an incremental matcher, which reads the input by chunks
+
+        The matcher runs on a compiled version of the dfa, so later \
+        modifications of the dfa are not reflected in it.
+
+        Returns
+        ----------
+        matcher : :class:`~pyformlang.finite_automaton.DFAMatcher`
+            A new matcher, at the beginning of the input
+
+        Examples
+        --------
+
+        >>> dfa = DeterministicFiniteAutomaton()
+        >>> dfa.add_transitions([(0, "a", 1), (1, "b", 0)])
+        >>> dfa.add_start_state(0)
+        >>> dfa.add_final_state(1)
+        >>> matcher = dfa.matcher()
+        >>> matcher.feed(["a", "b"])
+        True
+        >>> matcher.is_accepting()
+        False
+
+        """
+        return self.compile().matcher()
+
+    def accepts_many(self, words: Iterable[Iterable[Symbol]]) -> np.ndarray:
+        """ Checks which words of a collection are accepted
+
+        The dfa is compiled and all the words advance together, one symbol \
+        at a time.
+
+        Parameters
+        ----------
+        words : iterable of iterables of \
+        :class:`~pyformlang.finite_automaton.Symbol`
+            The words to check
+
+        Returns
+        ----------
+        are_accepted : numpy.ndarray of bool
+            For each word, whether it is accepted or not
+
+        Examples
+        --------
+
+        >>> dfa = DeterministicFiniteAutomaton()
+        >>> dfa.add_transitions([(0, "abc", 1), (0, "d", 1)])
+        >>> dfa.add_start_state(0)
+        >>> dfa.add_final_state(1)
+        >>> dfa.accepts_many([["abc"], ["d", "d"], ["d"]])
+        array([ True, False,  True])
+
+        """
+        return self.compile().accepts_many(words)
+
     def is_deterministic(self) -> bool:
         """ Checks whether an automaton is deterministic
 
@@ -227,15 +320,27 @@ class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
         """
         return True
 
-    def to_deterministic(self) -> "DeterministicFiniteAutomaton":
+    def to_deterministic(self, return_origins: bool = False,
+                         workers: int = 1):
         """ Transforms the current automaton into a dfa. Does nothing if the \
         automaton is already deterministic.
 
+        Parameters
+        ----------
+        return_origins : bool, optional
+            Whether to also give the states of the current automaton of \
+            each state of the dfa, i.e. each state alone
+        workers : int, optional
+            Ignored, as there is nothing to compute
+
         Returns
         ----------
         dfa :  :class:`~pyformlang.deterministic_finite_automaton\
         .DeterministicFiniteAutomaton`
             A dfa equivalent to the current nfa
+        origins : dict of :class:`~pyformlang.finite_automaton.State` to \
+        frozenset of :class:`~pyformlang.finite_automaton.State`
+            Only given if return_origins is True
 
         Examples
         --------
@@ -246,11 +351,16 @@ class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
         True
 
         """
+        if return_origins:
+            return self, {state: frozenset([state]) for state in self._states}
         return self
 
     def copy(self) -> "DeterministicFiniteAutomaton":
         """ Copies the current DFA
 
+        The copy is made in constant time, the content of the dfa being \
+        shared until one of the automata is modified.
+
         Returns
         ----------
         enfa :  :class:`~pyformlang.finite_automaton\
@@ -269,62 +379,53 @@ class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
         True
 
         """
-        dfa = DeterministicFiniteAutomaton()
-        if self._start_state:
-            dfa.add_start_state(list(self._start_state)[0])
-        for final in self._final_states:
-            dfa.add_final_state(final)
-        for state in self._states:
-            for symbol in self._input_symbols:
-                state_to = self._transition_function(state, symbol)
-                if state_to:
-                    state_to = state_to[0]
-                else:
-                    state_to = None
-                if state_to is not None:
-                    dfa.add_transition(state, symbol, state_to)
-        return dfa
+        return self._copy_on_write()
 
-    def _get_previous_transitions(self):
-        previous_transitions = PreviousTransitions(self._states,
-                                                   self._input_symbols)
-        for state in self._states:
-            for symbol in self._input_symbols:
-                next0 = self._transition_function(state, symbol)
-                if next0:
-                    next0 = next0[0]
-                else:
-                    next0 = None
-                previous_transitions.add(next0, symbol, state)
-        for symbol in self._input_symbols:
-            previous_transitions.add(None, symbol, None)
-        return previous_transitions
-
-    def _get_reachable_states(self) -> AbstractSet[State]:
-        """ Get all states which are reachable """
-        to_process = []
-        processed = set()
-        for state in self._start_state:
-            to_process.append(state)
-            processed.add(state)
-        while to_process:
-            current = to_process.pop()
-            for symbol in self._input_symbols:
-                next_state = self._transition_function(current, symbol)
-                if not next_state or next_state[0] in processed:
-                    continue
-                to_process.append(next_state[0])
-                processed.add(next_state[0])
-        return processed
-
-    def minimize(self) -> "DeterministicFiniteAutomaton":
+    def minimize(self, algorithm: str = "auto",
+                 return_origins: bool = False):
         """ Minimize the current DFA
 
+        The states of the minimal DFA are numbered from 0, the start state \
+        being 0.
+
+        Parameters
+        ----------
+        algorithm : str, optional
+            The minimization algorithm, among:
+
+            * "hopcroft": Hopcroft's algorithm, on the complete DFA
+            * "valmari": the algorithm of Valmari and Lehtinen, which \
+            works on the partial DFA without completing it, after removing \
+            the states from which no final state can be reached
+            * "moore": Moore's partition refinement, vectorized with numpy
+            * "brzozowski": Brzozowski's double reversal and determinization
+            * "auto" (default): chooses among the previous ones from the \
+            number of states, the size of the alphabet and the density of \
+            the transitions
+
+            The algorithms give the same minimal DFA, up to the numbering \
+            of its states. It has no state from which no final state can be \
+            reached, except for the start state of the empty language.
+        return_origins : bool, optional
+            Whether to also give the states of the current DFA merged into \
+            each state of the minimal DFA. Brzozowski's algorithm cannot \
+            give them.
+
         Returns
         ----------
         dfa :  :class:`~pyformlang.deterministic_finite_automaton\
         .DeterministicFiniteAutomaton`
             The minimal DFA
+        origins : dict of :class:`~pyformlang.finite_automaton.State` to \
+        frozenset of :class:`~pyformlang.finite_automaton.State`
+            Only given if return_origins is True. The set of states of the \
+            current DFA of each state of the minimal DFA.
+
+        Raises
+        ----------
+        ValueError
+            If the algorithm is unknown, or if it is "brzozowski" and \
+            return_origins is True
 
         Examples
         --------
@@ -336,151 +437,318 @@ class DeterministicFiniteAutomaton(NondeterministicFiniteAutomaton):
         >>> dfa_minimal = dfa.minimize()
         >>> dfa.is_equivalent_to(dfa_minimal)
         True
+        >>> len(dfa.minimize(algorithm="valmari").states)
+        2
 
         """
+        if algorithm not in MINIMIZATION_ALGORITHMS:
+            raise ValueError("Unknown minimization algorithm: " + algorithm)
+        if algorithm == "brzozowski" and return_origins:
+            raise ValueError("Brzozowski's algorithm cannot give the "
+                             "origins of the states")
         if not self._start_state or not self._final_states:
-            res = DeterministicFiniteAutomaton()
-            res.add_start_state(State("Empty"))
-            return res
-        # Remove unreachable
-        reachables = self._get_reachable_states()
-        states = self._states.intersection(reachables)
-        # Group the equivalent states
-        partition = self._get_partition()
-        groups = partition.get_groups()
-        # Create a state for this
-        to_new_states = {}
-        for group in groups:
-            new_state = to_single_state(group)
-            for state in group:
-                to_new_states[state] = new_state
-        # Build the DFA
+            return _get_empty_minimal_dfa(return_origins)
+        if algorithm == "auto":
+            algorithm = self._choose_minimization_algorithm()
+        if algorithm == "brzozowski":
+            return self._minimize_brzozowski()
+        if algorithm == "valmari":
+            partition = self._get_partition_valmari()
+        elif algorithm == "moore":
+            partition = self._get_partition_moore()
+        else:
+            partition = self._get_partition()
+        if partition is None:
+            return _get_empty_minimal_dfa(return_origins)
+        return self._from_partition(*partition, return_origins)
+
+    def _choose_minimization_algorithm(self) -> str:
+        """ Chooses a minimization algorithm for the current DFA """
+        n_states = len(self._states)
+        n_symbols = max(len(self._input_symbols), 1)
+        density = self.get_number_transitions() / (n_states * n_symbols)
+        if density < SPARSE_DENSITY:
+            return "valmari"
+        if n_states * n_symbols <= SMALL_TABLE_SIZE:
+            return "moore"
+        return "hopcroft"
+
+    # pylint: disable=too-many-locals
+    def _from_partition(self, states, class_names,
+                        return_origins: bool = False):
+        """ Builds the quotient of the current DFA by a partition of some of \
+        its states
+
+        The classes are numbered in the order of their first state. The \
+        class of the trash state, which holds the states from which no \
+        final state can be reached, is dropped.
+
+        Parameters
+        ----------
+        states : list of :class:`~pyformlang.finite_automaton.State`
+            The states to keep, starting with the start state. None stands \
+            for the trash state and must be the last one if present.
+        class_names : list of int
+            The class of each state
+        return_origins : bool, optional
+            Whether to also give the states of each class
+        """
+        dead_class = class_names[-1] if states[-1] is None else None
+        if class_names[0] == dead_class:
+            return _get_empty_minimal_dfa(return_origins)
+        new_states = {}
+        groups = []
+        for state, class_name in zip(states, class_names):
+            if class_name == dead_class:
+                continue
+            if class_name not in new_states:
+                new_states[class_name] = State(len(groups))
+                groups.append([])
+            groups[new_states[class_name].value].append(state)
+        to_new_states = {state: new_states[class_name]
+                         for state, class_name in zip(states, class_names)
+                         if class_name != dead_class}
+        # Build the DFA, from one representative of each group
         dfa = DeterministicFiniteAutomaton()
-        for state in self._start_state:
-            dfa.add_start_state(to_new_states[state])
-        for state in states:
-            if state in self._final_states:
-                dfa.add_final_state(to_new_states[state])
-            done = set()
-            new_state = to_new_states[state]
-            for symbol in self._input_symbols:
-                for next_node in self._transition_function(state, symbol):
-                    if next_node in states:
-                        next_node = to_new_states[next_node]
-                        if (next_node, symbol) not in done:
-                            dfa.add_transition(new_state, symbol, next_node)
-                            done.add((next_node, symbol))
+        dfa.add_start_state(State(0))
+        for i, group in enumerate(groups):
+            new_state = State(i)
+            if group[0] in self._final_states:
+                dfa.add_final_state(new_state)
+            for symbol, next_node in self._transition_function(group[0]):
+                next_node = to_new_states.get(next_node)
+                if next_node is not None:
+                    dfa.add_transition(new_state, symbol, next_node)
+        if return_origins:
+            origins = {State(i): frozenset(group)
+                       for i, group in enumerate(groups)}
+            return dfa, origins
         return dfa
 
-    def _get_partition(self):
-        previous_transitions = self._get_previous_transitions()
-        finals = []
-        non_finals = []
-        for state in self._states:
-            if state in self._final_states:
-                finals.append(state)
-            else:
-                non_finals.append(state)
-        # None is the trash node
-        non_finals.append(None)
-        # + 1 for trash node
-        partition = Partition(len(self._states) + 1)
-        partition.add_class(finals)
-        partition.add_class(non_finals)
-        # + 1 for trash node
-        processing_list = HopcroftProcessingList(len(self._states) + 1,
-                                                 self._input_symbols)
-        to_add = 0  # 0 is the index of finals, 1 of non_finals
-        if len(non_finals) < len(finals):
-            to_add = 1
-        for symbol in self._input_symbols:
-            processing_list.insert(to_add, symbol)
-        while not processing_list.is_empty():
-            current_class, current_symbol = processing_list.pop()
-            inverse = []
-            for element in partition.part[current_class]:
-                inverse += previous_transitions.get(element.value,
-                                                    current_symbol)
-            for valid_set in partition.get_valid_sets(inverse):
-                new_class = partition.split(valid_set, inverse)
-                for symbol in self._input_symbols:
-                    if processing_list.contains(valid_set, symbol):
-                        processing_list.insert(new_class, symbol)
-                    elif (len(partition.part[valid_set]) <
-                          len(partition.part[valid_set])):
-                        processing_list.insert(valid_set, symbol)
-                    else:
-                        processing_list.insert(new_class, symbol)
-        return partition
-
-    def is_equivalent_to(self, other):
-        """ Check whether two automata are equivalent
+    def _get_reachable_edges(self):
+        """ Gives the reachable states and the transitions between them
 
-        Parameters
+        Returns
         ----------
-        other :  :class:`~pyformlang.deterministic_finite_automaton\
-        .FiniteAutomaton`
-            A sequence of input symbols
+        states : list of :class:`~pyformlang.finite_automaton.State`
+            The reachable states, starting with the start state
+        n_symbols : int
+            The number of symbols
+        tails, labels, heads : lists of int
+            For each transition, the index of its source state, of its \
+            symbol and of its destination state
+        """
+        symbol_ids = {symbol: i
+                      for i, symbol in enumerate(self._input_symbols)}
+        states = list(self._start_state)
+        state_ids = {state: i for i, state in enumerate(states)}
+        tails = []
+        labels = []
+        heads = []
+        i = 0
+        while i < len(states):
+            for symbol, next_state in self._transition_function(states[i]):
+                next_id = state_ids.get(next_state)
+                if next_id is None:
+                    next_id = len(states)
+                    state_ids[next_state] = next_id
+                    states.append(next_state)
+                tails.append(i)
+                labels.append(symbol_ids[symbol])
+                heads.append(next_id)
+            i += 1
+        return states, len(symbol_ids), tails, labels, heads
+
+    def _get_reachable_table(self):
+        """ Gives the reachable states, from the start state, and the \
+        transition table of the complete DFA over them
+
+        The last state is None, the trash state, which is the target of all \
+        the missing transitions.
+        """
+        states, n_symbols, tails, labels, heads = self._get_reachable_edges()
+        trash = len(states)
+        states.append(None)
+        next_states = np.full((len(states), n_symbols), trash, dtype=np.int64)
+        next_states[tails, labels] = heads
+        return states, next_states
+
+    def _get_partition(self):  # pylint: disable=too-many-locals
+        """ Groups the equivalent reachable states with Hopcroft's algorithm
 
         Returns
         ----------
-        are_equivalent : bool
-            Whether the two automata are equivalent or not
+        states : list of :class:`~pyformlang.finite_automaton.State`
+            The reachable states, starting with the start state and ending \
+            with None, the trash state
+        class_names : list of int
+            The class of each state
+        """
+        states, next_states = self._get_reachable_table()
+        n_symbols = next_states.shape[1]
+        previous_transitions = PreviousTransitions(next_states)
+        offsets = previous_transitions.offsets
+        previous = previous_transitions.previous
+        n_states = len(states)
+        partition = Partition(n_states)
+        # The splitters to process, and their set, encoded as
+        # class * n_symbols + symbol
+        waiting = []
+        for old_class, new_class in partition.split(
+                i for i, state in enumerate(states)
+                if state in self._final_states):
+            if partition.get_size(old_class) < partition.get_size(new_class):
+                new_class = old_class
+            waiting = [new_class * n_symbols + symbol
+                       for symbol in range(n_symbols)]
+        in_waiting = set(waiting)
+        while waiting:
+            splitter = waiting.pop()
+            in_waiting.remove(splitter)
+            class_name, symbol = divmod(splitter, n_symbols)
+            base = symbol * n_states
+            inverse = []
+            for element in partition.get_elements(class_name):
+                inverse += previous[offsets[base + element]:
+                                    offsets[base + element + 1]]
+            for old_class, new_class in partition.split(inverse):
+                # Only the smaller half is needed when the old class is not
+                # waiting already
+                if partition.get_size(old_class) < \
+                        partition.get_size(new_class):
+                    smaller = old_class
+                else:
+                    smaller = new_class
+                for symbol_split in range(n_symbols):
+                    old_splitter = old_class * n_symbols + symbol_split
+                    if old_splitter in in_waiting:
+                        to_add = new_class * n_symbols + symbol_split
+                    else:
+                        to_add = smaller * n_symbols + symbol_split
+                    waiting.append(to_add)
+                    in_waiting.add(to_add)
+        return states, partition.get_class_names()
 
-        Examples
-        --------
+    def _get_partition_valmari(self):
+        """ Groups the equivalent useful states with the algorithm of \
+        Valmari and Lehtinen
 
-        >>> dfa = DeterministicFiniteAutomaton()
-        >>> dfa.add_transitions([(0, "abc", 1), (0, "d", 1)])
-        >>> dfa.add_start_state(0)
-        >>> dfa.add_final_state(1)
-        >>> dfa_minimal = dfa.minimize()
-        >>> dfa.is_equivalent_to(dfa_minimal)
-        True
+        The transitions are partitioned into cords alongside the states, so \
+        that the missing transitions are never built.
+
+        Returns
+        ----------
+        states : list of :class:`~pyformlang.finite_automaton.State`
+            The states which are reachable and from which a final state can \
+            be reached, starting with the start state, or None if the start \
+            state is not one of them
+        class_names : list of int
+            The class of each state
+        """
+        # pylint: disable=too-many-locals
+        states, n_symbols, tails, labels, heads = self._get_reachable_edges()
+        # Remove the states from which no final state can be reached
+        useful = self.get_useful_states()
+        if states[0] not in useful:
+            return None
+        new_ids = [-1] * len(states)
+        useful_states = []
+        for i, state in enumerate(states):
+            if state in useful:
+                new_ids[i] = len(useful_states)
+                useful_states.append(state)
+        kept = [i for i, head in enumerate(heads) if new_ids[head] != -1]
+        tails = [new_ids[tails[i]] for i in kept]
+        labels = [labels[i] for i in kept]
+        offsets, incoming = _to_csr([new_ids[heads[i]] for i in kept],
+                                    len(useful_states))
+        # The blocks start with the final states and the others
+        blocks = Partition(len(useful_states))
+        blocks.split(i for i, state in enumerate(useful_states)
+                     if state in self._final_states)
+        # The cords start with the transitions of each symbol
+        cords = Partition(len(kept))
+        label_offsets, by_label = _to_csr(labels, n_symbols)
+        for label in range(n_symbols):
+            cords.split(by_label[label_offsets[label]:
+                                 label_offsets[label + 1]])
+        # The first block needs not split the cords, as the cords are
+        # already compatible with the union of all the blocks
+        i_block = 1
+        i_cord = 0
+        while i_cord < len(cords):
+            blocks.split([tails[transition]
+                          for transition in cords.get_elements(i_cord)])
+            i_cord += 1
+            while i_block < len(blocks):
+                to_mark = []
+                for state in blocks.get_elements(i_block):
+                    to_mark += incoming[offsets[state]:offsets[state + 1]]
+                cords.split(to_mark)
+                i_block += 1
+        return useful_states, blocks.get_class_names()
+
+    def _get_partition_moore(self):
+        """ Groups the equivalent reachable states with Moore's algorithm
 
+        Returns
+        ----------
+        states : list of :class:`~pyformlang.finite_automaton.State`
+            The reachable states, starting with the start state and ending \
+            with None, the trash state
+        class_names : list of int
+            The class of each state
         """
-        if not isinstance(other, DeterministicFiniteAutomaton):
-            other_dfa = other.to_deterministic()
-            return self.is_equivalent_to(other_dfa)
-        self_minimal = self.minimize()
-        other_minimal = other.minimize()
-        return self._is_equivalent_to_minimal(self_minimal, other_minimal)
+        states, next_states = self._get_reachable_table()
+        class_names = np.array([state in self._final_states
+                                for state in states], dtype=np.int64)
+        n_classes = len(np.unique(class_names))
+        while True:
+            signatures = np.column_stack((class_names,
+                                          class_names[next_states]))
+            _, new_class_names = np.unique(signatures, axis=0,
+                                           return_inverse=True)
+            new_class_names = new_class_names.ravel()
+            new_n_classes = int(new_class_names.max()) + 1
+            if new_n_classes == n_classes:
+                return states, class_names.tolist()
+            class_names = new_class_names
+            n_classes = new_n_classes
 
     @property
     def start_state(self) -> State:
         """ The start state """
         return list(self._start_state)[0]
 
-    @staticmethod
-    def _is_equivalent_to_minimal(self_minimal, other_minimal):
-        to_process = [(self_minimal.start_state,
-                       other_minimal.start_state)]
-        matches = {self_minimal.start_state: other_minimal.start_state}
-        while to_process:
-            current_self, current_other = to_process.pop()
-            if (self_minimal.is_final_state(current_self)
-                    and not other_minimal.is_final_state(current_other)) or \
-                    (not self_minimal.is_final_state(current_self)
-                     and other_minimal.is_final_state(current_other)):
-                return False
-            next_self = self_minimal(current_self)
-            next_other = other_minimal(current_other)
-            if len(next_self) != len(next_other):
-                return False
-            if len(next_self) == 0:
-                continue
-            for next_temp, other_temp in zip(sorted(list(next_self),
-                                                    key=lambda x: x[0].value),
-                                             sorted(list(next_other),
-                                                    key=lambda x: x[0].value)):
-                next_symbol_self, next_state_self = next_temp
-                next_symbol_other, next_state_other = other_temp
-                if next_symbol_other != next_symbol_self:
-                    return False
-                if next_state_self in matches:
-                    if matches[next_state_self] != next_state_other:
-                        return False
-                else:
-                    matches[next_state_self] = next_state_other
-                    to_process.append((next_state_self, next_state_other))
-        return True
+
+def _to_csr(keys, n_keys: int):
+    """ Groups the indexes of some keys by key, in compressed sparse rows
+
+    Parameters
+    ----------
+    keys : sequence of int
+        Keys between 0 and n_keys - 1
+    n_keys : int
+        The number of possible keys
+
+    Returns
+    ----------
+    offsets : list of int
+        The indexes with the key i are in indexes[offsets[i]:offsets[i + 1]]
+    indexes : list of int
+        The indexes, sorted by key
+    """
+    keys = np.asarray(keys, dtype=np.int64)
+    offsets = np.zeros(n_keys + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n_keys), out=offsets[1:])
+    return offsets.tolist(), np.argsort(keys, kind="stable").tolist()
+
+
+def _get_empty_minimal_dfa(return_origins: bool = False):
+    """ The minimal DFA of the empty language, with no origin for its state \
+    if requested """
+    res = DeterministicFiniteAutomaton()
+    res.add_start_state(State(0))
+    if return_origins:
+        return res, {State(0): frozenset()}
+    return res
@@ -6,7 +6,7 @@ from .symbol import Symbol
 
 
 class Epsilon(Symbol):  # pylint: disable=too-few-public-methods
-    """ An epsilon transition
+    """ An epsilon transition, of which there is a single instance
 
     Examples
     --------
@@ -15,6 +15,8 @@ class Epsilon(Symbol):  # pylint: disable=too-few-public-methods
 
     """
 
+    __slots__ = []
+
     def __init__(self):
         super().__init__("epsilon")
 
@@ -22,6 +24,4 @@ class Epsilon(Symbol):  # pylint: disable=too-few-public-methods
         return hash("EPSILON TRANSITION")
 
     def __eq__(self, other):
-        if isinstance(other, Epsilon):
-            return True
-        return False
+        return self is other or isinstance(other, Epsilon)
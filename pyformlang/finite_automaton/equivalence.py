@@ -0,0 +1,251 @@
+""" Language equivalence of finite automata, with union-find and \
+congruences
+For internal usage
+"""
+
+from collections import deque
+from typing import List, Optional, Tuple
+
+# pylint: disable=cyclic-import
+from pyformlang import finite_automaton
+
+from .bitset_nfa import BitsetNFA
+from .search_word import get_word
+from .symbol import Symbol
+
+# Above this number of explored pairs, the congruence closure is not
+# computed anymore and only the union-find structure is used
+MAX_PAIRS_CONGRUENCE = 64
+
+
+def are_equivalent(automaton0: "FiniteAutomaton",
+                   automaton1: "FiniteAutomaton") -> bool:
+    """ Checks whether two automata recognize the same language
+
+    Two deterministic automata are compared with the algorithm of Hopcroft \
+    and Karp, other automata with its extension to nondeterministic \
+    automata up to congruence (HKC) of Bonchi and Pous. Neither automaton \
+    is minimized nor determinized beforehand.
+
+    Parameters
+    ----------
+    automaton0, automaton1 : :class:`~pyformlang.finite_automaton\
+.FiniteAutomaton`
+        The automata to compare
+
+    Returns
+    ----------
+    are_equivalent : bool
+        Whether the languages are the same
+    """
+    return get_distinguishing_word(automaton0, automaton1) is None
+
+
+def get_distinguishing_word(automaton0: "FiniteAutomaton",
+                            automaton1: "FiniteAutomaton") \
+        -> Optional[List[Symbol]]:
+    """ Gives a shortest word accepted by exactly one of two automata
+
+    This is the check of :func:`are_equivalent`, which explores the pairs \
+    of states reached by the same words breadth first and remembers how \
+    each pair was found. A pair is only skipped when it follows from pairs \
+    reached by words at most as long, so the first pair on which the \
+    automata disagree is reached by a shortest distinguishing word.
+
+    Parameters
+    ----------
+    automaton0, automaton1 : :class:`~pyformlang.finite_automaton\
+.FiniteAutomaton`
+        The automata to compare
+
+    Returns
+    ----------
+    word : list of :class:`~pyformlang.finite_automaton.Symbol` or None
+        A shortest distinguishing word, or None if the automata are \
+        equivalent
+    """
+    dfa_class = finite_automaton.DeterministicFiniteAutomaton
+    if isinstance(automaton0, dfa_class) and \
+            isinstance(automaton1, dfa_class):
+        return _get_distinguishing_word_deterministic(automaton0, automaton1)
+    return _get_distinguishing_word_nondeterministic(automaton0, automaton1)
+
+
+def _get_sorted_symbols(symbols) -> List[Symbol]:
+    """ Sorts symbols, so that the word found does not depend on the hash \
+    seed """
+    return sorted(symbols, key=lambda symbol: str(symbol.value))
+
+
+# pylint: disable=too-many-locals
+def _get_distinguishing_word_deterministic(
+        dfa0: "DeterministicFiniteAutomaton",
+        dfa1: "DeterministicFiniteAutomaton") -> Optional[List[Symbol]]:
+    """ Hopcroft and Karp's algorithm, on the compiled automata
+
+    The states of both automata are merged in a union-find structure as \
+    soon as they are assumed equivalent, so that each pair of classes is \
+    explored at most once.
+    """
+    compiled0 = dfa0.compile()
+    compiled1 = dfa1.compile()
+    symbols = _get_sorted_symbols(dfa0.symbols.union(dfa1.symbols))
+    columns = [(compiled0.get_symbol_id(symbol),
+                compiled1.get_symbol_id(symbol))
+               for symbol in symbols]
+    rows0 = compiled0.transition_table.tolist()
+    rows1 = compiled1.transition_table.tolist()
+    finals0 = compiled0.final_states_mask.tolist()
+    finals1 = compiled1.final_states_mask.tolist()
+    shift = len(rows0)
+    union_find = UnionFind(len(rows0) + len(rows1))
+    start = (compiled0.start_state_id, compiled1.start_state_id)
+    union_find.union(start[0], start[1] + shift)
+    previous = {start: None}
+    to_process = deque([start])
+    while to_process:
+        current = to_process.popleft()
+        state0, state1 = current
+        if finals0[state0] != finals1[state1]:
+            return get_word(previous, current)
+        row0 = rows0[state0]
+        row1 = rows1[state1]
+        for symbol, (column0, column1) in zip(symbols, columns):
+            next0 = row0[column0]
+            next1 = row1[column1]
+            if union_find.union(next0, next1 + shift):
+                previous[(next0, next1)] = (current, symbol)
+                to_process.append((next0, next1))
+    return None
+
+
+def _get_distinguishing_word_nondeterministic(enfa0: "EpsilonNFA",
+                                              enfa1: "EpsilonNFA") \
+        -> Optional[List[Symbol]]:
+    """ Hopcroft and Karp's algorithm up to congruence (HKC)
+
+    The sets of states reached by the same word in each automaton are \
+    compared, as in the determinized automata. A pair of sets is skipped \
+    when the sets are already in the same class of a union-find structure, \
+    as in Hopcroft and Karp's algorithm. While few pairs are explored, a \
+    pair is also skipped when it follows from them by the rules of \
+    congruence: reflexivity, symmetry, transitivity and union.
+    """
+    nfa0 = BitsetNFA(enfa0)
+    nfa1 = BitsetNFA(enfa1)
+    shift = len(nfa0.states)
+    symbols = _get_sorted_symbols(set(nfa0.symbols).union(nfa1.symbols))
+    # The explored pairs, as sets of states of the disjoint union
+    relation = []
+    union_find = UnionFind(0)
+    # The element of the union-find structure of each set of states
+    elements = {}
+    start = (nfa0.start & nfa0.useful, nfa1.start & nfa1.useful)
+    previous = {start: None}
+    to_process = deque([start])
+    while to_process:
+        current = to_process.popleft()
+        current0, current1 = current
+        union0 = current0
+        union1 = current1 << shift
+        if not union_find.union(_get_element(union_find, elements, union0),
+                                _get_element(union_find, elements, union1)):
+            continue
+        if len(relation) <= MAX_PAIRS_CONGRUENCE and \
+                _saturate(union0, relation) == _saturate(union1, relation):
+            continue
+        if nfa0.is_final(current0) != nfa1.is_final(current1):
+            return get_word(previous, current)
+        for symbol in symbols:
+            next_pair = (nfa0.get_next(current0, symbol) & nfa0.useful,
+                         nfa1.get_next(current1, symbol) & nfa1.useful)
+            if next_pair not in previous:
+                previous[next_pair] = (current, symbol)
+                to_process.append(next_pair)
+        relation.append((union0, union1))
+    return None
+
+
+def _get_element(union_find: "UnionFind", elements, current: int) -> int:
+    """ Gives the element of a set of states, adding it if needed """
+    element = elements.get(current)
+    if element is None:
+        element = union_find.add_element()
+        elements[current] = element
+    return element
+
+
+def _saturate(current: int, relation: List[Tuple[int, int]]) -> int:
+    """ Gives the largest set of states equal to a set in the congruence \
+    generated by a relation
+
+    When one set of a pair is included in the current set, the other one \
+    can be added to it.
+    """
+    changed = True
+    while changed:
+        changed = False
+        for left, right in relation:
+            if not left & ~current:
+                if right & ~current:
+                    current |= right
+                    changed = True
+            elif not right & ~current:
+                current |= left
+                changed = True
+    return current
+
+
+class UnionFind:
+    """ A union-find structure over the integers from 0 to n_elements - 1, \
+    with union by size and path halving
+
+    For internal usage.
+
+    Parameters
+    ----------
+    n_elements : int
+        The number of elements
+    """
+
+    def __init__(self, n_elements: int):
+        self._parents = list(range(n_elements))
+        self._sizes = [1] * n_elements
+
+    def add_element(self) -> int:
+        """ Adds an element, alone in its class
+
+        Returns
+        ----------
+        element : int
+            The new element
+        """
+        self._parents.append(len(self._parents))
+        self._sizes.append(1)
+        return len(self._parents) - 1
+
+    def find(self, element: int) -> int:
+        """ Gives the representative of the class of an element """
+        parents = self._parents
+        while parents[element] != element:
+            parents[element] = parents[parents[element]]
+            element = parents[element]
+        return element
+
+    def union(self, element0: int, element1: int) -> bool:
+        """ Merges the classes of two elements
+
+        Returns
+        ----------
+        is_merged : bool
+            False if the elements were already in the same class
+        """
+        root0 = self.find(element0)
+        root1 = self.find(element1)
+        if root0 == root1:
+            return False
+        if self._sizes[root0] < self._sizes[root1]:
+            root0, root1 = root1, root0
+        self._parents[root1] = root0
+        self._sizes[root0] += self._sizes[root1]
+        return True
@@ -1,6 +1,6 @@
 """ A general finite automaton representation """
 
-from typing import List, Any
+from typing import List, Any, Optional, FrozenSet
 
 import networkx as nx
 from networkx.drawing.nx_pydot import write_dot
@@ -9,12 +9,14 @@ from pyformlang.fst import FST
 # pylint: disable=cyclic-import
 from pyformlang import finite_automaton
 
+from .analysis import AutomatonAnalysis, analyze
 from .epsilon import Epsilon
+from .equivalence import are_equivalent, get_distinguishing_word
 from .state import State
 from .symbol import Symbol
 
 
-class FiniteAutomaton:
+class FiniteAutomaton:  # pylint: disable=too-many-public-methods
     """ Represents a general finite automaton
 
 
@@ -34,6 +36,11 @@ class FiniteAutomaton:
     _final_states : set of :class:`~pyformlang.finite_automaton.State`, \
      optional
         A set of final or accepting states. It is a subset of states.
+    _cache : dict
+        Values computed from the automaton, dropped whenever it is modified
+    _sharers : list of int
+        A counter, shared by the automata whose states, symbols and \
+        transitions are shared by copy-on-write
     """
 
     def __init__(self):
@@ -42,6 +49,33 @@ class FiniteAutomaton:
         self._transition_function = None
         self._start_state = set()
         self._final_states = set()
+        self._cache = {}
+        self._sharers = [1]
+
+    def _invalidate_cache(self):
+        """ Drops the values computed from the automaton, and stops sharing \
+        its content with its copies
+
+        Must be called by every method modifying the automaton, before the \
+        modification.
+        """
+        self._cache = {}
+        if self._sharers[0] > 1:
+            self._sharers[0] -= 1
+            self._sharers = [1]
+            self._states = set(self._states)
+            self._input_symbols = set(self._input_symbols)
+            self._transition_function = self._transition_function.copy()
+            self._start_state = self._start_state.copy()
+            self._final_states = set(self._final_states)
+
+    def _copy_on_write(self) -> "FiniteAutomaton":
+        """ Gives a copy sharing the content of the automaton, until one of \
+        them is modified """
+        automaton = self.__class__.__new__(self.__class__)
+        automaton.__dict__.update(self.__dict__)
+        self._sharers[0] += 1
+        return automaton
 
     def add_transition(self, s_from: State, symb_by: Symbol,
                        s_to: State) -> int:
@@ -77,6 +111,7 @@ class FiniteAutomaton:
         s_from = to_state(s_from)
         symb_by = to_symbol(symb_by)
         s_to = to_state(s_to)
+        self._invalidate_cache()
         temp = self._transition_function.add_transition(s_from, symb_by, s_to)
         self._states.add(s_from)
         self._states.add(s_to)
@@ -148,6 +183,7 @@ class FiniteAutomaton:
         s_from = to_state(s_from)
         symb_by = to_symbol(symb_by)
         s_to = to_state(s_to)
+        self._invalidate_cache()
         return self._transition_function.remove_transition(s_from,
                                                            symb_by,
                                                            s_to)
@@ -216,6 +252,7 @@ class FiniteAutomaton:
 
         """
         state = to_state(state)
+        self._invalidate_cache()
         self._start_state.add(state)
         self._states.add(state)
         return 1
@@ -245,6 +282,7 @@ class FiniteAutomaton:
         """
         state = to_state(state)
         if state in self._start_state:
+            self._invalidate_cache()
             self._start_state.remove(state)
             return 1
         return 0
@@ -273,6 +311,7 @@ class FiniteAutomaton:
 
         """
         state = to_state(state)
+        self._invalidate_cache()
         self._final_states.add(state)
         self._states.add(state)
         return 1
@@ -302,6 +341,7 @@ class FiniteAutomaton:
         """
         state = to_state(state)
         if self.is_final_state(state):
+            self._invalidate_cache()
             self._final_states.remove(state)
             return 1
         return 0
@@ -387,6 +427,7 @@ class FiniteAutomaton:
 
         """
         symbol = to_symbol(symbol)
+        self._invalidate_cache()
         self._input_symbols.add(symbol)
 
     def to_fst(self) -> "FST":
@@ -421,10 +462,23 @@ class FiniteAutomaton:
                                [symb_by.value])
         return fst
 
+    def _get_analysis(self) -> AutomatonAnalysis:
+        """ Gives the structural analysis of the automaton, computed once \
+        until it is modified """
+        analysis = self._cache.get("analysis")
+        if analysis is None:
+            analysis = analyze(self)
+            self._cache["analysis"] = analysis
+        return analysis
+
     def is_acyclic(self) -> bool:
         """
         Checks if the automaton is acyclic
 
+        Only the cycles reachable from a start state are considered. The \
+        check takes a linear time, and its result is kept until the \
+        automaton is modified.
+
         Returns
         -------
         is_acyclic : bool
@@ -442,21 +496,109 @@ class FiniteAutomaton:
         True
 
         """
-        to_process = []
-        for state in self._start_state:
-            to_process.append((state, set()))
-        while to_process:
-            current, visited = to_process.pop()
-            if current in visited:
-                return False
-            visited.add(current)
-            for symbol in self._input_symbols:
-                for state in self(current, symbol):
-                    to_process.append((state, visited.copy()))
-            # Epsilon
-            for state in self(current, Epsilon()):
-                to_process.append((state, visited.copy()))
-        return True
+        return self._get_analysis().is_acyclic
+
+    def is_finite(self) -> bool:
+        """
+        Checks if the language of the automaton is finite
+
+        The language is infinite if and only if a useful state is on a \
+        cycle reading at least one symbol. The cycles made only of epsilon \
+        transitions, or made of useless states, do not count.
+
+        Returns
+        -------
+        is_finite : bool
+            Whether the language is finite or not
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "a", 1), (1, "epsilon", 0), \
+        (1, "b", 2), (2, "c", 2)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> enfa.is_finite()
+        False
+        >>> enfa.remove_transition(1, "epsilon", 0)
+        >>> enfa.is_finite()
+        True
+
+        """
+        return self._get_analysis().is_finite
+
+    def get_useful_states(self) -> FrozenSet[State]:
+        """
+        Gives the useful states, which are reachable from a start state and \
+        from which a final state can be reached
+
+        Returns
+        -------
+        useful_states : frozenset of \
+        :class:`~pyformlang.finite_automaton.State`
+            The useful states
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "a", 1), (0, "b", 2), (3, "c", 1)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> enfa.get_useful_states() == {State(0), State(1)}
+        True
+
+        """
+        return self._get_analysis().useful_states
+
+    def get_shortest_word_length(self) -> Optional[int]:
+        """
+        Gives the length of a shortest accepted word
+
+        Returns
+        -------
+        length : int or None
+            The length of a shortest accepted word, None if the language is \
+            empty
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "a", 1), (1, "b", 2), \
+        (0, "epsilon", 2)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> enfa.get_shortest_word_length()
+        1
+
+        """
+        return self._get_analysis().shortest_word_length
+
+    def get_longest_word_length(self) -> Optional[float]:
+        """
+        Gives the length of a longest accepted word
+
+        Returns
+        -------
+        length : int, float or None
+            The length of a longest accepted word, None if the language is \
+            empty and math.inf if it is infinite
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "a", 1), (1, "b", 2), \
+        (0, "epsilon", 2)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(2)
+        >>> enfa.get_longest_word_length()
+        2
+
+        """
+        return self._get_analysis().longest_word_length
 
     def to_networkx(self) -> nx.MultiDiGraph:
         """
@@ -543,6 +685,62 @@ class FiniteAutomaton:
                 enfa.add_final_state(node)
         return enfa
 
+    def to_matrices(self) -> "AutomatonMatrices":
+        """
+        Decomposes the automaton into one sparse boolean adjacency matrix \
+        per symbol
+
+        Returns
+        -------
+        matrices : :class:`~pyformlang.finite_automaton.AutomatonMatrices`
+            The numbering of the states, the matrix of each symbol \
+            (epsilon included) and the start and final states as boolean \
+            vectors
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "abc", 1), (0, "d", 1), \
+        (0, "epsilon", 2)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> matrices = enfa.to_matrices()
+        >>> matrices.matrices[Symbol("d")].nnz
+        1
+
+        """
+        return finite_automaton.AutomatonMatrices.from_automaton(self)
+
+    @classmethod
+    def from_matrices(cls, matrices: "AutomatonMatrices") -> "EpsilonNFA":
+        """
+        Builds an automaton from its boolean matrices
+
+        Parameters
+        ----------
+        matrices : :class:`~pyformlang.finite_automaton.AutomatonMatrices`
+            The decomposition of the automaton, as given by to_matrices
+
+        Returns
+        -------
+        enfa : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+            A epsilon nondeterministic finite automaton read from the \
+            matrices
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "abc", 1), (0, "d", 1), \
+        (0, "epsilon", 2)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> enfa_from_matrices = EpsilonNFA.from_matrices(enfa.to_matrices())
+
+        """
+        return matrices.to_automaton()
+
     def write_as_dot(self, filename):
         """
         Write the automaton in dot format into a file
@@ -564,10 +762,45 @@ class FiniteAutomaton:
         """
         write_dot(self.to_networkx(), filename)
 
+    def save(self, path: str):
+        """
+        Writes the automaton into a compact binary file, which can be read \
+        back with :func:`~pyformlang.finite_automaton.load`
+
+        Parameters
+        ----------
+        path : str
+            The path of the file
+
+        Raises
+        ----------
+        ValueError
+            If the value of a state or of a symbol is not a string, a \
+            number or a boolean
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "abc", 1), (0, "d", 1), \
+        (0, "epsilon", 2)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> from os.path import join
+        >>> from tempfile import mkdtemp
+        >>> path = join(mkdtemp(), "enfa.bin")
+        >>> enfa.save(path)
+        """
+        finite_automaton.binary_format.save(self, path)
+
     def is_equivalent_to(self, other):
         """
         Checks if the current automaton is equivalent to a given one.
 
+        Two deterministic automata are compared with the union-find \
+        algorithm of Hopcroft and Karp, other automata with its extension \
+        up to congruence (HKC). Neither automaton is minimized.
+
         Parameters
         ----------
         other :
@@ -587,12 +820,44 @@ class FiniteAutomaton:
         >>> enfa.add_start_state(0)
         >>> enfa.add_final_state(1)
         >>> dfa = enfa.to_deterministic()
-        >>> dfa.is_deterministic()
+        >>> enfa.is_equivalent_to(dfa)
         True
 
         """
-        self_dfa = self.to_deterministic()
-        return self_dfa.is_equivalent_to(other)
+        return are_equivalent(self, other)
+
+    def get_distinguishing_word(self, other) -> Optional[List[Symbol]]:
+        """
+        Gives a shortest word accepted by exactly one of the current \
+        automaton and a given one
+
+        Parameters
+        ----------
+        other :
+            An other finite state automaton
+
+        Returns
+        -------
+        word : list of :class:`~pyformlang.finite_automaton.Symbol` or None
+            A shortest distinguishing word, or None if the two automata are \
+            equivalent
+
+        Examples
+        --------
+
+        >>> enfa0 = EpsilonNFA()
+        >>> enfa0.add_transitions([(0, "a", 0), (0, "b", 1)])
+        >>> enfa0.add_start_state(0)
+        >>> enfa0.add_final_state(1)
+        >>> enfa1 = EpsilonNFA()
+        >>> enfa1.add_transitions([(0, "a", 1), (1, "a", 0), (0, "b", 2)])
+        >>> enfa1.add_start_state(0)
+        >>> enfa1.add_final_state(2)
+        >>> enfa0.get_distinguishing_word(enfa1)
+        [a, b]
+
+        """
+        return get_distinguishing_word(self, other)
 
     def to_deterministic(self):
         """ Turns the automaton into a deterministic one"""
@@ -4,15 +4,22 @@ Represents an object of a finite state automaton
 
 from typing import Any
 
+from pyformlang.interning import InternedObject
 
-class FiniteAutomatonObject:  # pylint: disable=too-few-public-methods
+
+class FiniteAutomatonObject(InternedObject):
     """ Represents an object in a finite state automaton
 
+    The objects are interned: equal values usually give the same object.
+
     Parameters
     ----------
     value: any
         The value of the object
     """
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ["_value", "_hash"]
 
     def __init__(self, value: Any):
         self._value = value
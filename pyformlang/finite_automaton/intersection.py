@@ -0,0 +1,155 @@
+"""
+Emptiness of the intersection of several automata, without building their \
+product
+"""
+
+from collections import deque
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+from .bitset_nfa import BitsetNFA, iterate_bits
+from .search_word import get_word
+from .symbol import Symbol
+
+
+def intersection_is_empty(*automata: "EpsilonNFA") -> bool:
+    """ Checks whether no word is accepted by all the given automata
+
+    The product of the automata is explored on the fly and the search stops \
+    at the first tuple of final states. The product automaton is never \
+    built.
+
+    Parameters
+    ----------
+    *automata : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+        The automata to intersect, at least one
+
+    Returns
+    ----------
+    is_empty : bool
+        Whether the intersection of the languages is empty
+
+    Raises
+    --------
+    ValueError
+        If no automaton is given
+
+    Examples
+    --------
+
+    >>> enfa0 = EpsilonNFA()
+    >>> enfa0.add_transitions([(0, "a", 0), (0, "b", 1)])
+    >>> enfa0.add_start_state(0)
+    >>> enfa0.add_final_state(1)
+    >>> enfa1 = EpsilonNFA()
+    >>> enfa1.add_transitions([(0, "a", 1), (1, "a", 0), (0, "b", 2)])
+    >>> enfa1.add_start_state(0)
+    >>> enfa1.add_final_state(2)
+    >>> intersection_is_empty(enfa0, enfa1)
+    False
+
+    """
+    return get_intersection_witness(*automata) is None
+
+
+def get_intersection_witness(*automata: "EpsilonNFA") \
+        -> Optional[List[Symbol]]:
+    """ Gives a shortest word accepted by all the given automata
+
+    The tuples of states of the automata reached by the same words are \
+    explored breadth first, from the start states, until all the states of \
+    a tuple are final. The states from which no final state can be reached \
+    are discarded, and the transitions of a state are only computed when it \
+    is reached.
+
+    Parameters
+    ----------
+    *automata : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+        The automata to intersect, at least one
+
+    Returns
+    ----------
+    word : list of :class:`~pyformlang.finite_automaton.Symbol` or None
+        A shortest word accepted by all the automata, or None if the \
+        intersection is empty
+
+    Raises
+    --------
+    ValueError
+        If no automaton is given
+
+    Examples
+    --------
+
+    >>> enfa0 = EpsilonNFA()
+    >>> enfa0.add_transitions([(0, "a", 0), (0, "b", 1)])
+    >>> enfa0.add_start_state(0)
+    >>> enfa0.add_final_state(1)
+    >>> enfa1 = EpsilonNFA()
+    >>> enfa1.add_transitions([(0, "a", 1), (1, "a", 0), (0, "b", 2)])
+    >>> enfa1.add_start_state(0)
+    >>> enfa1.add_final_state(2)
+    >>> get_intersection_witness(enfa0, enfa1)
+    [b]
+
+    """
+    if not automata:
+        raise ValueError("At least one automaton is needed")
+    components = [_Component(automaton) for automaton in automata]
+    symbols = set(components[0].symbols)
+    for component in components[1:]:
+        symbols.intersection_update(component.symbols)
+    symbols = sorted(symbols, key=lambda symbol: str(symbol.value))
+    previous: Dict[Tuple[int, ...], Optional[Tuple[Tuple[int, ...],
+                                                   Symbol]]] = {}
+    to_process = deque()
+    for start in product(*[component.starts for component in components]):
+        if start not in previous:
+            previous[start] = None
+            to_process.append(start)
+    while to_process:
+        current = to_process.popleft()
+        if all(component.is_final(state)
+               for component, state in zip(components, current)):
+            return get_word(previous, current)
+        for symbol in symbols:
+            next_states = []
+            for component, state in zip(components, current):
+                next_states.append(component.get_next(state, symbol))
+                if not next_states[-1]:
+                    break
+            else:
+                for next_tuple in product(*next_states):
+                    if next_tuple not in previous:
+                        previous[next_tuple] = (current, symbol)
+                        to_process.append(next_tuple)
+    return None
+
+
+class _Component:
+    """ One of the automata of a product, with its transitions computed on \
+    demand
+
+    Each state stands for its epsilon closure. Only the states from which \
+    a final state can be reached are kept.
+    """
+
+    def __init__(self, enfa: "EpsilonNFA"):
+        self._bitset_nfa = BitsetNFA(enfa)
+        self._useful = self._bitset_nfa.useful
+        self.symbols = self._bitset_nfa.symbols
+        self.starts = list(iterate_bits(self._bitset_nfa.start & self._useful))
+        self._transitions: Dict[Tuple[int, Symbol], List[int]] = {}
+
+    def get_next(self, state: int, symbol: Symbol) -> List[int]:
+        """ Gives the useful states reached from a state by a symbol """
+        next_states = self._transitions.get((state, symbol))
+        if next_states is None:
+            next_states = list(iterate_bits(
+                self._bitset_nfa.get_next(1 << state, symbol) & self._useful))
+            self._transitions[(state, symbol)] = next_states
+        return next_states
+
+    def is_final(self, state: int) -> bool:
+        """ Whether a state is final """
+        return self._bitset_nfa.is_final(1 << state)
@@ -0,0 +1,251 @@
+"""
+A deterministic automaton built on the fly from an epsilon NFA
+"""
+
+from collections import OrderedDict
+from typing import Iterable, Any, List
+
+import numpy as np
+
+from .bitset_nfa import BitsetNFA
+from .epsilon import Epsilon
+from .finite_automaton import to_symbol
+from .matcher import Matcher
+from .symbol import Symbol
+
+
+class LazyDFA:  # pylint: disable=too-many-instance-attributes
+    """ A deterministic automaton built on the fly from an epsilon NFA
+
+    The states of the deterministic automaton are sets of states of the \
+    NFA. They are only built when an input reaches them, and their \
+    transitions are computed the first time they are used. The most \
+    recently used states are kept in a cache of bounded size, from which \
+    the least recently used ones are evicted.
+
+    When the cache thrashes during a run, i.e. when more states are evicted \
+    than the cache can hold, the rest of the input is read by simulating the \
+    NFA directly, without caching anything.
+
+    The lazy automaton is a snapshot: later modifications of the NFA are \
+    not reflected in it.
+
+    Parameters
+    ----------
+    enfa : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+        The automaton to determinize
+    max_states : int, optional
+        The maximum number of deterministic states kept in the cache
+
+    Examples
+    --------
+
+    >>> enfa = EpsilonNFA()
+    >>> enfa.add_transitions([(0, "a", 0), (0, "b", 0), (0, "a", 1), \
+    (1, "b", 2)])
+    >>> enfa.add_start_state(0)
+    >>> enfa.add_final_state(2)
+    >>> lazy_dfa = enfa.to_lazy_deterministic(max_states=100)
+    >>> lazy_dfa.accepts(["b", "a", "b"])
+    True
+    >>> lazy_dfa.accepts(["a", "b", "a", "b"])
+    True
+    >>> lazy_dfa.hits, lazy_dfa.misses
+    (3, 4)
+
+    """
+
+    def __init__(self, enfa: "EpsilonNFA", max_states: int = 10000):
+        if max_states < 1:
+            raise ValueError("The cache must hold at least one state")
+        self._bitset_nfa = BitsetNFA(enfa)
+        self._max_states = max_states
+        self._start = self._bitset_nfa.start & self._bitset_nfa.useful
+        # Deterministic states to their known transitions, by recency
+        self._transitions = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.fallbacks = 0
+
+    @property
+    def max_states(self) -> int:
+        """ The maximum number of deterministic states kept in the cache """
+        return self._max_states
+
+    @property
+    def number_cached_states(self) -> int:
+        """ The number of deterministic states currently in the cache """
+        return len(self._transitions)
+
+    @property
+    def symbols(self) -> List[Symbol]:
+        """ The symbols of the NFA """
+        return self._bitset_nfa.symbols
+
+    @property
+    def start(self) -> int:
+        """ The start state, as a bitset of states of the NFA """
+        return self._start
+
+    def reset_statistics(self):
+        """ Sets the hit, miss, eviction and fallback counters back to zero \
+        """
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.fallbacks = 0
+
+    def clear(self):
+        """ Empties the cache """
+        self._transitions.clear()
+
+    def is_final(self, current: int) -> bool:
+        """ Whether a deterministic state is final
+
+        Parameters
+        ----------
+        current : int
+            A deterministic state, as a bitset of states of the NFA
+
+        Returns
+        ----------
+        is_final : bool
+            Whether the state is final
+        """
+        return self._bitset_nfa.is_final(current)
+
+    def get_next(self, current: int, symbol: Any) -> int:
+        """ Gives the deterministic state reached by reading a symbol, \
+        through the cache
+
+        Parameters
+        ----------
+        current : int
+            A deterministic state, as a bitset of states of the NFA
+        symbol : :class:`~pyformlang.finite_automaton.Symbol`
+            The symbol to read, or its value
+
+        Returns
+        ----------
+        next_state : int
+            The next deterministic state. Zero is the dead state.
+        """
+        transitions = self._transitions.get(current)
+        if transitions is None:
+            transitions = {}
+            self._transitions[current] = transitions
+            if len(self._transitions) > self._max_states:
+                self._transitions.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._transitions.move_to_end(current)
+        next_state = transitions.get(symbol)
+        if next_state is None:
+            self.misses += 1
+            next_state = self._compute_next(current, symbol)
+            transitions[symbol] = next_state
+        else:
+            self.hits += 1
+        return next_state
+
+    def _compute_next(self, current: int, symbol: Any) -> int:
+        """ Gives the next deterministic state, without the cache """
+        symbol = to_symbol(symbol)
+        if symbol == Epsilon():
+            return current
+        return self._bitset_nfa.get_next(current, symbol) \
+            & self._bitset_nfa.useful
+
+    def accepts(self, word: Iterable[Any]) -> bool:
+        """ Checks whether the automaton accepts a given word
+
+        Parameters
+        ----------
+        word : iterable of :class:`~pyformlang.finite_automaton.Symbol`
+            A sequence of input symbols, or of their values
+
+        Returns
+        ----------
+        is_accepted : bool
+            Whether the word is accepted or not
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "a", 1), (1, "b", 2)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(2)
+        >>> enfa.to_lazy_deterministic().accepts(["a", "b"])
+        True
+
+        """
+        current = self._start
+        if not current:
+            return False
+        evictions_limit = self.evictions + self._max_states
+        word = iter(word)
+        for symbol in word:
+            current = self.get_next(current, symbol)
+            if not current:
+                return False
+            if self.evictions > evictions_limit:
+                self.fallbacks += 1
+                for symbol_left in word:
+                    current = self._compute_next(current, symbol_left)
+                    if not current:
+                        return False
+        return self.is_final(current)
+
+    def accepts_many(self, words: Iterable[Iterable[Any]]) -> np.ndarray:
+        """ Checks which words of a collection are accepted
+
+        Parameters
+        ----------
+        words : iterable of iterables of \
+        :class:`~pyformlang.finite_automaton.Symbol`
+            The words to check
+
+        Returns
+        ----------
+        are_accepted : numpy.ndarray of bool
+            For each word, whether it is accepted or not
+        """
+        return np.array([self.accepts(word) for word in words], dtype=bool)
+
+    def matcher(self) -> "LazyDFAMatcher":
+        """ Gives an incremental matcher running on the lazy automaton
+
+        Returns
+        ----------
+        matcher : :class:`~pyformlang.finite_automaton.LazyDFAMatcher`
+            A new matcher, at the beginning of the input
+        """
+        return LazyDFAMatcher(self)
+
+
+class LazyDFAMatcher(Matcher):
+    """ An incremental matcher running on a lazy deterministic automaton
+
+    Parameters
+    ----------
+    lazy_dfa : :class:`~pyformlang.finite_automaton.LazyDFA`
+        The lazy automaton
+    """
+
+    def __init__(self, lazy_dfa: LazyDFA):
+        self._lazy_dfa = lazy_dfa
+        super().__init__()
+
+    def _get_start(self):
+        return self._lazy_dfa.start
+
+    def _get_next(self, current, symbol):
+        return self._lazy_dfa.get_next(current, symbol)
+
+    def _is_final(self, current):
+        return self._lazy_dfa.is_final(current)
+
+    def _is_dead(self, current):
+        return not current
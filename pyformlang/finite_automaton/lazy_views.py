@@ -0,0 +1,586 @@
+"""
+Boolean combinations of automata, determinized on demand
+"""
+
+from collections import deque
+from typing import Any, Iterable, Set, Union
+
+from .epsilon import Epsilon
+from .finite_automaton import to_symbol
+from .lazy_dfa import LazyDFA
+from .matcher import Matcher
+from .symbol import Symbol
+
+
+class LazyView:
+    """ A deterministic view of a language, whose states are only built \
+    when they are reached
+
+    The views combine: the complement, union and difference of views are \
+    views too. The transitions computed by a view are kept, so that later \
+    calls reuse them.
+
+    This class cannot be used directly, use the lazy_complement, \
+    lazy_union, lazy_difference or to_lazy_view methods of an automaton \
+    instead.
+
+    Parameters
+    ----------
+    symbols : set of :class:`~pyformlang.finite_automaton.Symbol`
+        The symbols which can appear in an accepted word
+
+    Examples
+    --------
+
+    >>> enfa0 = EpsilonNFA()
+    >>> enfa0.add_transitions([(0, "a", 0), (0, "b", 1)])
+    >>> enfa0.add_start_state(0)
+    >>> enfa0.add_final_state(1)
+    >>> enfa1 = EpsilonNFA()
+    >>> enfa1.add_transitions([(0, "a", 1), (1, "a", 0), (0, "b", 2)])
+    >>> enfa1.add_start_state(0)
+    >>> enfa1.add_final_state(2)
+    >>> view = enfa0.lazy_difference(enfa1)
+    >>> view.accepts(["a", "b"])
+    True
+    >>> view.accepts(["a", "a", "b"])
+    False
+    >>> view.lazy_complement().accepts(["a", "a", "b"])
+    True
+    >>> view.is_empty()
+    False
+
+    """
+
+    def __init__(self, symbols: Iterable[Symbol]):
+        self._symbols = frozenset(symbols)
+        # The known transitions of each state
+        self._transitions = {}
+
+    @property
+    def symbols(self) -> Set[Symbol]:
+        """ The symbols which can appear in an accepted word """
+        return self._symbols
+
+    @property
+    def start(self) -> Any:
+        """ The start state """
+        raise NotImplementedError
+
+    def is_final(self, current: Any) -> bool:
+        """ Whether a state is final
+
+        Parameters
+        ----------
+        current : any
+            A state of the view
+
+        Returns
+        ----------
+        is_final : bool
+            Whether the state is final
+        """
+        raise NotImplementedError
+
+    def is_dead(self, current: Any) -> bool:
+        """ Whether no word is accepted from a state
+
+        A state may be reported alive even though no word is accepted from \
+        it, but never the opposite.
+
+        Parameters
+        ----------
+        current : any
+            A state of the view
+
+        Returns
+        ----------
+        is_dead : bool
+            Whether the state is known to be dead
+        """
+        raise NotImplementedError
+
+    def get_next(self, current: Any, symbol: Any) -> Any:
+        """ Gives the state reached by reading a symbol
+
+        Parameters
+        ----------
+        current : any
+            A state of the view
+        symbol : :class:`~pyformlang.finite_automaton.Symbol`
+            The symbol to read, or its value
+
+        Returns
+        ----------
+        next_state : any
+            The next state
+        """
+        transitions = self._transitions.get(current)
+        if transitions is None:
+            transitions = {}
+            self._transitions[current] = transitions
+        if symbol in transitions:
+            return transitions[symbol]
+        next_state = self._compute_next(current, symbol)
+        transitions[symbol] = next_state
+        return next_state
+
+    def _compute_next(self, current: Any, symbol: Any) -> Any:
+        """ Gives the next state, without the memory of the view """
+        raise NotImplementedError
+
+    def clear(self):
+        """ Forgets the transitions computed so far by the view """
+        self._transitions.clear()
+
+    def accepts(self, word: Iterable[Any]) -> bool:
+        """ Checks whether the view accepts a given word
+
+        Parameters
+        ----------
+        word : iterable of :class:`~pyformlang.finite_automaton.Symbol`
+            A sequence of input symbols, or of their values
+
+        Returns
+        ----------
+        is_accepted : bool
+            Whether the word is accepted or not
+        """
+        current = self.start
+        for symbol in word:
+            if self.is_dead(current):
+                return False
+            current = self.get_next(current, symbol)
+        return self.is_final(current)
+
+    def matcher(self) -> "LazyViewMatcher":
+        """ Gives an incremental matcher running on the view
+
+        Returns
+        ----------
+        matcher : :class:`~pyformlang.finite_automaton.LazyViewMatcher`
+            A new matcher, at the beginning of the input
+        """
+        return LazyViewMatcher(self)
+
+    def is_empty(self) -> bool:
+        """ Whether the view accepts no word
+
+        The states are explored breadth first from the start state, and \
+        the search stops at the first final state.
+
+        Returns
+        ----------
+        is_empty : bool
+            Whether the language of the view is empty
+        """
+        symbols = list(self._symbols)
+        start = self.start
+        visited = {start}
+        to_process = deque([start])
+        while to_process:
+            current = to_process.popleft()
+            if self.is_final(current):
+                return False
+            for symbol in symbols:
+                next_state = self.get_next(current, symbol)
+                if next_state not in visited and \
+                        not self.is_dead(next_state):
+                    visited.add(next_state)
+                    to_process.append(next_state)
+        return True
+
+    def lazy_complement(self) -> "LazyComplement":
+        """ Gives a view of the words over the symbols of the current view \
+        which it does not accept
+
+        Returns
+        ----------
+        view : :class:`~pyformlang.finite_automaton.LazyComplement`
+            The complement of the view
+        """
+        return LazyComplement(self)
+
+    def lazy_union(self, other: Union["LazyView", "EpsilonNFA"]) \
+            -> "LazyUnion":
+        """ Gives a view of the words accepted by the current view or by \
+        another one
+
+        Parameters
+        ----------
+        other : :class:`~pyformlang.finite_automaton.LazyView` or \
+        :class:`~pyformlang.finite_automaton.EpsilonNFA`
+            The other view, or an automaton
+
+        Returns
+        ----------
+        view : :class:`~pyformlang.finite_automaton.LazyUnion`
+            The union of the views
+        """
+        return LazyUnion(self, to_lazy_view(other))
+
+    def lazy_difference(self, other: Union["LazyView", "EpsilonNFA"]) \
+            -> "LazyDifference":
+        """ Gives a view of the words accepted by the current view but not \
+        by another one
+
+        Parameters
+        ----------
+        other : :class:`~pyformlang.finite_automaton.LazyView` or \
+        :class:`~pyformlang.finite_automaton.EpsilonNFA`
+            The other view, or an automaton
+
+        Returns
+        ----------
+        view : :class:`~pyformlang.finite_automaton.LazyDifference`
+            The difference of the views
+        """
+        return LazyDifference(self, to_lazy_view(other))
+
+
+class LazyAutomatonView(LazyView):
+    """ A view of the language of an epsilon NFA, through a lazy \
+    deterministic automaton
+
+    The states are the ones of the lazy deterministic automaton, and its \
+    cache holds the transitions.
+
+    Parameters
+    ----------
+    lazy_dfa : :class:`~pyformlang.finite_automaton.LazyDFA`
+        The lazy deterministic automaton
+    """
+
+    def __init__(self, lazy_dfa: LazyDFA):
+        super().__init__(lazy_dfa.symbols)
+        self._lazy_dfa = lazy_dfa
+
+    @property
+    def start(self) -> int:
+        return self._lazy_dfa.start
+
+    def is_final(self, current: int) -> bool:
+        return self._lazy_dfa.is_final(current)
+
+    def is_dead(self, current: int) -> bool:
+        return not current
+
+    def get_next(self, current: int, symbol: Any) -> int:
+        return self._lazy_dfa.get_next(current, symbol)
+
+    def _compute_next(self, current: int, symbol: Any) -> int:
+        return self._lazy_dfa.get_next(current, symbol)
+
+    def clear(self):
+        self._lazy_dfa.clear()
+
+
+class LazyComplement(LazyView):
+    """ A view of the words over the symbols of another view which it does \
+    not accept
+
+    A state is a state of the other view, or a rejecting sink of the \
+    complement once a symbol outside of the alphabet has been read.
+
+    Parameters
+    ----------
+    operand : :class:`~pyformlang.finite_automaton.LazyView`
+        The view to complement
+    """
+
+    def __init__(self, operand: LazyView):
+        super().__init__(operand.symbols)
+        self._operand = operand
+        self._sink = object()
+
+    @property
+    def start(self) -> Any:
+        return self._operand.start
+
+    def is_final(self, current: Any) -> bool:
+        return current is not self._sink and \
+            not self._operand.is_final(current)
+
+    def is_dead(self, current: Any) -> bool:
+        return current is self._sink
+
+    def _compute_next(self, current: Any, symbol: Any) -> Any:
+        symbol = to_symbol(symbol)
+        if symbol == Epsilon():
+            return current
+        if current is self._sink or symbol not in self._symbols:
+            return self._sink
+        return self._operand.get_next(current, symbol)
+
+
+class LazyUnion(LazyView):
+    """ A view of the words accepted by at least one of two views
+
+    A state is a pair of states of the two views.
+
+    Parameters
+    ----------
+    left, right : :class:`~pyformlang.finite_automaton.LazyView`
+        The views to combine
+    """
+
+    def __init__(self, left: LazyView, right: LazyView):
+        super().__init__(left.symbols.union(right.symbols))
+        self._left = left
+        self._right = right
+
+    @property
+    def start(self) -> Any:
+        return self._left.start, self._right.start
+
+    def is_final(self, current: Any) -> bool:
+        return self._left.is_final(current[0]) or \
+            self._right.is_final(current[1])
+
+    def is_dead(self, current: Any) -> bool:
+        return self._left.is_dead(current[0]) and \
+            self._right.is_dead(current[1])
+
+    def _compute_next(self, current: Any, symbol: Any) -> Any:
+        return (self._left.get_next(current[0], symbol),
+                self._right.get_next(current[1], symbol))
+
+
+class LazyDifference(LazyView):
+    """ A view of the words accepted by a view but not by another one
+
+    A state is a pair of states of the two views.
+
+    Parameters
+    ----------
+    left : :class:`~pyformlang.finite_automaton.LazyView`
+        The view whose words are kept
+    right : :class:`~pyformlang.finite_automaton.LazyView`
+        The view whose words are removed
+    """
+
+    def __init__(self, left: LazyView, right: LazyView):
+        super().__init__(left.symbols)
+        self._left = left
+        self._right = right
+
+    @property
+    def start(self) -> Any:
+        return self._left.start, self._right.start
+
+    def is_final(self, current: Any) -> bool:
+        return self._left.is_final(current[0]) and \
+            not self._right.is_final(current[1])
+
+    def is_dead(self, current: Any) -> bool:
+        return self._left.is_dead(current[0])
+
+    def _compute_next(self, current: Any, symbol: Any) -> Any:
+        return (self._left.get_next(current[0], symbol),
+                self._right.get_next(current[1], symbol))
+
+
+class LazyViewMatcher(Matcher):
+    """ An incremental matcher running on a lazy view
+
+    Parameters
+    ----------
+    view : :class:`~pyformlang.finite_automaton.LazyView`
+        The view
+    """
+
+    def __init__(self, view: LazyView):
+        self._view = view
+        super().__init__()
+
+    def _get_start(self):
+        return self._view.start
+
+    def _get_next(self, current, symbol):
+        return self._view.get_next(current, symbol)
+
+    def _is_final(self, current):
+        return self._view.is_final(current)
+
+    def _is_dead(self, current):
+        return self._view.is_dead(current)
+
+
+def to_lazy_view(automaton: Union[LazyView, LazyDFA, "EpsilonNFA"]) \
+        -> LazyView:
+    """ Gives a lazy view of an automaton, or the view itself
+
+    Parameters
+    ----------
+    automaton : :class:`~pyformlang.finite_automaton.LazyView` or \
+    :class:`~pyformlang.finite_automaton.LazyDFA` or \
+    :class:`~pyformlang.finite_automaton.EpsilonNFA`
+        A view or an automaton
+
+    Returns
+    ----------
+    view : :class:`~pyformlang.finite_automaton.LazyView`
+        The view
+    """
+    if isinstance(automaton, LazyView):
+        return automaton
+    if isinstance(automaton, LazyDFA):
+        return LazyAutomatonView(automaton)
+    return automaton.to_lazy_view()
+
+
+class LazyViewMixin:
+    """ Gives the lazily determinized views of epsilon NFAs and their \
+    boolean combinations
+    """
+
+    def to_lazy_deterministic(self, max_states: int = 10000) -> LazyDFA:
+        """ Gives a deterministic automaton equivalent to the epsilon-nfa, \
+        whose states are only built when an input reaches them
+
+        Parameters
+        ----------
+        max_states : int, optional
+            The maximum number of deterministic states kept in memory
+
+        Returns
+        ----------
+        lazy_dfa :  :class:`~pyformlang.finite_automaton.LazyDFA`
+            A lazy dfa equivalent to the current nfa
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "abc", 1), (0, "d", 1), \
+        (0, "epsilon", 2)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> lazy_dfa = enfa.to_lazy_deterministic(max_states=100)
+        >>> lazy_dfa.accepts(["d"])
+        True
+
+        """
+        return LazyDFA(self, max_states)
+
+    def to_lazy_view(self) -> LazyView:
+        """ Gives a view of the language of the epsilon-nfa, which can be \
+        combined with other views and is determinized on demand
+
+        The view is kept until the automaton is modified, so that the \
+        states computed by a query are reused by the next ones.
+
+        Returns
+        ----------
+        view :  :class:`~pyformlang.finite_automaton.LazyView`
+            A lazy view of the current nfa
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "a", 1), (1, "b", 2)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(2)
+        >>> enfa.to_lazy_view().accepts(["a", "b"])
+        True
+
+        """
+        view = self._cache.get("lazy_view")
+        if view is None:
+            view = LazyAutomatonView(self.to_lazy_deterministic())
+            self._cache["lazy_view"] = view
+        return view
+
+    def lazy_complement(self) -> LazyComplement:
+        """ Gives a view of the complement of the epsilon-nfa, without \
+        determinizing it up front
+
+        The complement is taken over the symbols of the automaton, as in \
+        get_complement.
+
+        Returns
+        ----------
+        view :  :class:`~pyformlang.finite_automaton.LazyComplement`
+            A lazy view of the complement
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "a", 1), (1, "b", 2)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(2)
+        >>> complement = enfa.lazy_complement()
+        >>> complement.accepts(["a", "b"])
+        False
+        >>> complement.accepts(["b", "a"])
+        True
+
+        """
+        return self.to_lazy_view().lazy_complement()
+
+    def lazy_union(self, other) -> LazyUnion:
+        """ Gives a view of the union with another automaton or view, \
+        without building it up front
+
+        Parameters
+        ----------
+        other : :class:`~pyformlang.finite_automaton.EpsilonNFA` or \
+        :class:`~pyformlang.finite_automaton.LazyView`
+            The other automaton, or a view
+
+        Returns
+        ----------
+        view :  :class:`~pyformlang.finite_automaton.LazyUnion`
+            A lazy view of the union
+
+        Examples
+        --------
+
+        >>> enfa0 = EpsilonNFA()
+        >>> enfa0.add_transition(0, "a", 1)
+        >>> enfa0.add_start_state(0)
+        >>> enfa0.add_final_state(1)
+        >>> enfa1 = EpsilonNFA()
+        >>> enfa1.add_transition(0, "b", 1)
+        >>> enfa1.add_start_state(0)
+        >>> enfa1.add_final_state(1)
+        >>> enfa0.lazy_union(enfa1).accepts(["b"])
+        True
+
+        """
+        return self.to_lazy_view().lazy_union(to_lazy_view(other))
+
+    def lazy_difference(self, other) -> LazyDifference:
+        """ Gives a view of the difference with another automaton or view, \
+        without building it up front
+
+        Parameters
+        ----------
+        other : :class:`~pyformlang.finite_automaton.EpsilonNFA` or \
+        :class:`~pyformlang.finite_automaton.LazyView`
+            The other automaton, or a view
+
+        Returns
+        ----------
+        view :  :class:`~pyformlang.finite_automaton.LazyDifference`
+            A lazy view of the difference
+
+        Examples
+        --------
+
+        >>> enfa0 = EpsilonNFA()
+        >>> enfa0.add_transitions([(0, "a", 1), (0, "b", 1)])
+        >>> enfa0.add_start_state(0)
+        >>> enfa0.add_final_state(1)
+        >>> enfa1 = EpsilonNFA()
+        >>> enfa1.add_transition(0, "b", 1)
+        >>> enfa1.add_start_state(0)
+        >>> enfa1.add_final_state(1)
+        >>> difference = enfa0.lazy_difference(enfa1)
+        >>> difference.accepts(["a"]), difference.accepts(["b"])
+        (True, False)
+
+        """
+        return self.to_lazy_view().lazy_difference(to_lazy_view(other))
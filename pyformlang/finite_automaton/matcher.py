@@ -0,0 +1,273 @@
+"""
+Incremental matchers, reading a word symbol by symbol
+"""
+
+from typing import Iterable, Any
+
+import numpy as np
+
+from .bitset_nfa import BitsetNFA
+from .epsilon import Epsilon
+from .finite_automaton import to_symbol
+from .symbol import Symbol
+
+
+class Matcher:
+    """ An incremental matcher
+
+    A matcher reads a word by chunks, as they arrive, and can tell at any \
+    time whether the symbols read so far form an accepted word. It also \
+    detects when no continuation of the input can be accepted anymore, in \
+    which case it stops reading.
+
+    This class cannot be used directly, use the matcher method of an \
+    automaton instead.
+
+    Examples
+    --------
+
+    >>> enfa = EpsilonNFA()
+    >>> enfa.add_transitions([(0, "a", 1), (1, "b", 0)])
+    >>> enfa.add_start_state(0)
+    >>> enfa.add_final_state(1)
+    >>> matcher = enfa.matcher()
+    >>> matcher.feed(["a", "b"])
+    True
+    >>> matcher.is_accepting()
+    False
+    >>> matcher.feed(["a"])
+    True
+    >>> matcher.is_accepting()
+    True
+    >>> matcher.feed(["a"])
+    False
+    >>> matcher.is_dead()
+    True
+
+    """
+
+    def __init__(self):
+        self._current = self._get_start()
+
+    def _get_start(self):
+        """ Gives the start configuration """
+        raise NotImplementedError
+
+    def _get_next(self, current, symbol: Any):
+        """ Gives the configuration reached after reading a symbol """
+        raise NotImplementedError
+
+    def _is_final(self, current) -> bool:
+        """ Whether a configuration is accepting """
+        raise NotImplementedError
+
+    def _is_dead(self, current) -> bool:
+        """ Whether no word can be accepted from a configuration """
+        raise NotImplementedError
+
+    def feed(self, chunk: Iterable[Any]) -> bool:
+        """ Reads the next symbols
+
+        Parameters
+        ----------
+        chunk : iterable of :class:`~pyformlang.finite_automaton.Symbol`
+            The next symbols of the input, or their values. The reading \
+            stops as soon as the matcher is dead.
+
+        Returns
+        ----------
+        is_alive : bool
+            Whether some continuation of the input can still be accepted
+        """
+        current = self._current
+        is_dead = self._is_dead(current)
+        if not is_dead:
+            for symbol in chunk:
+                current = self._get_next(current, symbol)
+                is_dead = self._is_dead(current)
+                if is_dead:
+                    break
+        self._current = current
+        return not is_dead
+
+    def is_accepting(self) -> bool:
+        """ Whether the symbols read so far form an accepted word
+
+        Returns
+        ----------
+        is_accepting : bool
+            Whether the input read so far is accepted
+        """
+        return self._is_final(self._current)
+
+    def is_dead(self) -> bool:
+        """ Whether no continuation of the input can be accepted anymore
+
+        Returns
+        ----------
+        is_dead : bool
+            Whether the matcher is dead
+        """
+        return self._is_dead(self._current)
+
+    def reset(self):
+        """ Goes back to the beginning of the input """
+        self._current = self._get_start()
+
+
+class DFAMatcher(Matcher):
+    """ An incremental matcher running on a compiled deterministic automaton
+
+    Parameters
+    ----------
+    compiled : :class:`~pyformlang.finite_automaton.CompiledDFA`
+        The compiled automaton
+    """
+
+    def __init__(self, compiled: "CompiledDFA"):
+        self._compiled = compiled
+        super().__init__()
+
+    def _get_start(self):
+        return self._compiled.start_state_id
+
+    def _get_next(self, current, symbol):
+        return self._compiled.transition_table[
+            current, self._compiled.get_symbol_id(symbol)]
+
+    def _is_final(self, current):
+        return bool(self._compiled.final_states_mask[current])
+
+    def _is_dead(self, current):
+        return current == self._compiled.dead_state_id
+
+    def feed(self, chunk: Iterable[Any]) -> bool:
+        # pylint: disable=protected-access
+        rows = self._compiled._rows
+        get_id = self._compiled._symbol_ids.get
+        unknown = self._compiled._unknown_symbol
+        dead = self._compiled.dead_state_id
+        current = self._current
+        if current != dead:
+            for symbol in chunk:
+                current = rows[current][get_id(symbol, unknown)]
+                if current == dead:
+                    break
+        self._current = current
+        return current != dead
+
+
+class NFAMatcher(Matcher):
+    """ An incremental matcher simulating an epsilon nondeterministic \
+    automaton
+
+    The current configuration is a bitset of states. Only the states from \
+    which a final state can be reached are kept in it, so that the matcher \
+    dies as soon as possible.
+
+    Parameters
+    ----------
+    enfa : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+        The automaton to simulate
+    """
+
+    def __init__(self, enfa: "EpsilonNFA"):
+        self._bitset_nfa = BitsetNFA(enfa)
+        self._useful = self._bitset_nfa.useful
+        super().__init__()
+
+    def _get_start(self):
+        return self._bitset_nfa.start & self._useful
+
+    def _get_next(self, current, symbol):
+        symbol = to_symbol(symbol)
+        if symbol == Epsilon():
+            return current
+        return self._bitset_nfa.get_next(current, symbol) & self._useful
+
+    def _is_final(self, current):
+        return self._bitset_nfa.is_final(current)
+
+    def _is_dead(self, current):
+        return not current
+
+
+class MembershipMixin:
+    """ Gives the membership checks of epsilon NFAs beyond accepts: the \
+    incremental matchers and the batched checks
+    """
+
+    def matcher(self) -> NFAMatcher:
+        """ Gives an incremental matcher, which reads the input by chunks
+
+        Returns
+        ----------
+        matcher : :class:`~pyformlang.finite_automaton.NFAMatcher`
+            A new matcher, at the beginning of the input
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "a", 1), (1, "b", 0)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> matcher = enfa.matcher()
+        >>> matcher.feed(["a", "b"])
+        True
+        >>> matcher.is_accepting()
+        False
+        >>> matcher.feed(["b"])
+        False
+
+        """
+        return NFAMatcher(self)
+
+    def accepts_many(self, words: Iterable[Iterable[Symbol]]) -> np.ndarray:
+        """ Checks which words of a collection are accepted
+
+        The sets of current states, represented as bitsets, are shared \
+        across the whole collection, so that each transition between two \
+        such sets is computed only once.
+
+        Parameters
+        ----------
+        words : iterable of iterables of \
+        :class:`~pyformlang.finite_automaton.Symbol`
+            The words to check
+
+        Returns
+        ----------
+        are_accepted : numpy.ndarray of bool
+            For each word, whether it is accepted or not
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "abc", 1), (0, "d", 1), \
+        (0, "epsilon", 2)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> enfa.accepts_many([["abc"], ["d", "d"], []])
+        array([ True, False, False])
+
+        """
+        bitset_nfa = BitsetNFA(self)
+        transitions = {}
+        res = []
+        for word in words:
+            current_states = bitset_nfa.start
+            for symbol in word:
+                symbol = to_symbol(symbol)
+                if symbol == Epsilon():
+                    continue
+                next_states = transitions.setdefault(current_states, {})
+                if symbol not in next_states:
+                    next_states[symbol] = bitset_nfa.get_next(current_states,
+                                                              symbol)
+                current_states = next_states[symbol]
+                if not current_states:
+                    break
+            res.append(bitset_nfa.is_final(current_states))
+        return np.array(res, dtype=bool)
@@ -0,0 +1,107 @@
+"""
+Choice of the minimization algorithm of epsilon NFAs
+"""
+
+# pylint: disable=cyclic-import
+from pyformlang import finite_automaton
+
+from .state import State
+
+MINIMIZATION_ALGORITHMS = ("auto", "hopcroft", "valmari", "moore",
+                           "brzozowski")
+# Above this number of transitions per state and symbol, "auto" minimizes
+# nondeterministic automata with Brzozowski's algorithm
+DENSE_NFA_DENSITY = 1.5
+
+
+class MinimizationMixin:  # pylint: disable=too-few-public-methods
+    """ Gives the minimization of epsilon NFAs, the minimization of the \
+    deterministic automata being left to them
+    """
+
+    def minimize(self, algorithm: str = "auto",
+                 return_origins: bool = False):
+        """ Minimize the current epsilon NFA
+
+        Parameters
+        ----------
+        algorithm : str, optional
+            The minimization algorithm, among "hopcroft", "valmari", \
+            "moore", "brzozowski" and "auto" (default). Except for \
+            "brzozowski", which reverses and determinizes the automaton \
+            twice, the automaton is first determinized. See \
+            :meth:`~pyformlang.finite_automaton.DeterministicFiniteAutomaton\
+.minimize`. With "auto", Brzozowski's algorithm is used when there are \
+            many transitions per state and symbol, as the determinization \
+            is then likely to blow up.
+        return_origins : bool, optional
+            Whether to also give the states of the current automaton merged \
+            into each state of the minimal DFA. Brzozowski's algorithm \
+            cannot give them, and is not chosen by "auto" in this case.
+
+        Returns
+        ----------
+        dfa : :class:`~pyformlang.deterministic_finite_automaton\
+        .DeterministicFiniteAutomaton`
+            The minimal DFA
+        origins : dict of :class:`~pyformlang.finite_automaton.State` to \
+        frozenset of :class:`~pyformlang.finite_automaton.State`
+            Only given if return_origins is True. The set of states of the \
+            current automaton of each state of the minimal DFA.
+
+        Raises
+        ----------
+        ValueError
+            If the algorithm is unknown, or if it is "brzozowski" and \
+            return_origins is True
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "abc", 1), (0, "d", 1), \
+        (0, "epsilon", 2)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> dfa_minimal = enfa.minimize()
+        >>> dfa_minimal.is_equivalent_to(enfa)
+        True
+        >>> dfa_minimal = enfa.minimize(algorithm="brzozowski")
+        >>> dfa_minimal.is_equivalent_to(enfa)
+        True
+
+        """
+        if algorithm not in MINIMIZATION_ALGORITHMS:
+            raise ValueError("Unknown minimization algorithm: " + algorithm)
+        if return_origins:
+            if algorithm == "brzozowski":
+                raise ValueError("Brzozowski's algorithm cannot give the "
+                                 "origins of the states")
+            dfa, subsets = self.to_deterministic(return_origins=True)
+            minimal_dfa, classes = dfa.minimize(algorithm,
+                                                return_origins=True)
+            origins = {state: frozenset().union(*[subsets[old_state]
+                                                  for old_state in group])
+                       for state, group in classes.items()}
+            return minimal_dfa, origins
+        if algorithm == "auto" and self._is_dense():
+            algorithm = "brzozowski"
+        if algorithm == "brzozowski":
+            return self._minimize_brzozowski()
+        return self.to_deterministic().minimize(algorithm)
+
+    def _is_dense(self) -> bool:
+        """ Whether there are many transitions per state and symbol """
+        n_symbols = max(len(self._input_symbols), 1)
+        n_states = max(len(self._states), 1)
+        return self.get_number_transitions() \
+            >= DENSE_NFA_DENSITY * n_states * n_symbols
+
+    def _minimize_brzozowski(self) -> "DeterministicFiniteAutomaton":
+        """ Minimize with Brzozowski's algorithm: reversing and \
+        determinizing twice gives the minimal DFA """
+        dfa = self.reverse().to_deterministic().reverse().to_deterministic()
+        if not dfa.final_states:
+            dfa = finite_automaton.DeterministicFiniteAutomaton()
+            dfa.add_start_state(State(0))
+        return dfa
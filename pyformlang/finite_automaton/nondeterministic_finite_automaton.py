@@ -15,6 +15,7 @@ from .transition_function import InvalidEpsilonTransition
 
 
 class NondeterministicFiniteAutomaton(EpsilonNFA):
+    # pylint: disable=too-many-ancestors
     """ Represents a nondeterministic finite automaton
 
     This class represents a nondeterministic finite automaton, where epsilon \
@@ -116,14 +117,36 @@ class NondeterministicFiniteAutomaton(EpsilonNFA):
         return len(self._start_state) <= 1 and \
             self._transition_function.is_deterministic()
 
-    def to_deterministic(self) -> "DeterministicFiniteAutomaton":
+    def to_deterministic(self, return_origins: bool = False,
+                         workers: int = 1):
         """ Transforms the nfa into a dfa
 
+        The states of the dfa are numbered from 0, the start state being 0.
+
+        Parameters
+        ----------
+        return_origins : bool, optional
+            Whether to also give the states of the nfa merged into each \
+            state of the dfa
+        workers : int, optional
+            The number of processes exploring the subsets of states, 1 by \
+            default. With several workers, the states are numbered \
+            differently.
+
         Returns
         ----------
         dfa :  :class:`~pyformlang.deterministic_finite_automaton\
         .DeterministicFiniteAutomaton`
             A dfa equivalent to the current nfa
+        origins : dict of :class:`~pyformlang.finite_automaton.State` to \
+        frozenset of :class:`~pyformlang.finite_automaton.State`
+            Only given if return_origins is True. The set of states of the \
+            nfa of each state of the dfa.
+
+        Raises
+        ----------
+        ValueError
+            If the number of workers is not positive
 
         Examples
         --------
@@ -137,7 +160,8 @@ class NondeterministicFiniteAutomaton(EpsilonNFA):
         True
 
         """
-        return self._to_deterministic_internal(False)
+        return self._to_deterministic_internal(False, return_origins,
+                                               workers)
 
     def add_transition(self,
                        s_from: State,
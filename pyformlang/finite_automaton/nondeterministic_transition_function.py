@@ -97,6 +97,31 @@ class NondeterministicTransitionFunction:
             return 1
         return 0
 
+    def copy(self) -> "NondeterministicTransitionFunction":
+        """ Copies the transition function
+
+        Returns
+        ----------
+        copied : \
+        :class:`~pyformlang.finite_automaton.NondeterministicTransitionFunction`
+            An independent copy of the function
+
+        Examples
+        --------
+
+        >>> transition = NondeterministicTransitionFunction()
+        >>> transition.add_transition(State(0), Symbol("a"), State(1))
+        >>> transition.copy().get_number_transitions()
+        1
+
+        """
+        copied = NondeterministicTransitionFunction()
+        copied._transitions = {  # pylint: disable=protected-access
+            s_from: {symbol: set(next_states)
+                     for symbol, next_states in transitions.items()}
+            for s_from, transitions in self._transitions.items()}
+        return copied
+
     def get_number_transitions(self) -> int:
         """ Gives the number of transitions describe by the function
 
@@ -0,0 +1,142 @@
+"""
+Subset construction spread over several processes
+"""
+
+from multiprocessing import Pool
+from typing import Dict, List, Tuple
+
+from .bitset_nfa import BitsetNFA, move
+
+# Below this number of subsets, a frontier is explored by the main process
+MIN_PARALLEL_FRONTIER = 64
+# The number of chunks given to each worker for each frontier
+CHUNKS_PER_WORKER = 4
+
+# The transition tables of the automaton, in each worker
+_WORKER_TABLES: List[Tuple[int, Dict[int, int]]] = []
+
+
+def explore_subsets(bitset_nfa: BitsetNFA, start: int, workers: int) \
+        -> Tuple[List[int], List[Tuple[int, int, int]]]:
+    """ Explores the subsets of states reachable from a start subset
+
+    The subsets are explored breadth first, frontier by frontier. Each \
+    large frontier is split into chunks, whose successors are computed by a \
+    pool of processes. The pool is only started for the first frontier \
+    large enough, so the small automata are explored without it. Each \
+    worker receives its own copy of the transition tables when it starts, \
+    and the subsets are sent to the workers and back. The main process \
+    numbers the subsets found, so the result does not depend on the number \
+    of workers.
+
+    Parameters
+    ----------
+    bitset_nfa : :class:`~pyformlang.finite_automaton.bitset_nfa.BitsetNFA`
+        The automaton
+    start : int
+        The start subset
+    workers : int
+        The number of processes
+
+    Returns
+    ----------
+    subsets : list of int
+        The subsets reached, in the order in which they are found, starting \
+        with the start subset
+    transitions : list of (int, int, int)
+        The transitions between the subsets, as the index of the source \
+        subset, the index of the symbol in the symbols of the automaton and \
+        the index of the target subset
+    """
+    # pylint: disable=too-many-locals
+    tables = bitset_nfa.get_tables()
+    subset_ids = {start: 0}
+    subsets = [start]
+    transitions = []
+    frontier = [start]
+    with _LazyPool(tables, workers) as pool:
+        while frontier:
+            if len(frontier) < MIN_PARALLEL_FRONTIER:
+                all_next = _get_all_next(tables, frontier)
+            else:
+                all_next = pool.get_all_next(frontier)
+            new_frontier = []
+            for current, next_subsets in zip(frontier, all_next):
+                i_from = subset_ids[current]
+                for i_symbol, next_subset in enumerate(next_subsets):
+                    if not next_subset:
+                        continue
+                    i_to = subset_ids.get(next_subset)
+                    if i_to is None:
+                        i_to = len(subsets)
+                        subset_ids[next_subset] = i_to
+                        subsets.append(next_subset)
+                        new_frontier.append(next_subset)
+                    transitions.append((i_from, i_symbol, i_to))
+            frontier = new_frontier
+    return subsets, transitions
+
+
+class _LazyPool:
+    """ A pool of processes knowing the transition tables, started on its \
+    first use
+
+    Parameters
+    ----------
+    tables : list of (int, dict of int to int)
+        The transition tables, as given by \
+        :meth:`~pyformlang.finite_automaton.bitset_nfa.BitsetNFA.get_tables`
+    workers : int
+        The number of processes
+    """
+
+    def __init__(self, tables: List[Tuple[int, Dict[int, int]]],
+                 workers: int):
+        self._tables = tables
+        self._workers = workers
+        self._pool = None
+
+    def get_all_next(self, subsets: List[int]) -> List[List[int]]:
+        """ Gives the subset reached from each subset by each symbol, \
+        computed by chunks in the processes """
+        if self._pool is None:
+            self._start()
+        chunk_size = -(-len(subsets) // (self._workers * CHUNKS_PER_WORKER))
+        chunks = [subsets[i:i + chunk_size]
+                  for i in range(0, len(subsets), chunk_size)]
+        return [next_subsets
+                for chunk_next in self._pool.map(_get_all_next_in_worker,
+                                                 chunks)
+                for next_subsets in chunk_next]
+
+    def _start(self):
+        """ Starts the processes, giving them the tables """
+        # The pool is terminated when leaving the context
+        self._pool = Pool(  # pylint: disable=consider-using-with
+            self._workers, _initialize_worker, (self._tables,))
+
+    def __enter__(self) -> "_LazyPool":
+        return self
+
+    def __exit__(self, *args):
+        if self._pool is not None:
+            self._pool.terminate()
+
+
+def _get_all_next(tables, subsets: List[int]) -> List[List[int]]:
+    """ Gives the subset reached from each subset by each symbol """
+    return [[move(current, sources, successors)
+             for sources, successors in tables]
+            for current in subsets]
+
+
+def _initialize_worker(tables: List[Tuple[int, Dict[int, int]]]):
+    """ Keeps the transition tables in a worker """
+    global _WORKER_TABLES  # pylint: disable=global-statement
+    _WORKER_TABLES = tables
+
+
+def _get_all_next_in_worker(subsets: List[int]) -> List[List[int]]:
+    """ Gives the subset reached from each subset by each symbol, in a \
+    worker """
+    return _get_all_next(_WORKER_TABLES, subsets)
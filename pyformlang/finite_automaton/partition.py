@@ -2,55 +2,126 @@
 For internal usage.
 """
 
-from .doubly_linked_list import DoublyLinkedList
+from typing import Iterable, List, Tuple
 
 
 class Partition:
-    """Class to manage partitions used in Hopcroft minimization algorithm"""
-
-    def __init__(self, n_states):
-        self._class_names = {}  # States to class index
-        # Class idx to states
-        self.part = [DoublyLinkedList() for _ in range(n_states)]
-        self._place = {}  # state to position in list
-        self._counter = 0  # Number of classes
-
-    def add_class(self, new_class):
-        """Adds a new class"""
-        index = self._counter
-        self._counter += 1
-        for element in new_class:
-            self._class_names[element] = index
-            node = self.part[index].append(element)
-            self._place[element] = node
-
-    def move_to_new_class(self, elements_to_move):
-        """Move elements to a new class"""
-        for element in elements_to_move:
-            place = self._place[element]
-            place.delete()
-        self.add_class(elements_to_move)
-
-    def get_valid_sets(self, inverse):
-        """Get the valid sets"""
-        class_names = [0] * self._counter
-        for element in inverse:
-            class_names[self._class_names[element]] += 1
-        return [i for i, value in enumerate(class_names)
-                if value != 0 and value != len(self.part[i])]
-
-    def split(self, to_split, splitter):
-        """ Splits """
-        elements_to_move = []
-        for element in splitter:
-            if self._class_names[element] == to_split:
-                elements_to_move.append(element)
-        self.move_to_new_class(elements_to_move)
-        return self._counter - 1
-
-    def get_groups(self):
-        """ Get the groups """
-        res = []
-        for i in range(self._counter):
-            res.append([x.value for x in self.part[i]])
-        return res
+    """ A refinable partition of the integers from 0 to n_elements - 1
+
+    This is the structure of Valmari and Lehtinen: the elements are stored \
+    in a single array in which each class is a contiguous slice. Marking an \
+    element moves it to the beginning of its slice, so that splitting the \
+    marked elements from the others costs as much as the number of marked \
+    elements. All the operations only touch flat lists of integers.
+
+    For internal usage.
+
+    Parameters
+    ----------
+    n_elements : int
+        The number of elements
+    """
+
+    def __init__(self, n_elements: int):
+        # The elements, grouped by class
+        self._elements = list(range(n_elements))
+        # The position of each element in _elements
+        self._locations = list(range(n_elements))
+        # The class of each element
+        self._class_names = [0] * n_elements
+        # The slice of each class in _elements
+        self._firsts = [0]
+        self._ends = [n_elements]
+        # The end of the marked elements at the beginning of each slice
+        self._mids = [0]
+
+    def __len__(self) -> int:
+        """ The number of classes """
+        return len(self._firsts)
+
+    def get_size(self, class_name: int) -> int:
+        """ The number of elements in a class """
+        return self._ends[class_name] - self._firsts[class_name]
+
+    def get_class(self, element: int) -> int:
+        """ The class of an element """
+        return self._class_names[element]
+
+    def get_elements(self, class_name: int) -> List[int]:
+        """ The elements of a class """
+        return self._elements[self._firsts[class_name]:
+                              self._ends[class_name]]
+
+    def get_class_names(self) -> List[int]:
+        """ The class of each element """
+        return self._class_names
+
+    # pylint: disable=too-many-locals
+    def split(self, elements: Iterable[int]) -> List[Tuple[int, int]]:
+        """ Separates the given elements from the others in their classes
+
+        The elements are first marked, i.e. moved to the beginning of the \
+        slice of their class. Then, each class whose elements are only \
+        partly marked is split in two: the marked elements and the others. \
+        The smaller part becomes a new class, numbered after the existing \
+        ones, and the larger part keeps the name of the class.
+
+        Parameters
+        ----------
+        elements : iterable of int
+            The elements to separate. They may be repeated.
+
+        Returns
+        ----------
+        splits : list of pairs of int
+            The classes which were split, each with the new class created \
+            from it
+        """
+        all_elements = self._elements
+        locations = self._locations
+        class_names = self._class_names
+        firsts = self._firsts
+        ends = self._ends
+        mids = self._mids
+        touched = []
+        for element in elements:
+            class_name = class_names[element]
+            location = locations[element]
+            mid = mids[class_name]
+            if location < mid:
+                continue
+            if mid == firsts[class_name]:
+                touched.append(class_name)
+            # Swap the element with the first unmarked one
+            other = all_elements[mid]
+            all_elements[mid] = element
+            locations[element] = mid
+            all_elements[location] = other
+            locations[other] = location
+            mids[class_name] = mid + 1
+        splits = []
+        for class_name in touched:
+            first = firsts[class_name]
+            mid = mids[class_name]
+            end = ends[class_name]
+            mids[class_name] = first
+            if mid == end:
+                continue
+            new_class = len(firsts)
+            # The smaller part goes to the new class
+            if mid - first <= end - mid:
+                firsts.append(first)
+                ends.append(mid)
+                mids.append(first)
+                firsts[class_name] = mid
+                mids[class_name] = mid
+            else:
+                firsts.append(mid)
+                ends.append(end)
+                mids.append(mid)
+                ends[class_name] = mid
+                first, mid = mid, end
+            for i in range(first, mid):
+                class_names[all_elements[i]] = new_class
+            splits.append((class_name, new_class))
+        return splits
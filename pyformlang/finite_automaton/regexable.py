@@ -8,9 +8,15 @@ class Regexable:
     a regex
     """
 
-    def to_regex(self) -> "Regex":
+    def to_regex(self, order: str = "weight") -> "Regex":
         """ Tranforms the EpsilonNFA to a regular expression
 
+        Parameters
+        ----------
+        order : str, optional
+            The heuristic giving the order of elimination of the states, \
+            "weight" (default) or "degree"
+
         Returns
         ----------
         regex : :class:`~pyformlang.regular_expression.Regex`
@@ -0,0 +1,32 @@
+""" Reconstruction of the words found by the breadth-first searches
+For internal usage
+"""
+
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from .symbol import Symbol
+
+
+def get_word(previous: Dict[Hashable, Optional[Tuple[Hashable, Symbol]]],
+             current: Hashable) -> List[Symbol]:
+    """ Gives the word leading to a node in a breadth-first search
+
+    Parameters
+    ----------
+    previous : dict
+        For each node found, None if it is a start node, and otherwise the \
+        node from which it was found with the symbol read on the way
+    current : hashable
+        The node reached
+
+    Returns
+    ----------
+    word : list of :class:`~pyformlang.finite_automaton.Symbol`
+        The symbols read from a start node to the node
+    """
+    word = []
+    while previous[current] is not None:
+        current, symbol = previous[current]
+        word.append(symbol)
+    word.reverse()
+    return word
@@ -22,10 +22,7 @@ class State(FiniteAutomatonObject):  # pylint: disable=too-few-public-methods
 
     """
 
-    def __init__(self, value):
-        super().__init__(value)
-        self.index = None
-        self.index_cfg_converter = None
+    __slots__ = []
 
     def __hash__(self) -> int:
         if self._hash is None:
@@ -33,6 +30,8 @@ class State(FiniteAutomatonObject):  # pylint: disable=too-few-public-methods
         return self._hash
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if isinstance(other, State):
             return self._value == other._value
         return self._value == other
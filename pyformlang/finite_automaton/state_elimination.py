@@ -0,0 +1,246 @@
+"""
+Conversion of an automaton into a regular expression, by eliminating its \
+states one by one
+"""
+
+import heapq
+from typing import Dict, Hashable, Tuple
+
+from .epsilon import Epsilon
+
+ELIMINATION_ORDERS = ("weight", "degree")
+
+
+def to_regex(enfa: "EpsilonNFA", order: str = "weight") -> "Regex":
+    """ Transforms an epsilon NFA into a regular expression
+
+    The automaton is turned into a generalized automaton whose transitions \
+    are labelled by regular expressions, with a new start state and a new \
+    final state. Its states are then eliminated one by one, the transitions \
+    through an eliminated state being replaced by direct ones. The regular \
+    expressions are built as trees, and the subexpressions reused by \
+    several new transitions are shared.
+
+    The order of elimination changes the size of the expression obtained. \
+    The cheapest state is eliminated first, according to:
+
+    * "weight" (default): the weight of Delgado and Morais, which estimates \
+    the number of symbols added to the expression by the elimination
+    * "degree": the number of transitions created by the elimination, i.e. \
+    the product of the number of predecessors and successors of the state
+
+    Parameters
+    ----------
+    enfa : :class:`~pyformlang.finite_automaton.EpsilonNFA`
+        The automaton to transform
+    order : str, optional
+        The heuristic giving the order of elimination, "weight" or "degree"
+
+    Returns
+    ----------
+    regex : :class:`~pyformlang.regular_expression.Regex`
+        A regular expression equivalent to the automaton
+
+    Raises
+    ----------
+    ValueError
+        If the order is unknown
+
+    Examples
+    --------
+
+    >>> enfa = EpsilonNFA()
+    >>> enfa.add_transitions([(0, "a", 1), (1, "b", 1), (1, "c", 2)])
+    >>> enfa.add_start_state(0)
+    >>> enfa.add_final_state(2)
+    >>> regex = to_regex(enfa, order="degree")
+    >>> regex.accepts(["a", "b", "b", "c"])
+    True
+
+    """
+    if order not in ELIMINATION_ORDERS:
+        raise ValueError("Unknown elimination order: " + order)
+    generalized_nfa = _GeneralizedNFA(enfa)
+    return generalized_nfa.eliminate_all(order)
+
+
+class _RegexBuilder:
+    """ Builds the regular expressions of a generalized automaton
+
+    The expressions are kept with their number of symbols. A few \
+    simplifications are made on the fly, like removing the concatenations \
+    with epsilon.
+    """
+
+    def __init__(self):
+        # pylint: disable=import-outside-toplevel
+        from pyformlang.regular_expression import Regex, regex_objects
+        self._regex_class = Regex
+        self._regex_objects = regex_objects
+        self.epsilon = (self._make(regex_objects.Epsilon(), []), 0)
+        self._symbols = {}
+        # The operators hold no state, so one node of each is shared by all
+        # the expressions
+        self._union = regex_objects.Union()
+        self._concatenation = regex_objects.Concatenation()
+        self._kleene_star = regex_objects.KleeneStar()
+
+    def _make(self, head, sons) -> "Regex":
+        # pylint: disable=protected-access
+        return self._regex_class._from_node(head, sons)
+
+    def empty(self) -> "Regex":
+        """ The regular expression of the empty language """
+        return self._make(self._regex_objects.Empty(), [])
+
+    def symbol(self, symbol: "Symbol") -> Tuple["Regex", int]:
+        """ The regular expression of a symbol, shared by its transitions """
+        if symbol == Epsilon():
+            return self.epsilon
+        expression = self._symbols.get(symbol)
+        if expression is None:
+            expression = (self._make(
+                self._regex_objects.Symbol(str(symbol.value)), []), 1)
+            self._symbols[symbol] = expression
+        return expression
+
+    def union(self, left, right):
+        """ The union of two expressions, the first one possibly missing """
+        if left is None or left is right:
+            return right
+        return (self._make(self._union, [left[0], right[0]]),
+                left[1] + right[1])
+
+    def concatenate(self, left, right):
+        """ The concatenation of two expressions """
+        if left is self.epsilon:
+            return right
+        if right is self.epsilon:
+            return left
+        return (self._make(self._concatenation, [left[0], right[0]]),
+                left[1] + right[1])
+
+    def kleene_star(self, expression):
+        """ The Kleene star of an expression """
+        if expression is self.epsilon:
+            return expression
+        if isinstance(expression[0].head, self._regex_objects.KleeneStar):
+            return expression
+        return (self._make(self._kleene_star, [expression[0]]),
+                expression[1])
+
+
+class _GeneralizedNFA:
+    """ An automaton whose transitions are labelled by regular expressions
+
+    The states are the useful states of an epsilon NFA, plus a start and a \
+    final state of their own. There is at most one transition between two \
+    states, and the loops are kept apart.
+    """
+
+    def __init__(self, enfa: "EpsilonNFA"):
+        self._builder = _RegexBuilder()
+        # The new start and final states, distinct from all the others
+        self._start = object()
+        self._final = object()
+        # The transitions leaving and entering each state, except the loops
+        self._out: Dict[Hashable, Dict[Hashable, Tuple["Regex", int]]] = \
+            {self._start: {}, self._final: {}}
+        self._in: Dict[Hashable, Dict[Hashable, Tuple["Regex", int]]] = \
+            {self._start: {}, self._final: {}}
+        self._loops: Dict[Hashable, Tuple["Regex", int]] = {}
+        useful_states = enfa.get_useful_states()
+        for state in useful_states:
+            self._out[state] = {}
+            self._in[state] = {}
+        for s_from, symbol, s_to in enfa:
+            if s_from in useful_states and s_to in useful_states:
+                self._add(s_from, self._builder.symbol(symbol), s_to)
+        for state in enfa.start_states:
+            if state in useful_states:
+                self._add(self._start, self._builder.epsilon, state)
+        for state in enfa.final_states:
+            if state in useful_states:
+                self._add(state, self._builder.epsilon, self._final)
+
+    def _add(self, s_from, expression, s_to):
+        """ Adds an expression to the transition between two states """
+        if s_from == s_to:
+            self._loops[s_from] = self._builder.union(
+                self._loops.get(s_from), expression)
+        else:
+            expression = self._builder.union(self._out[s_from].get(s_to),
+                                             expression)
+            self._out[s_from][s_to] = expression
+            self._in[s_to][s_from] = expression
+
+    def _get_priority(self, state, order: str) -> int:
+        """ The cost of the elimination of a state """
+        n_in = len(self._in[state])
+        n_out = len(self._out[state])
+        if order == "degree":
+            return n_in * n_out
+        priority = sum(expression[1]
+                       for expression in self._in[state].values()) \
+            * (n_out - 1)
+        priority += sum(expression[1]
+                        for expression in self._out[state].values()) \
+            * (n_in - 1)
+        loop = self._loops.get(state)
+        if loop is not None:
+            priority += loop[1] * (n_in * n_out - 1)
+        return priority
+
+    def eliminate(self, state):
+        """ Eliminates a state, replacing the paths going through it by \
+        direct transitions """
+        ins = self._in.pop(state)
+        outs = self._out.pop(state)
+        loop = self._loops.pop(state, None)
+        for s_from in ins:
+            del self._out[s_from][state]
+        for s_to in outs:
+            del self._in[s_to][state]
+        star = None
+        if loop is not None:
+            star = self._builder.kleene_star(loop)
+        for s_from, to_state in ins.items():
+            # The prefix is shared by all the new transitions from s_from
+            prefix = to_state
+            if star is not None:
+                prefix = self._builder.concatenate(prefix, star)
+            for s_to, from_state in outs.items():
+                self._add(s_from,
+                          self._builder.concatenate(prefix, from_state),
+                          s_to)
+
+    def eliminate_all(self, order: str) -> "Regex":
+        """ Eliminates all the states but the start and the final one, and \
+        gives the expression between them """
+        priorities = {}
+        heap = []
+        for index, state in enumerate(self._out):
+            if state not in (self._start, self._final):
+                priorities[state] = self._get_priority(state, order)
+                heap.append((priorities[state], index, state))
+        heapq.heapify(heap)
+        counter = len(self._out)
+        while heap:
+            priority, _, state = heapq.heappop(heap)
+            if priorities.get(state) != priority:
+                # The state was eliminated, or its priority changed
+                continue
+            del priorities[state]
+            neighbours = set(self._in[state]).union(self._out[state])
+            self.eliminate(state)
+            for neighbour in neighbours:
+                if neighbour in priorities:
+                    priorities[neighbour] = self._get_priority(neighbour,
+                                                               order)
+                    heapq.heappush(heap, (priorities[neighbour], counter,
+                                          neighbour))
+                    counter += 1
+        expression = self._out[self._start].get(self._final)
+        if expression is None:
+            return self._builder.empty()
+        return expression[0]
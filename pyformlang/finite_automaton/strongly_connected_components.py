@@ -0,0 +1,75 @@
+""" Computation of the strongly connected components of a graph
+For internal usage
+"""
+
+from typing import Callable, Hashable, Iterable, List
+
+
+def get_strongly_connected_components(
+        nodes: Iterable[Hashable],
+        get_successors: Callable[[Hashable], Iterable[Hashable]]) \
+        -> List[List[Hashable]]:
+    """ Computes the strongly connected components of a graph with Tarjan's \
+    algorithm
+
+    The recursion is unrolled, so that deep graphs do not exceed the \
+    recursion limit.
+
+    Parameters
+    ----------
+    nodes : iterable of hashable
+        The nodes from which to start the exploration. The nodes reachable \
+        from them are explored too.
+    get_successors : callable
+        Gives the successors of a node
+
+    Returns
+    ----------
+    components : list of lists of nodes
+        The strongly connected components, in reverse topological order: \
+        a component comes after all the components it can reach.
+    """
+    indexes = {}
+    low_links = {}
+    on_stack = set()
+    stack = []
+    components = []
+    for root in nodes:
+        if root in indexes:
+            continue
+        indexes[root] = low_links[root] = len(indexes)
+        stack.append(root)
+        on_stack.add(root)
+        to_process = [(root, iter(get_successors(root)))]
+        while to_process:
+            node, successors = to_process[-1]
+            for successor in successors:
+                if successor not in indexes:
+                    indexes[successor] = low_links[successor] = len(indexes)
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    to_process.append(
+                        (successor, iter(get_successors(successor))))
+                    break
+                if successor in on_stack:
+                    low_links[node] = min(low_links[node], indexes[successor])
+            else:
+                to_process.pop()
+                if to_process:
+                    parent = to_process[-1][0]
+                    low_links[parent] = min(low_links[parent],
+                                            low_links[node])
+                if low_links[node] == indexes[node]:
+                    components.append(_pop_component(stack, on_stack, node))
+    return components
+
+
+def _pop_component(stack, on_stack, root) -> List[Hashable]:
+    """ Pops the nodes of the component of a root from the stack """
+    component = []
+    while True:
+        node = stack.pop()
+        on_stack.remove(node)
+        component.append(node)
+        if node == root:
+            return component
@@ -21,7 +21,11 @@ class Symbol(FiniteAutomatonObject):  # pylint: disable=too-few-public-methods
     A
     """
 
+    __slots__ = []
+
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         if isinstance(other, Symbol):
             return self._value == other.value
         return self._value == other
@@ -0,0 +1,96 @@
+"""
+Tests for the structural analyses of automata
+"""
+
+import itertools
+import math
+import random
+import unittest
+
+from pyformlang.finite_automaton import EpsilonNFA, \
+    DeterministicFiniteAutomaton, State
+
+from .test_equivalence import get_random_enfa
+
+
+def get_diamonds_dfa(n_diamonds):
+    """ A chain of diamonds, which has 2 ** n_diamonds paths """
+    dfa = DeterministicFiniteAutomaton()
+    for i in range(n_diamonds):
+        dfa.add_transitions([(2 * i, "a", 2 * i + 1), (2 * i, "b", 2 * i + 1),
+                             (2 * i, "c", 2 * i + 2),
+                             (2 * i + 1, "a", 2 * i + 2)])
+    dfa.add_start_state(0)
+    dfa.add_final_state(2 * n_diamonds)
+    return dfa
+
+
+def get_accepted_lengths(enfa, max_length):
+    """ The lengths of the accepted words, up to a maximum length """
+    return {length
+            for length in range(max_length + 1)
+            for word in itertools.product("ab", repeat=length)
+            if enfa.accepts(word)}
+
+
+class TestAnalysis(unittest.TestCase):
+    """ Tests for the structural analyses of automata """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_diamonds(self):
+        dfa = get_diamonds_dfa(200)
+        self.assertTrue(dfa.is_acyclic())
+        self.assertTrue(dfa.is_finite())
+        self.assertEqual(dfa.get_shortest_word_length(), 200)
+        self.assertEqual(dfa.get_longest_word_length(), 400)
+        self.assertEqual(len(dfa.get_useful_states()), 401)
+        dfa.add_transition(400, "a", 0)
+        self.assertFalse(dfa.is_acyclic())
+        self.assertFalse(dfa.is_finite())
+        self.assertEqual(dfa.get_longest_word_length(), math.inf)
+
+    def test_epsilon_cycles(self):
+        enfa = EpsilonNFA()
+        enfa.add_transitions([(0, "epsilon", 1), (1, "epsilon", 0),
+                              (1, "a", 2), (2, "b", 3), (3, "a", 3)])
+        enfa.add_start_state(0)
+        enfa.add_final_state(2)
+        self.assertFalse(enfa.is_acyclic())
+        self.assertTrue(enfa.is_finite())
+        self.assertEqual(enfa.get_useful_states(),
+                         {State(0), State(1), State(2)})
+        self.assertEqual(enfa.get_shortest_word_length(), 1)
+        self.assertEqual(enfa.get_longest_word_length(), 1)
+        enfa.add_final_state(0)
+        self.assertEqual(enfa.get_shortest_word_length(), 0)
+        enfa.add_final_state(3)
+        self.assertFalse(enfa.is_finite())
+
+    def test_empty(self):
+        enfa = EpsilonNFA()
+        self.assertTrue(enfa.is_acyclic())
+        self.assertTrue(enfa.is_finite())
+        self.assertIsNone(enfa.get_shortest_word_length())
+        self.assertIsNone(enfa.get_longest_word_length())
+        enfa.add_transitions([(0, "a", 0), (1, "b", 2)])
+        enfa.add_start_state(0)
+        enfa.add_final_state(2)
+        self.assertFalse(enfa.is_acyclic())
+        self.assertTrue(enfa.is_finite())
+        self.assertEqual(enfa.get_useful_states(), set())
+        self.assertIsNone(enfa.get_longest_word_length())
+
+    def test_random(self):
+        random.seed(20)
+        for _ in range(30):
+            enfa = get_random_enfa(5, 7)
+            lengths = get_accepted_lengths(enfa, 10)
+            if enfa.is_finite():
+                longest = enfa.get_longest_word_length()
+                self.assertEqual(max(lengths, default=None), longest)
+            else:
+                self.assertTrue(any(length > 5 for length in lengths))
+            self.assertEqual(min(lengths, default=None),
+                             enfa.get_shortest_word_length())
+            self.assertEqual(enfa.is_empty(), not enfa.get_useful_states())
@@ -0,0 +1,86 @@
+"""
+Tests for the decomposition of automata into boolean matrices
+"""
+
+import random
+import unittest
+
+import numpy as np
+
+from pyformlang.finite_automaton import EpsilonNFA, AutomatonMatrices, \
+    BooleanMatrix, Epsilon, State, Symbol
+
+from .test_equivalence import get_random_enfa
+
+
+class TestAutomatonMatrices(unittest.TestCase):
+    """ Tests for the decomposition of automata into boolean matrices """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_random(self):
+        random.seed(23)
+        for _ in range(20):
+            enfa0 = get_random_enfa(5, 12)
+            enfa1 = get_random_enfa(4, 10)
+            matrices0 = enfa0.to_matrices()
+            matrices1 = enfa1.to_matrices()
+            self.assertTrue(
+                EpsilonNFA.from_matrices(matrices0).is_equivalent_to(enfa0))
+            self.assertTrue(
+                matrices0.remove_epsilon_transitions().to_automaton()
+                .is_equivalent_to(enfa0))
+            intersection = matrices0.intersect(matrices1).to_automaton()
+            self.assertTrue(intersection.is_equivalent_to(
+                enfa0.get_intersection(enfa1)))
+            closure = matrices0.get_epsilon_closure().to_dense()
+            for state in matrices0.states:
+                i = matrices0.get_state_index(state)
+                self.assertEqual(
+                    {matrices0.states[j] for j in np.flatnonzero(closure[i])},
+                    enfa0.eclose(state))
+            reachable = matrices0.get_reachable_states()
+            self.assertEqual(
+                {state for state, is_reachable
+                 in zip(matrices0.states, reachable) if is_reachable},
+                _get_reachable(enfa0, enfa0.start_states))
+
+    def test_decomposition(self):
+        enfa = EpsilonNFA()
+        enfa.add_transitions([(0, "a", 1), (1, "b", 2), (2, "epsilon", 0),
+                              (3, "a", 3)])
+        enfa.add_start_state(0)
+        enfa.add_final_state(2)
+        matrices = enfa.to_matrices()
+        self.assertEqual(len(matrices.states), 4)
+        self.assertEqual(set(matrices.matrices),
+                         {Symbol("a"), Symbol("b"), Epsilon()})
+        self.assertEqual(matrices.matrices[Symbol("a")].nnz, 2)
+        self.assertEqual(matrices.start_states.tolist(),
+                         [state == State(0) for state in matrices.states])
+        self.assertEqual(matrices.final_states.sum(), 1)
+        reachable = matrices.get_reachable_states([3])
+        self.assertEqual(reachable.sum(), 1)
+        with self.assertRaises(KeyError):
+            matrices.get_state_index(4)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            AutomatonMatrices([0, 1], {"a": BooleanMatrix.identity(3)},
+                              [True, False], [False, True])
+        with self.assertRaises(ValueError):
+            AutomatonMatrices([0, 1], {"a": BooleanMatrix.identity(2)},
+                              [True], [False, True])
+
+
+def _get_reachable(enfa, sources):
+    """ The states reachable from some states, by a search """
+    reachable = set(sources)
+    stack = list(sources)
+    while stack:
+        state = stack.pop()
+        for s_from, _, s_to in enfa:
+            if s_from == state and s_to not in reachable:
+                reachable.add(s_to)
+                stack.append(s_to)
+    return reachable
@@ -0,0 +1,188 @@
+"""
+Tests for the binary format of automata
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from pyformlang.finite_automaton import DeterministicFiniteAutomaton, \
+    NondeterministicFiniteAutomaton, EpsilonNFA, Epsilon, Symbol, \
+    CompiledNFA, load
+from pyformlang.finite_automaton.binary_format import HEADER, save
+
+from .test_deterministic_finite_automaton import get_example0
+from .test_equivalence import get_random_enfa
+
+
+class TestBinaryFormat(unittest.TestCase):
+    """ Tests for the binary format of automata """
+
+    # pylint: disable=missing-function-docstring
+
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, "automaton.bin")
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_dfa(self):
+        dfa = get_example0()
+        dfa.save(self._path)
+        for mmap in [True, False]:
+            compiled = load(self._path, mmap=mmap)
+            self.assertTrue(compiled.is_deterministic())
+            self.assertTrue(compiled.accepts(["a", "b", "c"]))
+            self.assertTrue(compiled.accepts([Symbol("a"), Symbol("d")]))
+            self.assertFalse(compiled.accepts(["a", "c", "d"]))
+            self.assertFalse(compiled.accepts(["a", "z", "c"]))
+            self.assertFalse(compiled.accepts([]))
+            loaded = compiled.to_automaton()
+            self.assertIsInstance(loaded, DeterministicFiniteAutomaton)
+            self.assertTrue(loaded.is_equivalent_to(dfa))
+            self.assertEqual(len(loaded.states), len(dfa.states))
+
+    def test_enfa(self):
+        enfa = EpsilonNFA()
+        enfa.add_transitions([(0, "a", 1), (1, Epsilon(), 2), (2, "b", 0),
+                              (0, "a", 2), (3, "c", 0)])
+        enfa.add_start_state(0)
+        enfa.add_final_state(2)
+        save(enfa, self._path)
+        compiled = load(self._path)
+        self.assertFalse(compiled.is_deterministic())
+        self.assertTrue(compiled.accepts(["a"]))
+        self.assertTrue(compiled.accepts(["a", "b", "a"]))
+        self.assertFalse(compiled.accepts(["a", "b"]))
+        self.assertFalse(compiled.accepts(["c"]))
+        self.assertEqual(compiled.symbols, ("a", "b", "c"))
+        self.assertEqual(compiled.get_symbol_id("z"),
+                         compiled.get_symbol_id(Symbol("y")))
+        loaded = compiled.to_automaton()
+        self.assertIsInstance(loaded, EpsilonNFA)
+        self.assertTrue(loaded.is_equivalent_to(enfa))
+        self.assertEqual(len(loaded), len(enfa))
+
+    def test_random(self):
+        random.seed(18)
+        for _ in range(20):
+            enfa = get_random_enfa(8, 20)
+            enfa.save(self._path)
+            compiled = load(self._path)
+            self.assertTrue(compiled.to_automaton().is_equivalent_to(enfa))
+            for _ in range(20):
+                word = [random.choice("abc")
+                        for _ in range(random.randint(0, 6))]
+                self.assertEqual(compiled.accepts(word), enfa.accepts(word))
+
+    def test_nfa(self):
+        nfa = NondeterministicFiniteAutomaton()
+        nfa.add_transitions([(0, "a", 0), (0, "a", 1), (1, "b", 2)])
+        nfa.add_start_state(0)
+        nfa.add_final_state(2)
+        nfa.save(self._path)
+        loaded = load(self._path, mmap=False).to_automaton()
+        self.assertIsInstance(loaded, NondeterministicFiniteAutomaton)
+        self.assertTrue(loaded.accepts(["a", "a", "b"]))
+
+    def test_arrays(self):
+        dfa = DeterministicFiniteAutomaton()
+        dfa.add_transitions([(0, "b", 1), (0, "a", 2), (1, "a", 0)])
+        dfa.add_start_state(0)
+        dfa.save(self._path)
+        compiled = load(self._path)
+        self.assertEqual(compiled.row_pointers.tolist(), [0, 2, 3, 3])
+        self.assertEqual(compiled.transition_labels.tolist(), [0, 1, 1])
+        self.assertEqual(compiled.transition_targets.tolist(), [1, 2, 0])
+        self.assertEqual(compiled.states, (0, 1, 2))
+        with self.assertRaises(ValueError):
+            compiled.transition_targets[0] = 1
+
+    def test_values(self):
+        dfa = DeterministicFiniteAutomaton()
+        dfa.add_transitions([("x", 1, 2.5), (2.5, True, "y")])
+        dfa.add_start_state("x")
+        dfa.add_final_state("y")
+        dfa.save(self._path)
+        loaded = load(self._path).to_automaton()
+        self.assertTrue(loaded.accepts([1, True]))
+        self.assertEqual({state.value for state in loaded.states},
+                         {"x", 2.5, "y"})
+        dfa.add_transition("x", 2, (0, 1))
+        with self.assertRaises(ValueError):
+            dfa.save(self._path)
+
+    def test_matcher(self):
+        enfa = get_random_enfa(5, 10)
+        enfa.add_transitions([(0, "a", 1), (1, Epsilon(), 0)])
+        enfa.add_start_state(0)
+        enfa.add_final_state(1)
+        enfa.save(self._path)
+        matcher = load(self._path).matcher()
+        reference = enfa.matcher()
+        for symbol in ["a", "a", "b", "z", "a"]:
+            matcher.feed([symbol])
+            reference.feed([symbol])
+            self.assertEqual(matcher.is_accepting(),
+                             reference.is_accepting())
+        matcher.reset()
+        self.assertTrue(matcher.feed(["a"]))
+        self.assertTrue(matcher.is_accepting())
+
+    def test_invalid(self):
+        get_example0().save(self._path)
+        with open(self._path, "rb") as file:
+            data = bytearray(file.read())
+        with self.assertRaises(ValueError):
+            CompiledNFA(bytes(data[:10]))
+        wrong_magic = bytearray(data)
+        wrong_magic[0:8] = b"NOTAUTOM"
+        with self.assertRaises(ValueError):
+            CompiledNFA(bytes(wrong_magic))
+        wrong_version = bytearray(data)
+        wrong_version[8] = 99
+        with self.assertRaises(ValueError):
+            CompiledNFA(bytes(wrong_version))
+        self.assertGreater(len(data), HEADER.size)
+        self.assertTrue(CompiledNFA(bytes(data)).accepts(["a", "d"]))
+
+    def test_empty(self):
+        EpsilonNFA().save(self._path)
+        compiled = load(self._path)
+        self.assertFalse(compiled.accepts([]))
+        self.assertTrue(compiled.to_automaton().is_empty())
+        DeterministicFiniteAutomaton().save(self._path)
+        self.assertFalse(load(self._path).accepts(["a"]))
+
+    def test_save_over_loaded(self):
+        chain = DeterministicFiniteAutomaton()
+        chain.add_transitions([(i, "a", i + 1) for i in range(20000)])
+        chain.add_start_state(0)
+        chain.add_final_state(20000)
+        chain.save(self._path)
+        compiled = load(self._path)
+        get_example0().save(self._path)
+        # The mapped pages of the previous file stay valid
+        self.assertTrue(compiled.accepts(["a"] * 20000))
+        self.assertFalse(compiled.accepts(["a"] * 19999))
+        self.assertTrue(load(self._path).accepts(["a", "d"]))
+        self.assertEqual(os.listdir(self._directory.name), ["automaton.bin"])
+        compiled.close()
+
+    def test_close(self):
+        get_example0().save(self._path)
+        for mmap in [True, False]:
+            with load(self._path, mmap=mmap) as compiled:
+                self.assertTrue(compiled.accepts(["a", "d"]))
+            with self.assertRaises(ValueError):
+                compiled.accepts(["a", "d"])
+            compiled.close()
+        compiled = load(self._path)
+        targets = compiled.transition_targets
+        with self.assertRaises(BufferError):
+            compiled.close()
+        del targets
+        compiled.close()
@@ -0,0 +1,60 @@
+"""
+Tests for the sparse boolean matrices
+"""
+
+import unittest
+
+import numpy as np
+
+from pyformlang.finite_automaton import BooleanMatrix
+
+
+class TestBooleanMatrix(unittest.TestCase):
+    """ Tests for the sparse boolean matrices """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_random(self):
+        generator = np.random.default_rng(23)
+        for _ in range(20):
+            dense0 = generator.random((6, 4)) < 0.3
+            dense1 = generator.random((4, 5)) < 0.3
+            matrix0 = BooleanMatrix.from_dense(dense0)
+            matrix1 = BooleanMatrix.from_dense(dense1)
+            self.assertTrue(np.array_equal(matrix0.to_dense(), dense0))
+            self.assertTrue(np.array_equal(
+                (matrix0 @ matrix1).to_dense(),
+                dense0.astype(int) @ dense1.astype(int) > 0))
+            self.assertTrue(np.array_equal(matrix0.T.to_dense(), dense0.T))
+            self.assertTrue(np.array_equal(
+                (matrix0 | matrix0).to_dense(), dense0))
+            dense2 = generator.random((6, 4)) < 0.3
+            self.assertTrue(np.array_equal(
+                (matrix0 - BooleanMatrix.from_dense(dense2)).to_dense(),
+                dense0 & ~dense2))
+            self.assertTrue(np.array_equal(matrix0.kron(matrix1).to_dense(),
+                                           np.kron(dense0, dense1)))
+            mask = generator.random(6) < 0.5
+            self.assertTrue(np.array_equal(
+                matrix0.get_successors(mask),
+                mask.astype(int) @ dense0.astype(int) > 0))
+
+    def test_transitive_closure(self):
+        matrix = BooleanMatrix.from_pairs([0, 1, 2, 4], [1, 2, 0, 3], (5, 5))
+        closure = matrix.transitive_closure(reflexive=False)
+        self.assertEqual(closure.nnz, 10)
+        self.assertFalse(closure.to_dense()[3, 3])
+        self.assertTrue(closure.to_dense()[1, 1])
+        closure = matrix.transitive_closure()
+        self.assertEqual(closure.nnz, 12)
+        self.assertEqual(closure, closure.transitive_closure())
+
+    def test_from_pairs(self):
+        matrix = BooleanMatrix.from_pairs([1, 0, 1], [2, 1, 2], (2, 3))
+        self.assertEqual(matrix.nnz, 2)
+        self.assertEqual(matrix.indptr.tolist(), [0, 1, 2])
+        self.assertEqual(matrix.indices.tolist(), [1, 2])
+        self.assertEqual(matrix, BooleanMatrix(matrix.indptr, matrix.indices,
+                                               (2, 3)))
+        self.assertNotEqual(matrix, BooleanMatrix.identity(2))
+        self.assertEqual(BooleanMatrix.identity(0).nnz, 0)
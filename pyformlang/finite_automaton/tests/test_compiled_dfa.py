@@ -0,0 +1,94 @@
+"""
+Tests for the compiled deterministic finite automata
+"""
+
+import unittest
+
+from pyformlang.finite_automaton import DeterministicFiniteAutomaton, \
+    Epsilon
+from pyformlang.finite_automaton import State
+from pyformlang.finite_automaton import Symbol
+
+from .test_deterministic_finite_automaton import get_example0, \
+    get_example0_bis
+
+
+class TestCompiledDFA(unittest.TestCase):
+    """ Tests for compiled deterministic finite automata
+    """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_accepts(self):
+        for dfa in [get_example0(), get_example0_bis()]:
+            compiled = dfa.compile()
+            self.assertTrue(compiled.accepts(["a", "b", "c"]))
+            self.assertTrue(compiled.accepts(["a", "b", "b", "b", "c"]))
+            self.assertTrue(compiled.accepts([Symbol("a"), Symbol("d")]))
+            self.assertFalse(compiled.accepts(["a", "c", "d"]))
+            self.assertFalse(compiled.accepts(["d", "c", "d"]))
+            self.assertFalse(compiled.accepts(["a", "z", "c"]))
+            self.assertFalse(compiled.accepts(["a", Epsilon(), "c"]))
+            self.assertFalse(compiled.accepts([]))
+            self.assertTrue(compiled.accepts(iter(["a", "d"])))
+
+    def test_snapshot(self):
+        dfa = get_example0()
+        compiled = dfa.compile()
+        dfa.remove_start_state(0)
+        self.assertFalse(dfa.accepts(["a", "d"]))
+        self.assertTrue(compiled.accepts(["a", "d"]))
+        with self.assertRaises(ValueError):
+            compiled.transition_table[0, 0] = 1
+
+    def test_no_start_state(self):
+        dfa = get_example0()
+        dfa.remove_start_state(0)
+        compiled = dfa.compile()
+        self.assertEqual(compiled.start_state_id, compiled.dead_state_id)
+        self.assertFalse(compiled.accepts([]))
+        self.assertFalse(compiled.accepts(["a", "d"]))
+
+    def test_dead_states_merged(self):
+        dfa = DeterministicFiniteAutomaton()
+        dfa.add_start_state(0)
+        dfa.add_final_state(1)
+        dfa.add_transitions([(0, "a", 1), (0, "b", 2), (2, "a", 2)])
+        compiled = dfa.compile()
+        dead = compiled.dead_state_id
+        start = compiled.start_state_id
+        table = compiled.transition_table
+        self.assertEqual(table[start, compiled.get_symbol_id("b")], dead)
+        self.assertEqual(table[start, compiled.get_symbol_id("z")], dead)
+        self.assertNotEqual(table[start, compiled.get_symbol_id(Symbol("a"))],
+                            dead)
+        self.assertEqual(len(compiled.states), 3)
+        self.assertIn(State(2), compiled.states)
+        self.assertTrue(compiled.accepts(["a"]))
+        self.assertFalse(compiled.accepts(["b", "a"]))
+
+    def test_accepting_start(self):
+        dfa = DeterministicFiniteAutomaton()
+        dfa.add_start_state(0)
+        dfa.add_final_state(0)
+        dfa.add_transition(0, "a", 0)
+        compiled = dfa.compile()
+        self.assertTrue(compiled.accepts([]))
+        self.assertTrue(compiled.accepts(["a"] * 100))
+        self.assertFalse(compiled.accepts(["a", "b"]))
+        self.assertTrue(compiled.final_states_mask[compiled.start_state_id])
+
+    def test_accepts_many(self):
+        dfa = get_example0()
+        words = [["a", "b", "c"], ["a", "b", "b", "b", "c"], [],
+                 ["a", "d", "d"], ["a"], ["z"], [Symbol("a"), Symbol("d")],
+                 ["a"] + ["b"] * 20 + ["c"]]
+        expected = [True, True, False, False, False, False, True, True]
+        compiled = dfa.compile()
+        self.assertEqual(list(compiled.accepts_many(words)), expected)
+        self.assertEqual(list(compiled.accepts_many(words, batch_size=3)),
+                         expected)
+        self.assertEqual(list(dfa.accepts_many(iter(words))), expected)
+        self.assertEqual(len(compiled.accepts_many([])), 0)
+        self.assertEqual(list(compiled.accepts_many([[], []])),
+                         [False, False])
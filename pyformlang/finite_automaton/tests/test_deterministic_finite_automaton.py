@@ -2,6 +2,8 @@
 Tests for the deterministic finite automata
 """
 
+import random
+from collections import deque
 import unittest
 
 from pyformlang.finite_automaton import DeterministicFiniteAutomaton, Epsilon
@@ -121,6 +123,21 @@ class TestDeterministicFiniteAutomaton(unittest.TestCase):
         dfa = get_example0().copy()
         self._perform_tests_example0(dfa)
 
+    def test_copy_on_write(self):
+        """ Tests that a DFA and its copy do not see their modifications """
+        dfa = get_example0()
+        dfa_copy = dfa.copy()
+        dfa_copy.add_start_state(3)
+        dfa_copy.add_transition(3, "a", 1)
+        self._perform_tests_example0(dfa)
+        self.assertTrue(dfa_copy.accepts(["a", "c"]))
+        self.assertFalse(dfa.accepts(["a", "c"]))
+        dfa.remove_start_state(0)
+        self.assertFalse(dfa.accepts(["a", "b", "c"]))
+        dfa_copy = dfa_copy.copy()
+        dfa_copy.add_start_state(0)
+        self._perform_tests_example0(dfa_copy)
+
     def test_regex(self):
         """ Tests the regex transformation """
         dfa = get_example0()
@@ -283,6 +300,81 @@ class TestDeterministicFiniteAutomaton(unittest.TestCase):
         self.assertEqual(dfa1, dfa_regex)
 
 
+class TestMinimization(unittest.TestCase):
+    """ Tests for the minimization algorithms of deterministic automata """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_minimize_cycle(self):
+        # A cycle of 12 states with a final state every 3 states has 3
+        # equivalence classes
+        dfa = DeterministicFiniteAutomaton()
+        dfa.add_start_state(State(0))
+        for i in range(12):
+            dfa.add_transition(State(i), Symbol("a"), State((i + 1) % 12))
+            if i % 3 == 0:
+                dfa.add_final_state(State(i))
+        dfa.add_transition(State(13), Symbol("a"), State(0))
+        minimal = dfa.minimize()
+        self.assertEqual(len(minimal.states), 3)
+        self.assertTrue(minimal.accepts(["a"] * 6))
+        self.assertFalse(minimal.accepts(["a"] * 7))
+        self.assertTrue(minimal.is_equivalent_to(dfa))
+
+    def test_minimize_random(self):
+        random.seed(42)
+        for _ in range(30):
+            dfa = DeterministicFiniteAutomaton()
+            size = random.randint(1, 30)
+            dfa.add_start_state(State(0))
+            for i in range(size):
+                for symbol in "abc":
+                    if random.random() < 0.8:
+                        dfa.add_transition(State(i), Symbol(symbol),
+                                           State(random.randrange(size)))
+                if random.random() < 0.3:
+                    dfa.add_final_state(State(i))
+            if not dfa.final_states:
+                continue
+            # The minimal DFA of the empty language keeps its start state
+            n_states = max(_count_classes(dfa), 1)
+            for algorithm in ["auto", "hopcroft", "valmari", "moore",
+                              "brzozowski"]:
+                minimal = dfa.minimize(algorithm=algorithm)
+                self.assertEqual(len(minimal.states), n_states)
+                for _ in range(20):
+                    word = [random.choice("abc")
+                            for _ in range(random.randint(0, 10))]
+                    self.assertEqual(minimal.accepts(word),
+                                     dfa.accepts(word))
+
+    def test_minimize_unknown_algorithm(self):
+        dfa = get_example0()
+        with self.assertRaises(ValueError):
+            dfa.minimize(algorithm="unknown")
+        self.assertEqual(len(dfa.minimize(algorithm="valmari").states), 3)
+
+    def test_minimize_origins(self):
+        dfa = get_example0()
+        for algorithm in ["auto", "hopcroft", "valmari", "moore"]:
+            minimal_dfa, origins = dfa.minimize(algorithm,
+                                                return_origins=True)
+            self.assertEqual(minimal_dfa.start_state, State(0))
+            self.assertEqual(origins[State(0)], {State(0)})
+            self.assertIn(frozenset([State(2), State(3)]), origins.values())
+            for state in minimal_dfa.final_states:
+                self.assertEqual(origins[state], {State(2), State(3)})
+            self.assertTrue(all(isinstance(state.value, int)
+                                for state in minimal_dfa.states))
+        with self.assertRaises(ValueError):
+            dfa.minimize("brzozowski", return_origins=True)
+        minimal_dfa, origins = DeterministicFiniteAutomaton().minimize(
+            return_origins=True)
+        self.assertEqual(origins, {State(0): frozenset()})
+        self.assertEqual(dfa.to_deterministic(return_origins=True)[1][
+            State(1)], {State(1)})
+
+
 def get_example0():
     """ Gives a dfa """
     dfa = DeterministicFiniteAutomaton()
@@ -328,3 +420,38 @@ def get_dfa_example():
     dfa1.add_start_state(State("A"))
     dfa1.add_final_state(State("D"))
     return dfa1
+
+
+def _count_classes(dfa):
+    """ Counts the Myhill-Nerode classes of the reachable states of a DFA \
+    with Moore's algorithm
+
+    Returns the number of classes of states from which a final state can be \
+    reached
+    """
+    states = [dfa.start_state]
+    seen = {dfa.start_state}
+    to_process = deque(states)
+    while to_process:
+        state = to_process.popleft()
+        for symbol in dfa.symbols:
+            for next_state in dfa(state, symbol):
+                if next_state not in seen:
+                    seen.add(next_state)
+                    states.append(next_state)
+                    to_process.append(next_state)
+    states.append(None)
+    classes = {state: state in dfa.final_states for state in states}
+    while True:
+        signatures = {}
+        for state in states:
+            signature = (classes[state],)
+            for symbol in sorted(dfa.symbols, key=str):
+                next_states = dfa(state, symbol) if state is not None else []
+                next_state = next_states[0] if next_states else None
+                signature += (classes[next_state],)
+            signatures[state] = signature
+        if len(set(signatures.values())) == len(set(classes.values())):
+            break
+        classes = signatures
+    return len(set(classes.values())) - 1
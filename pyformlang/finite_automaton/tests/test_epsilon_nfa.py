@@ -6,7 +6,8 @@ import unittest
 
 import networkx
 
-from pyformlang.finite_automaton import EpsilonNFA, State, Symbol, Epsilon
+from pyformlang.finite_automaton import EpsilonNFA, State, Symbol, Epsilon, \
+    NondeterministicFiniteAutomaton
 from ..regexable import Regexable
 
 
@@ -39,6 +40,45 @@ class TestEpsilonNFA(unittest.TestCase):
                          1)
         self.assertFalse(enfa.is_deterministic())
 
+    def test_eclose_cycles(self):
+        enfa = EpsilonNFA()
+        enfa.add_transitions([(0, "epsilon", 1), (1, "epsilon", 2),
+                              (2, "epsilon", 0), (2, "epsilon", 3),
+                              (3, "a", 4), (4, "epsilon", 4),
+                              (4, "epsilon", 5), (5, "epsilon", 3)])
+        self.assertEqual(enfa.eclose(0), {State(x) for x in range(4)})
+        self.assertEqual(enfa.eclose(1), {State(x) for x in range(4)})
+        self.assertEqual(enfa.eclose(4), {State(3), State(4), State(5)})
+        self.assertEqual(enfa.eclose(3), {State(3)})
+        self.assertEqual(enfa.eclose(6), {State(6)})
+        self.assertEqual(enfa.eclose_iterable([3, 5]), {State(3), State(5)})
+        closure = enfa.eclose(0)
+        closure.add(State(10))
+        self.assertNotIn(State(10), enfa.eclose(0))
+
+    def test_eclose_cache_invalidation(self):
+        enfa = EpsilonNFA()
+        enfa.add_transition(0, "epsilon", 1)
+        self.assertEqual(enfa.eclose(0), {State(0), State(1)})
+        enfa.add_transition(1, "epsilon", 2)
+        self.assertEqual(enfa.eclose(0), {State(0), State(1), State(2)})
+        enfa.remove_transition(0, "epsilon", 1)
+        self.assertEqual(enfa.eclose(0), {State(0)})
+        self.assertFalse(enfa.is_deterministic())
+        enfa.remove_transition(1, "epsilon", 2)
+        self.assertTrue(enfa.is_deterministic())
+
+    def test_eclose_long_chain(self):
+        enfa = EpsilonNFA()
+        size = 5000
+        for i in range(size):
+            enfa.add_transition(i, "epsilon", i + 1)
+        enfa.add_transition(size, "epsilon", 0)
+        self.assertEqual(len(enfa.eclose(size // 2)), size + 1)
+        enfa.add_start_state(0)
+        enfa.add_final_state(size)
+        self.assertTrue(enfa.accepts([]))
+
     def test_accept(self):
         """ Test the acceptance """
         self._perform_tests_digits(False)
@@ -47,6 +87,37 @@ class TestEpsilonNFA(unittest.TestCase):
         """ Tests the copy of enda """
         self._perform_tests_digits(True)
 
+    def test_copy_on_write(self):
+        """ Tests that an enfa and its copies do not see their \
+        modifications """
+        enfa = EpsilonNFA()
+        enfa.add_transitions([(0, "a", 1), (1, "epsilon", 2)])
+        enfa.add_start_state(0)
+        enfa.add_final_state(2)
+        self.assertTrue(enfa.accepts(["a"]))
+        enfa_copy = enfa.copy()
+        enfa_copy2 = copy.copy(enfa)
+        self.assertIs(enfa_copy.states, enfa.states)
+        enfa_copy.add_transition(2, "b", 3)
+        enfa_copy.add_final_state(3)
+        enfa_copy.remove_final_state(2)
+        self.assertIsNot(enfa_copy.states, enfa.states)
+        self.assertTrue(enfa_copy.accepts(["a", "b"]))
+        self.assertFalse(enfa_copy.accepts(["a"]))
+        self.assertTrue(enfa.accepts(["a"]))
+        self.assertFalse(enfa.accepts(["a", "b"]))
+        self.assertEqual(len(enfa.states), 3)
+        enfa.remove_transition(0, "a", 1)
+        enfa.remove_start_state(0)
+        self.assertFalse(enfa.accepts(["a"]))
+        self.assertTrue(enfa_copy2.accepts(["a"]))
+        self.assertTrue(enfa_copy.accepts(["a", "b"]))
+        enfa_copy2.add_symbol("c")
+        self.assertNotIn(Symbol("c"), enfa.symbols)
+        nfa = NondeterministicFiniteAutomaton()
+        nfa.add_transition(0, "a", 1)
+        self.assertIsInstance(nfa.copy(), NondeterministicFiniteAutomaton)
+
     def _perform_tests_digits(self, should_copy=False):
         enfa, digits, epsilon, plus, minus, point = get_digits_enfa()
         if should_copy:
@@ -70,6 +141,17 @@ class TestEpsilonNFA(unittest.TestCase):
         self.assertFalse(enfa.accepts(["."]))
         self.assertFalse(enfa.accepts(["+"]))
 
+    def test_accepts_many(self):
+        enfa = get_digits_enfa()[0]
+        words = get_digits_words()
+        res = enfa.accepts_many(words)
+        self.assertEqual(res.dtype, bool)
+        self.assertEqual(list(res), [enfa.accepts(word) for word in words])
+        self.assertEqual(list(res),
+                         [True, True, True, False, False, True, False,
+                          False])
+        self.assertEqual(len(enfa.accepts_many([])), 0)
+
     def test_deterministic(self):
         """ Tests the transformation to a dfa"""
         enfa, digits, _, plus, minus, point = get_digits_enfa()
@@ -87,8 +169,119 @@ class TestEpsilonNFA(unittest.TestCase):
         self.assertFalse(dfa.accepts([point]))
         self.assertFalse(dfa.accepts([plus]))
 
-    def test_remove_state(self):
-        " Tests the remove of state """
+    def test_deterministic_blowup(self):
+        enfa = EpsilonNFA()
+        size = 6
+        enfa.add_start_state(0)
+        enfa.add_final_state(size + 1)
+        enfa.add_transitions([(0, "a", 0), (0, "b", 0), (0, "a", 1)])
+        for i in range(1, size + 1):
+            enfa.add_transition(i, "epsilon", size + 2 + i)
+            enfa.add_transition(size + 2 + i, "a", i + 1)
+            enfa.add_transition(size + 2 + i, "b", i + 1)
+        dfa = enfa.to_deterministic()
+        self.assertTrue(dfa.is_deterministic())
+        self.assertEqual(len(dfa.states), 2 ** (size + 1))
+        self.assertTrue(dfa.accepts(["b", "a"] + ["b"] * size))
+        self.assertFalse(dfa.accepts(["a", "b"] + ["b"] * size))
+        self.assertEqual(len(dfa.minimize().states), 2 ** (size + 1))
+
+    def test_minimize_algorithms(self):
+        enfa, digits, _, plus, minus, point = get_digits_enfa()
+        words = [[plus, digits[1], point, digits[9]],
+                 [minus, digits[1], point],
+                 [point, digits[0]],
+                 [digits[0], point, point],
+                 [plus]]
+        n_states = None
+        for algorithm in ["auto", "hopcroft", "valmari", "moore",
+                          "brzozowski"]:
+            dfa = enfa.minimize(algorithm=algorithm)
+            for word in words:
+                self.assertEqual(dfa.accepts(word), enfa.accepts(word))
+            if algorithm in ["valmari", "brzozowski"]:
+                n_states = n_states or len(dfa.states)
+                self.assertEqual(len(dfa.states), n_states)
+        with self.assertRaises(ValueError):
+            enfa.minimize(algorithm="unknown")
+        self.assertEqual(len(EpsilonNFA().minimize("brzozowski").states), 1)
+
+    def test_origins(self):
+        enfa = get_enfa_example0()
+        dfa, origins = enfa.to_deterministic(return_origins=True)
+        self.assertEqual(dfa.start_state, State(0))
+        self.assertEqual(set(origins), dfa.states)
+        self.assertEqual(origins[State(0)], {State(0), State(1)})
+        self.assertEqual(dfa, enfa.to_deterministic())
+        self.assertTrue(all(isinstance(state.value, int)
+                            for state in dfa.states))
+        minimal_dfa, origins = enfa.minimize(return_origins=True)
+        for state in minimal_dfa.final_states:
+            self.assertIn(State(2), origins[state])
+        with self.assertRaises(ValueError):
+            enfa.minimize("brzozowski", return_origins=True)
+        intersection, pairs = enfa.get_intersection(enfa,
+                                                    return_origins=True)
+        self.assertEqual(set(pairs), intersection.states)
+        for state in intersection.final_states:
+            self.assertEqual(pairs[state], (State(2), State(2)))
+        self.assertTrue(intersection.accepts(["a", "b"]))
+
+    def test_is_included_in(self):
+        enfa, digits, _, plus, minus, point = get_digits_enfa()
+        positive = EpsilonNFA()
+        positive.add_start_state(0)
+        positive.add_final_state(3)
+        positive.add_transitions([(0, plus, 1), (2, point, 3), (3, point, 4)])
+        for digit in digits:
+            positive.add_transition(1, digit, 2)
+            positive.add_transition(2, digit, 2)
+            positive.add_transition(3, digit, 3)
+        self.assertTrue(positive.is_included_in(enfa))
+        self.assertFalse(enfa.is_included_in(positive))
+        self.assertTrue(enfa.is_included_in(enfa))
+        positive.add_transition(0, minus, 1)
+        self.assertTrue(positive.is_included_in(enfa))
+        positive.add_transition(4, digits[0], 3)
+        self.assertFalse(positive.is_included_in(enfa))
+        self.assertTrue(EpsilonNFA().is_included_in(positive))
+        self.assertFalse(enfa.is_included_in(EpsilonNFA()))
+
+    def test_is_included_in_blowup(self):
+        size = 16
+        enfa0 = EpsilonNFA()
+        enfa0.add_start_state(0)
+        enfa0.add_final_state(size + 1)
+        enfa0.add_transitions([(0, "a", 0), (0, "b", 0), (0, "a", 1)])
+        for i in range(1, size + 1):
+            enfa0.add_transition(i, "a", i + 1)
+            enfa0.add_transition(i, "b", i + 1)
+        enfa1 = enfa0.copy()
+        enfa1.add_final_state(size)
+        self.assertTrue(enfa0.is_included_in(enfa1))
+        self.assertFalse(enfa1.is_included_in(enfa0))
+
+    def test_is_universal(self):
+        enfa = EpsilonNFA()
+        enfa.add_start_state(0)
+        enfa.add_start_state(2)
+        enfa.add_final_state(1)
+        enfa.add_transitions([(0, "a", 1), (1, "a", 1), (1, "b", 0),
+                              (2, "b", 1), (2, "epsilon", 3)])
+        self.assertFalse(enfa.is_universal())
+        enfa.add_final_state(3)
+        self.assertFalse(enfa.is_universal())
+        enfa.add_transition(0, "b", 1)
+        self.assertFalse(enfa.is_universal())
+        enfa.add_final_state(0)
+        self.assertTrue(enfa.is_universal())
+        enfa.add_transition(3, "c", 3)
+        self.assertFalse(enfa.is_universal())
+        self.assertFalse(EpsilonNFA().is_universal())
+
+    def test_to_regex_special_symbols(self):
+        """ Tests that the symbols are not parsed by the transformation to \
+        regex """
         enfa = EpsilonNFA()
         state0 = State(0)
         state1 = State(1)
@@ -103,9 +296,11 @@ class TestEpsilonNFA(unittest.TestCase):
         enfa.add_transition(state0, symb02, state2)
         enfa.add_transition(state1, symb11, state1)
         enfa.add_transition(state1, symb12, state2)
-        enfa._remove_all_basic_states()
-        self.assertEqual(enfa.get_number_transitions(), 1)
-        self.assertEqual(len(enfa.states), 2)
+        enfa2 = enfa.to_regex().to_epsilon_nfa()
+        self.assertTrue(enfa2.accepts([symb02]))
+        self.assertTrue(enfa2.accepts([symb01, symb11, symb11, symb12]))
+        self.assertFalse(enfa2.accepts(["a"]))
+        self.assertTrue(enfa2.is_equivalent_to(enfa))
 
     def test_to_regex(self):
         """ Tests the transformation to regex """
@@ -129,8 +324,6 @@ class TestEpsilonNFA(unittest.TestCase):
         self.assertFalse(enfa2.accepts([symb_e]))
         self.assertFalse(enfa2.accepts([symb_f]))
         enfa.add_final_state(state0)
-        with self.assertRaises(ValueError) as _:
-            enfa._get_regex_simple()
         regex = enfa.to_regex()
         enfa3 = regex.to_epsilon_nfa()
         self.assertTrue(enfa3.accepts([symb_e, symb_f]))
@@ -650,6 +843,20 @@ def get_digits_enfa():
     return enfa, digits, epsilon, plus, minus, point
 
 
+def get_digits_words():
+    """ Words to run on the epsilon NFA of get_digits_enfa, mixing symbols, \
+    values and unknown symbols """
+    _, digits, epsilon, plus, _, point = get_digits_enfa()
+    return [[plus, digits[1], point, digits[9]],
+            [digits[1], point, epsilon],
+            ["+", digits[1], ".", digits[9]],
+            [point],
+            [],
+            [point, digits[9]],
+            ["+", "+"],
+            ["x", digits[1], point]]
+
+
 def get_enfa_example0():
     """ Gives an example ENFA
     Accepts a*b
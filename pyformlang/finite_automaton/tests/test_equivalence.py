@@ -0,0 +1,148 @@
+"""
+Tests for the equivalence of finite automata
+"""
+
+import random
+from collections import deque
+import unittest
+
+from pyformlang.finite_automaton import EpsilonNFA, \
+    DeterministicFiniteAutomaton, Epsilon
+from pyformlang.finite_automaton.equivalence import UnionFind
+
+from .test_lazy_dfa import get_blowup_enfa
+
+
+def get_random_enfa(n_states, n_transitions):
+    """ A random epsilon NFA over a and b """
+    enfa = EpsilonNFA()
+    for _ in range(n_transitions):
+        enfa.add_transition(random.randrange(n_states),
+                            random.choice(["a", "b", Epsilon()]),
+                            random.randrange(n_states))
+    enfa.add_start_state(0)
+    enfa.add_final_state(random.randrange(n_states))
+    return enfa
+
+
+def get_first_difference(enfa0, enfa1):
+    """ The length of the shortest word accepted by only one automaton, \
+    by a search on the pairs of states of the deterministic automata """
+    dfa0 = enfa0.to_deterministic()
+    dfa1 = enfa1.to_deterministic()
+    symbols = dfa0.symbols.union(dfa1.symbols)
+    start = (dfa0.start_state, dfa1.start_state)
+    lengths = {start: 0}
+    to_process = deque([start])
+    while to_process:
+        current = to_process.popleft()
+        if (current[0] in dfa0.final_states) != \
+                (current[1] in dfa1.final_states):
+            return lengths[current]
+        for symbol in symbols:
+            next_pair = (_get_next_state(dfa0, current[0], symbol),
+                         _get_next_state(dfa1, current[1], symbol))
+            if next_pair not in lengths:
+                lengths[next_pair] = lengths[current] + 1
+                to_process.append(next_pair)
+    return None
+
+
+def _get_next_state(dfa, state, symbol):
+    """ The next state in a DFA, None for the dead state """
+    if state is None:
+        return None
+    next_states = dfa(state, symbol)
+    return next_states[0] if next_states else None
+
+
+class TestEquivalence(unittest.TestCase):
+    """ Tests for the equivalence of finite automata """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_dfa_equivalent(self):
+        dfa0 = DeterministicFiniteAutomaton()
+        dfa0.add_transitions([(0, "a", 1), (1, "a", 0), (0, "b", 2)])
+        dfa0.add_start_state(0)
+        dfa0.add_final_state(0)
+        dfa1 = DeterministicFiniteAutomaton()
+        dfa1.add_transitions([("x", "a", "y"), ("y", "a", "z"),
+                              ("z", "a", "y")])
+        dfa1.add_start_state("x")
+        dfa1.add_final_state("x")
+        dfa1.add_final_state("z")
+        self.assertTrue(dfa0.is_equivalent_to(dfa1))
+        self.assertIsNone(dfa0.get_distinguishing_word(dfa1))
+        dfa1.add_transition("x", "c", "x")
+        self.assertFalse(dfa0.is_equivalent_to(dfa1))
+        self.assertEqual(dfa0.get_distinguishing_word(dfa1), ["c"])
+
+    def test_empty(self):
+        enfa = EpsilonNFA()
+        dfa = DeterministicFiniteAutomaton()
+        dfa.add_transition(0, "a", 1)
+        dfa.add_start_state(0)
+        self.assertTrue(enfa.is_equivalent_to(dfa))
+        self.assertTrue(dfa.is_equivalent_to(enfa))
+        enfa.add_start_state(0)
+        enfa.add_final_state(0)
+        self.assertFalse(enfa.is_equivalent_to(dfa))
+        self.assertEqual(enfa.get_distinguishing_word(dfa), [])
+
+    def test_blowup(self):
+        enfa0 = get_blowup_enfa(12)
+        enfa1 = get_blowup_enfa(12)
+        enfa1.add_transition(0, Epsilon(), 100)
+        enfa1.add_transition(100, "a", 1)
+        self.assertTrue(enfa0.is_equivalent_to(enfa1))
+        enfa1.add_transition(1, "b", 13)
+        self.assertFalse(enfa0.is_equivalent_to(enfa1))
+        word = enfa0.get_distinguishing_word(enfa1)
+        self.assertEqual(len(word), 2)
+        self.assertNotEqual(enfa0.accepts(word), enfa1.accepts(word))
+
+    def test_random(self):
+        random.seed(42)
+        for i in range(300):
+            enfa0 = get_random_enfa(random.randint(1, 4), 6)
+            if i % 2:
+                enfa1 = enfa0.minimize()
+            else:
+                enfa1 = get_random_enfa(random.randint(1, 4), 6)
+            if not i % 3:
+                enfa0 = enfa0.to_deterministic()
+                enfa1 = enfa1.to_deterministic()
+            word = enfa0.get_distinguishing_word(enfa1)
+            length = get_first_difference(enfa0, enfa1)
+            self.assertEqual(enfa0.is_equivalent_to(enfa1), length is None)
+            if length is None:
+                self.assertIsNone(word)
+            else:
+                self.assertEqual(len(word), length)
+                self.assertNotEqual(enfa0.accepts(word),
+                                    enfa1.accepts(word))
+
+    def test_long_shortest_word(self):
+        cycles = []
+        for length in [6, 4]:
+            dfa = DeterministicFiniteAutomaton()
+            dfa.add_transitions([(i, "a", (i + 1) % length)
+                                 for i in range(length)])
+            dfa.add_start_state(0)
+            dfa.add_final_state(0)
+            cycles.append(dfa)
+        self.assertEqual(cycles[0].get_distinguishing_word(cycles[1]),
+                         ["a"] * 4)
+        # reverse gives epsilon NFAs, compared with HKC
+        self.assertEqual(cycles[1].reverse().get_distinguishing_word(
+            cycles[0].reverse()), ["a"] * 4)
+
+    def test_union_find(self):
+        union_find = UnionFind(5)
+        self.assertTrue(union_find.union(0, 1))
+        self.assertTrue(union_find.union(3, 1))
+        self.assertFalse(union_find.union(0, 3))
+        self.assertEqual(union_find.find(0), union_find.find(3))
+        self.assertNotEqual(union_find.find(0), union_find.find(2))
+        self.assertNotEqual(union_find.find(2), union_find.find(4))
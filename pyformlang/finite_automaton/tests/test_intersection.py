@@ -0,0 +1,101 @@
+"""
+Tests for the emptiness of intersections
+"""
+
+import itertools
+import random
+import unittest
+
+from pyformlang.finite_automaton import EpsilonNFA, \
+    DeterministicFiniteAutomaton, Epsilon, State, Symbol, \
+    intersection_is_empty, get_intersection_witness
+
+from .test_equivalence import get_random_enfa
+from .test_epsilon_nfa import get_digits_enfa
+
+
+def get_modulo_dfa(modulo, symbol, final=0):
+    """ The words over a, b and c in which the number of symbol is final \
+    modulo modulo """
+    dfa = DeterministicFiniteAutomaton()
+    dfa.add_start_state(0)
+    dfa.add_final_state(final)
+    for i in range(modulo):
+        for other in "abc":
+            if other == symbol:
+                dfa.add_transition(i, other, (i + 1) % modulo)
+            else:
+                dfa.add_transition(i, other, i)
+    return dfa
+
+
+class TestIntersection(unittest.TestCase):
+    """ Tests for the emptiness of intersections """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_no_automaton(self):
+        with self.assertRaises(ValueError):
+            intersection_is_empty()
+
+    def test_single(self):
+        enfa = get_digits_enfa()[0]
+        self.assertFalse(intersection_is_empty(enfa))
+        word = get_intersection_witness(enfa)
+        self.assertEqual(len(word), 2)
+        self.assertTrue(enfa.accepts(word))
+        enfa.remove_start_state(State("q0"))
+        self.assertTrue(intersection_is_empty(enfa))
+        self.assertIsNone(get_intersection_witness(enfa))
+
+    def test_epsilon(self):
+        enfa0 = EpsilonNFA()
+        enfa0.add_transitions([(0, Epsilon(), 1), (1, "a", 2),
+                               (2, Epsilon(), 3)])
+        enfa0.add_start_state(0)
+        enfa0.add_final_state(3)
+        enfa1 = EpsilonNFA()
+        enfa1.add_transitions([(0, "a", 1), (1, "a", 2)])
+        enfa1.add_start_state(0)
+        enfa1.add_final_state(1)
+        self.assertEqual(get_intersection_witness(enfa0, enfa1),
+                         [Symbol("a")])
+        enfa1.add_final_state(0)
+        enfa0.add_final_state(0)
+        self.assertEqual(get_intersection_witness(enfa0, enfa1), [])
+
+    def test_several(self):
+        dfas = [get_modulo_dfa(modulo, symbol)
+                for modulo, symbol in [(2, "a"), (3, "a"), (5, "b")]]
+        self.assertFalse(intersection_is_empty(*dfas))
+        self.assertEqual(get_intersection_witness(*dfas), [])
+        dfas = [get_modulo_dfa(2, "a", 1), get_modulo_dfa(3, "a", 0),
+                get_modulo_dfa(5, "b", 1)]
+        word = get_intersection_witness(*dfas)
+        # Three a and one b
+        self.assertEqual(len(word), 4)
+        self.assertEqual(word.count(Symbol("a")), 3)
+        self.assertTrue(all(dfa.accepts(word) for dfa in dfas))
+        dfas.append(get_modulo_dfa(2, "a", 0))
+        self.assertTrue(intersection_is_empty(*dfas))
+        self.assertIsNone(get_intersection_witness(*dfas))
+
+    def test_random(self):
+        random.seed(7)
+        for _ in range(300):
+            automata = [get_random_enfa(random.randint(1, 4), 6)
+                        for _ in range(random.randint(1, 3))]
+            expected = automata[0]
+            for automaton in automata[1:]:
+                expected = expected.get_intersection(automaton)
+            word = get_intersection_witness(*automata)
+            self.assertEqual(intersection_is_empty(*automata),
+                             expected.is_empty())
+            self.assertEqual(word is None, expected.is_empty())
+            if word is not None:
+                self.assertTrue(all(automaton.accepts(word)
+                                    for automaton in automata))
+                for length in range(len(word)):
+                    for shorter in itertools.product("ab", repeat=length):
+                        self.assertFalse(all(automaton.accepts(shorter)
+                                             for automaton in automata))
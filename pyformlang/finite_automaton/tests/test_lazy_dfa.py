@@ -0,0 +1,90 @@
+"""
+Tests for the lazy deterministic finite automata
+"""
+
+import unittest
+
+from pyformlang.finite_automaton import EpsilonNFA, Epsilon, Symbol
+
+from .test_epsilon_nfa import get_digits_enfa, get_digits_words
+
+
+def get_blowup_enfa(size):
+    """ An NFA whose deterministic version has 2 ** (size + 1) states """
+    enfa = EpsilonNFA()
+    enfa.add_start_state(0)
+    enfa.add_final_state(size + 1)
+    enfa.add_transitions([(0, "a", 0), (0, "b", 0), (0, "a", 1)])
+    for i in range(1, size + 1):
+        enfa.add_transition(i, "a", i + 1)
+        enfa.add_transition(i, "b", i + 1)
+    return enfa
+
+
+class TestLazyDFA(unittest.TestCase):
+    """ Tests for lazy deterministic finite automata """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_accepts(self):
+        enfa = get_digits_enfa()[0]
+        lazy_dfa = enfa.to_lazy_deterministic()
+        words = get_digits_words()
+        for word in words:
+            self.assertEqual(lazy_dfa.accepts(word), enfa.accepts(word))
+        self.assertEqual(list(lazy_dfa.accepts_many(words)),
+                         [enfa.accepts(word) for word in words])
+
+    def test_counters(self):
+        lazy_dfa = get_blowup_enfa(2).to_lazy_deterministic()
+        self.assertTrue(lazy_dfa.accepts(["a", "a", "b"]))
+        self.assertEqual(lazy_dfa.misses, 3)
+        self.assertEqual(lazy_dfa.hits, 0)
+        self.assertTrue(lazy_dfa.accepts([Symbol("a"), "a", "b"]))
+        self.assertEqual(lazy_dfa.misses, 3)
+        self.assertEqual(lazy_dfa.hits, 3)
+        self.assertEqual(lazy_dfa.evictions, 0)
+        self.assertEqual(lazy_dfa.number_cached_states, 3)
+        lazy_dfa.reset_statistics()
+        self.assertEqual(lazy_dfa.hits, 0)
+        lazy_dfa.clear()
+        self.assertEqual(lazy_dfa.number_cached_states, 0)
+
+    def test_bounded_cache(self):
+        size = 8
+        enfa = get_blowup_enfa(size)
+        lazy_dfa = enfa.to_lazy_deterministic(max_states=4)
+        word = ["a", "b", "b", "a", "a", "b", "a", "b", "b", "b", "a"]
+        self.assertEqual(lazy_dfa.accepts(word), enfa.accepts(word))
+        self.assertLessEqual(lazy_dfa.number_cached_states, 4)
+        self.assertGreater(lazy_dfa.evictions, 0)
+
+    def test_fallback(self):
+        size = 10
+        enfa = get_blowup_enfa(size)
+        lazy_dfa = enfa.to_lazy_deterministic(max_states=2)
+        word = ["a", "b"] * 20 + ["a"] + ["b"] * size
+        self.assertTrue(lazy_dfa.accepts(word))
+        self.assertEqual(lazy_dfa.fallbacks, 1)
+        self.assertFalse(lazy_dfa.accepts(word + ["b"]))
+        with self.assertRaises(ValueError):
+            enfa.to_lazy_deterministic(max_states=0)
+
+    def test_dead(self):
+        enfa = EpsilonNFA()
+        enfa.add_start_state(0)
+        enfa.add_final_state(1)
+        enfa.add_transitions([(0, "a", 1), (0, "b", 2), (2, "b", 2),
+                              (1, Epsilon(), 3)])
+        lazy_dfa = enfa.to_lazy_deterministic()
+
+        def stream():
+            yield "b"
+            raise AssertionError("Read after death")
+
+        self.assertFalse(lazy_dfa.accepts(stream()))
+        matcher = lazy_dfa.matcher()
+        self.assertFalse(matcher.feed(stream()))
+        matcher.reset()
+        self.assertTrue(matcher.feed(["a", "epsilon"]))
+        self.assertTrue(matcher.is_accepting())
@@ -0,0 +1,118 @@
+"""
+Tests for the lazy views of automata
+"""
+
+import itertools
+import random
+import unittest
+
+from pyformlang.finite_automaton import EpsilonNFA, Epsilon, Symbol, \
+    LazyComplement, LazyUnion, LazyDifference
+
+from .test_equivalence import get_random_enfa
+from .test_lazy_dfa import get_blowup_enfa
+
+
+def get_words(max_length):
+    """ All the words over a, b and c up to a length """
+    return [list(word) for length in range(max_length + 1)
+            for word in itertools.product("abc", repeat=length)]
+
+
+class TestLazyViews(unittest.TestCase):
+    """ Tests for the lazy views of automata """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_complement(self):
+        enfa = EpsilonNFA()
+        enfa.add_transitions([(0, Epsilon(), 1), (1, "a", 1)])
+        enfa.add_start_state(0)
+        enfa.add_final_state(1)
+        complement = enfa.lazy_complement()
+        self.assertIsInstance(complement, LazyComplement)
+        self.assertFalse(complement.accepts([]))
+        self.assertFalse(complement.accepts(["a", Epsilon(), "a"]))
+        # The complement is over the symbols of the automaton
+        self.assertFalse(complement.accepts(["b"]))
+        self.assertTrue(complement.is_empty())
+        self.assertFalse(complement.lazy_complement().is_empty())
+        self.assertTrue(complement.lazy_complement().accepts(["a", "a"]))
+
+    def test_union_difference(self):
+        enfa0 = EpsilonNFA()
+        enfa0.add_transitions([(0, "a", 0), (0, "b", 1)])
+        enfa0.add_start_state(0)
+        enfa0.add_final_state(1)
+        enfa1 = EpsilonNFA()
+        enfa1.add_transitions([(0, "a", 1), (1, "a", 0), (0, "c", 2)])
+        enfa1.add_start_state(0)
+        enfa1.add_final_state(2)
+        union = enfa0.lazy_union(enfa1)
+        self.assertIsInstance(union, LazyUnion)
+        self.assertTrue(union.accepts(["a", "b"]))
+        self.assertTrue(union.accepts([Symbol("a"), "a", "c"]))
+        self.assertFalse(union.accepts(["a", "c"]))
+        self.assertEqual(union.symbols, {Symbol("a"), Symbol("b"),
+                                         Symbol("c")})
+        difference = union.lazy_difference(enfa1)
+        self.assertIsInstance(difference, LazyDifference)
+        self.assertFalse(difference.accepts(["a", "a", "c"]))
+        self.assertTrue(difference.accepts(["b"]))
+        self.assertTrue(difference.lazy_difference(enfa0).is_empty())
+        self.assertFalse(enfa0.lazy_difference(enfa1).is_empty())
+
+    def test_matcher(self):
+        enfa0 = EpsilonNFA()
+        enfa0.add_transitions([(0, "a", 0), (0, "b", 1)])
+        enfa0.add_start_state(0)
+        enfa0.add_final_state(1)
+        enfa1 = EpsilonNFA()
+        enfa1.add_transition(0, "c", 0)
+        enfa1.add_start_state(0)
+        enfa1.add_final_state(0)
+        matcher = enfa0.lazy_complement().lazy_union(enfa1).matcher()
+        self.assertTrue(matcher.feed(["a", "a"]))
+        self.assertTrue(matcher.is_accepting())
+        self.assertTrue(matcher.feed(["b"]))
+        self.assertFalse(matcher.is_accepting())
+        self.assertTrue(matcher.feed(["a"]))
+        self.assertTrue(matcher.is_accepting())
+        # c is not a symbol of the complement, and enfa1 is dead
+        self.assertFalse(matcher.feed(["c"]))
+        self.assertTrue(matcher.is_dead())
+        matcher.reset()
+        self.assertTrue(matcher.feed(["c", "c"]))
+        self.assertTrue(matcher.is_accepting())
+
+    def test_shared_memory(self):
+        enfa = get_blowup_enfa(10)
+        view = enfa.to_lazy_view()
+        self.assertIs(view, enfa.to_lazy_view())
+        complement = enfa.lazy_complement()
+        self.assertTrue(complement.accepts(["b"] * 20))
+        self.assertFalse(view.accepts(["b"] * 20))
+        enfa.add_transition(0, "c", 11)
+        self.assertIsNot(view, enfa.to_lazy_view())
+        self.assertTrue(enfa.to_lazy_view().accepts(["c"]))
+        self.assertFalse(view.accepts(["c"]))
+
+    def test_random(self):
+        random.seed(11)
+        words = get_words(5)
+        for _ in range(100):
+            enfa0 = get_random_enfa(random.randint(1, 4), 6)
+            enfa1 = get_random_enfa(random.randint(1, 4), 6)
+            view = enfa0.lazy_complement().lazy_union(enfa1) \
+                .lazy_difference(enfa0.lazy_difference(enfa1))
+            symbols0 = {symbol.value for symbol in enfa0.symbols}
+            for word in words:
+                in_complement = not enfa0.accepts(word) and \
+                    all(symbol in symbols0 for symbol in word)
+                expected = (in_complement or enfa1.accepts(word)) and \
+                    not (enfa0.accepts(word) and not enfa1.accepts(word))
+                self.assertEqual(view.accepts(word), expected)
+            self.assertEqual(enfa0.lazy_complement().is_empty(),
+                             enfa0.is_universal())
+            self.assertEqual(enfa0.lazy_difference(enfa1).is_empty(),
+                             enfa0.is_included_in(enfa1))
@@ -0,0 +1,78 @@
+"""
+Tests for the incremental matchers
+"""
+
+import unittest
+
+from pyformlang.finite_automaton import EpsilonNFA, Epsilon, Symbol
+
+from .test_deterministic_finite_automaton import get_example0
+from .test_epsilon_nfa import get_digits_enfa
+
+
+class TestMatcher(unittest.TestCase):
+    """ Tests for the incremental matchers """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_dfa_matcher(self):
+        matcher = get_example0().matcher()
+        self.assertFalse(matcher.is_accepting())
+        self.assertFalse(matcher.is_dead())
+        self.assertTrue(matcher.feed(["a"]))
+        self.assertTrue(matcher.feed(iter(["b", "b"])))
+        self.assertFalse(matcher.is_accepting())
+        self.assertTrue(matcher.feed([Symbol("c")]))
+        self.assertTrue(matcher.is_accepting())
+        self.assertFalse(matcher.feed(["c"]))
+        self.assertTrue(matcher.is_dead())
+        self.assertFalse(matcher.is_accepting())
+        matcher.reset()
+        self.assertFalse(matcher.is_dead())
+        self.assertTrue(matcher.feed(["a", "d"]))
+        self.assertTrue(matcher.is_accepting())
+
+    def test_dfa_matcher_stops_reading(self):
+        matcher = get_example0().matcher()
+
+        def stream():
+            yield "d"
+            raise AssertionError("Read after death")
+
+        self.assertFalse(matcher.feed(stream()))
+        self.assertFalse(matcher.feed(stream()))
+        self.assertTrue(matcher.is_dead())
+
+    def test_nfa_matcher(self):
+        enfa, digits, epsilon, plus, _, point = get_digits_enfa()
+        matcher = enfa.matcher()
+        self.assertTrue(matcher.feed([plus, digits[1]]))
+        self.assertFalse(matcher.is_accepting())
+        self.assertTrue(matcher.feed([epsilon, "."]))
+        self.assertTrue(matcher.is_accepting())
+        self.assertTrue(matcher.feed([digits[3], digits[4]]))
+        self.assertTrue(matcher.is_accepting())
+        self.assertFalse(matcher.feed([point]))
+        self.assertTrue(matcher.is_dead())
+        matcher.reset()
+        self.assertFalse(matcher.is_accepting())
+        self.assertTrue(matcher.feed(["-", digits[0], point]))
+        self.assertTrue(matcher.is_accepting())
+
+    def test_nfa_early_death(self):
+        enfa = EpsilonNFA()
+        enfa.add_start_state(0)
+        enfa.add_final_state(2)
+        enfa.add_transitions([(0, "a", 1), (1, "b", 2), (0, "b", 3),
+                              (3, "a", 3), (3, Epsilon(), 4)])
+        matcher = enfa.matcher()
+        self.assertFalse(matcher.feed(["b"]))
+        self.assertTrue(matcher.is_dead())
+        matcher.reset()
+        self.assertTrue(matcher.feed(["a", "b"]))
+        self.assertTrue(matcher.is_accepting())
+
+    def test_empty_automaton(self):
+        matcher = EpsilonNFA().matcher()
+        self.assertTrue(matcher.is_dead())
+        self.assertFalse(matcher.is_accepting())
@@ -0,0 +1,75 @@
+"""
+Tests for the determinization with several processes
+"""
+
+import random
+import unittest
+from unittest import mock
+
+from pyformlang.finite_automaton import NondeterministicFiniteAutomaton
+from pyformlang.finite_automaton import parallel_determinization
+
+from .test_equivalence import get_random_enfa
+from .test_lazy_dfa import get_blowup_enfa
+
+
+def get_renamed_transitions(dfa, origins):
+    """ The transitions of a dfa, with each state named by its origins """
+    return {(origins[s_from], symbol, origins[s_to])
+            for s_from, symbol, s_to in dfa}
+
+
+class TestParallelDeterminization(unittest.TestCase):
+    """ Tests for the determinization with several processes """
+
+    def assert_same_dfa(self, nfa, workers):
+        """ Checks that the dfa does not depend on the number of workers """
+        dfa0, origins0 = nfa.to_deterministic(return_origins=True)
+        dfa1, origins1 = nfa.to_deterministic(return_origins=True,
+                                              workers=workers)
+        self.assertEqual(len(dfa0.states), len(dfa1.states))
+        self.assertEqual(origins0[dfa0.start_state],
+                         origins1[dfa1.start_state])
+        self.assertEqual(
+            {origins0[state] for state in dfa0.final_states},
+            {origins1[state] for state in dfa1.final_states})
+        self.assertEqual(get_renamed_transitions(dfa0, origins0),
+                         get_renamed_transitions(dfa1, origins1))
+
+    def test_blowup(self):
+        """ Tests an automaton with large frontiers """
+        enfa = get_blowup_enfa(9)
+        self.assert_same_dfa(enfa, 2)
+        dfa = enfa.to_deterministic(workers=3)
+        self.assertEqual(len(dfa.states), 2 ** 10)
+        self.assertTrue(dfa.is_equivalent_to(enfa))
+
+    def test_random(self):
+        """ Tests random automata, explored by the main process """
+        random.seed(17)
+        for _ in range(10):
+            self.assert_same_dfa(get_random_enfa(8, 20), 2)
+
+    def test_no_pool_for_small_frontiers(self):
+        """ Tests that no process is started when all the frontiers are \
+        small """
+        with mock.patch.object(parallel_determinization, "Pool") as pool:
+            dfa = get_blowup_enfa(3).to_deterministic(workers=2)
+        self.assertEqual(len(dfa.states), 2 ** 4)
+        pool.assert_not_called()
+
+    def test_nfa(self):
+        """ Tests an automaton without epsilon transitions """
+        nfa = NondeterministicFiniteAutomaton()
+        nfa.add_transitions([(0, "a", 0), (0, "a", 1), (1, "b", 2)])
+        nfa.add_start_state(0)
+        nfa.add_final_state(2)
+        dfa = nfa.to_deterministic(workers=2)
+        self.assertTrue(dfa.accepts(["a", "a", "b"]))
+        self.assertFalse(dfa.accepts(["b"]))
+        self.assertIs(dfa.to_deterministic(workers=2), dfa)
+
+    def test_workers(self):
+        """ Tests an invalid number of workers """
+        with self.assertRaises(ValueError):
+            get_blowup_enfa(2).to_deterministic(workers=0)
@@ -48,3 +48,14 @@ class TestState(unittest.TestCase):
         self.assertEqual(state1, state3)
         self.assertNotEqual(state2, state3)
         self.assertNotEqual(state1, state2)
+
+    def test_slots(self):
+        """ Tests that the states have no attribute dictionary
+        """
+        state = State("ABC")
+        self.assertFalse(hasattr(state, "__dict__"))
+        with self.assertRaises(AttributeError):
+            state.other = 1
+        # An interned state is shared, so it has no mutable attribute
+        with self.assertRaises(AttributeError):
+            state.index_cfg_converter = 2
@@ -0,0 +1,105 @@
+"""
+Tests for the transformation of automata into regular expressions
+"""
+
+import random
+import unittest
+
+from pyformlang.finite_automaton import EpsilonNFA, Epsilon
+from pyformlang.finite_automaton.state_elimination import to_regex, \
+    ELIMINATION_ORDERS
+from pyformlang.regular_expression import Regex
+
+from .test_equivalence import get_random_enfa
+
+
+def get_chain_enfa(n_states):
+    """ A chain of states reading a or b, which can also go back to the \
+    start """
+    enfa = EpsilonNFA()
+    for i in range(n_states - 1):
+        enfa.add_transition(i, "a", i + 1)
+        enfa.add_transition(i, "b", i + 1)
+        enfa.add_transition(i + 1, "c", 0)
+    enfa.add_start_state(0)
+    enfa.add_final_state(n_states - 1)
+    return enfa
+
+
+def count_nodes(regex, visited=None):
+    """ The number of distinct nodes of a regex """
+    if visited is None:
+        visited = set()
+    if id(regex) in visited:
+        return 0
+    visited.add(id(regex))
+    return 1 + sum(count_nodes(son, visited) for son in regex.sons)
+
+
+class TestStateElimination(unittest.TestCase):
+    """ Tests for the transformation of automata into regular expressions """
+
+    def test_orders(self):
+        """ Tests the regex given by each order """
+        enfa = EpsilonNFA()
+        enfa.add_transitions([(0, "a", 1), (1, "b", 1), (1, "c", 2),
+                              (2, "epsilon", 0), (0, "d", 2)])
+        enfa.add_start_state(0)
+        enfa.add_final_state(2)
+        for order in ELIMINATION_ORDERS:
+            regex = to_regex(enfa, order)
+            self.assertTrue(regex.accepts(["a", "b", "b", "c"]))
+            self.assertTrue(regex.accepts(["d", "a", "c"]))
+            self.assertFalse(regex.accepts(["a", "b"]))
+            self.assertTrue(regex.to_epsilon_nfa().is_equivalent_to(enfa))
+            self.assertTrue(enfa.to_regex(order=order).accepts(["d"]))
+        with self.assertRaises(ValueError):
+            enfa.to_regex(order="random")
+
+    def test_trivial(self):
+        """ Tests the empty language and the empty word """
+        enfa = EpsilonNFA()
+        enfa.add_transition(0, "a", 1)
+        enfa.add_start_state(0)
+        regex = enfa.to_regex()
+        self.assertFalse(regex.accepts([]))
+        self.assertTrue(regex.to_epsilon_nfa().is_empty())
+        enfa.add_final_state(0)
+        regex = enfa.to_regex()
+        self.assertTrue(regex.accepts([]))
+        self.assertFalse(regex.accepts(["a"]))
+        enfa.add_transition(0, Epsilon(), 2)
+        enfa.add_final_state(2)
+        self.assertTrue(enfa.to_regex().accepts([]))
+        self.assertEqual(str(EpsilonNFA().to_regex()), str(Regex("")))
+
+    def test_random(self):
+        """ Tests the regex of random automata """
+        random.seed(16)
+        for _ in range(40):
+            enfa = get_random_enfa(6, 12)
+            for order in ELIMINATION_ORDERS:
+                enfa2 = enfa.to_regex(order).to_epsilon_nfa()
+                self.assertTrue(enfa2.is_equivalent_to(enfa))
+
+    def test_sharing(self):
+        """ Tests that the subexpressions are shared """
+        enfa = get_chain_enfa(30)
+        regex = enfa.to_regex()
+        self.assertLess(count_nodes(regex), 2000)
+        self.assertTrue(regex.accepts(["a", "b"] * 14 + ["a"]))
+        self.assertTrue(regex.accepts(["a", "c"] + ["b"] * 29))
+        self.assertFalse(regex.accepts(["a", "c"] + ["b"] * 28))
+
+    def test_large(self):
+        """ Tests an automaton with many states """
+        random.seed(3)
+        enfa = EpsilonNFA()
+        for i in range(2000):
+            enfa.add_transition(i, random.choice("ab"), i + 1)
+            if i % 10 == 0:
+                enfa.add_transition(i, "c", i + 5)
+        enfa.add_start_state(0)
+        enfa.add_final_state(2000)
+        regex = enfa.to_regex()
+        self.assertIsNotNone(regex.head)
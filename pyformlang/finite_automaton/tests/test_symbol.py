@@ -5,7 +5,7 @@ Tests for the symbols
 
 import unittest
 
-from pyformlang.finite_automaton import Symbol
+from pyformlang.finite_automaton import Symbol, Epsilon
 
 
 class TestSymbol(unittest.TestCase):
@@ -47,3 +47,9 @@ class TestSymbol(unittest.TestCase):
         self.assertEqual(symbol1, symbol3)
         self.assertNotEqual(symbol2, symbol3)
         self.assertNotEqual(symbol1, symbol2)
+
+    def test_slots(self):
+        """ Tests that the symbols have no attribute dictionary
+        """
+        self.assertFalse(hasattr(Symbol("A"), "__dict__"))
+        self.assertFalse(hasattr(Epsilon(), "__dict__"))
@@ -0,0 +1,80 @@
+"""
+Tests for the counting and the sampling of words
+"""
+
+import itertools
+import random
+import unittest
+from collections import Counter
+
+from pyformlang.finite_automaton import EpsilonNFA, \
+    DeterministicFiniteAutomaton, Symbol
+
+from .test_equivalence import get_random_enfa
+
+
+class TestWordCounting(unittest.TestCase):
+    """ Tests for the counting and the sampling of words """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_random(self):
+        random.seed(21)
+        for _ in range(20):
+            enfa = get_random_enfa(5, 12)
+            for length in range(6):
+                n_words = sum(
+                    1 for word in itertools.product("ab", repeat=length)
+                    if enfa.accepts(word))
+                self.assertEqual(enfa.count_words(length), n_words)
+                if n_words:
+                    for word in enfa.sample_words(length, 5, seed=length):
+                        self.assertEqual(len(word), length)
+                        self.assertTrue(enfa.accepts(word))
+
+    def test_big_counts(self):
+        dfa = DeterministicFiniteAutomaton()
+        for symbol in "abcd":
+            dfa.add_transition(0, symbol, 0)
+        dfa.add_start_state(0)
+        dfa.add_final_state(0)
+        self.assertEqual(dfa.count_words(10), 4 ** 10)
+        self.assertEqual(dfa.count_words(100), 4 ** 100)
+        self.assertEqual(dfa.count_words(40), 4 ** 40)
+        self.assertEqual(len(dfa.sample_words(100, 3)[2]), 100)
+        self.assertEqual(dfa.count_words(-1), 0)
+
+    def test_uniform(self):
+        # The words of length 3 are aaa, and all the b followed by two
+        # symbols among a, b and c
+        enfa = EpsilonNFA()
+        enfa.add_transitions([(0, "a", 1), (1, "a", 2), (2, "a", 3),
+                              (0, "b", 4), (4, "epsilon", 5)])
+        for symbol in "abc":
+            enfa.add_transition(5, symbol, 5)
+        enfa.add_start_state(0)
+        enfa.add_final_state(3)
+        enfa.add_final_state(5)
+        self.assertEqual(enfa.count_words(3), 10)
+        words = enfa.sample_words(3, 10000, seed=0)
+        frequencies = Counter(tuple(word) for word in words)
+        self.assertEqual(len(frequencies), 10)
+        for frequency in frequencies.values():
+            self.assertGreater(frequency, 800)
+            self.assertLess(frequency, 1200)
+        self.assertEqual(enfa.sample_words(3, 5, seed=1),
+                         enfa.sample_words(3, 5, seed=1))
+        self.assertEqual(enfa.sample_words(1, 1), [[Symbol("b")]])
+
+    def test_no_word(self):
+        enfa = EpsilonNFA()
+        self.assertEqual(enfa.count_words(2), 0)
+        enfa.add_transition(0, "a", 1)
+        enfa.add_start_state(0)
+        enfa.add_final_state(1)
+        self.assertEqual(enfa.count_words(1), 1)
+        with self.assertRaises(ValueError):
+            enfa.sample_words(2)
+        enfa.add_transition(1, "a", 1)
+        self.assertEqual(enfa.count_words(2), 1)
+        self.assertEqual(enfa.sample_words(2), [[Symbol("a")] * 2])
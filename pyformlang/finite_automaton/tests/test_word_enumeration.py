@@ -0,0 +1,112 @@
+"""
+Tests for the enumeration of the accepted words
+"""
+
+import itertools
+import random
+import unittest
+
+from pyformlang.finite_automaton import EpsilonNFA, \
+    DeterministicFiniteAutomaton, Symbol
+
+from .test_equivalence import get_random_enfa
+
+
+def get_shortlex_words(enfa, max_length):
+    """ The accepted words up to a length, by brute force """
+    return [[Symbol(symbol) for symbol in word]
+            for length in range(max_length + 1)
+            for word in itertools.product("ab", repeat=length)
+            if enfa.accepts(word)]
+
+
+class TestWordEnumeration(unittest.TestCase):
+    """ Tests for the enumeration of the accepted words """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_random(self):
+        random.seed(22)
+        for _ in range(20):
+            enfa = get_random_enfa(5, 12)
+            enfa.add_symbol("a")
+            enfa.add_symbol("b")
+            words = list(enfa.iter_words(max_length=5))
+            self.assertEqual(words, get_shortlex_words(enfa, 5))
+            for length in range(6):
+                self.assertEqual(
+                    sum(1 for word in words if len(word) == length),
+                    enfa.count_words(length))
+
+    def test_infinite(self):
+        dfa = DeterministicFiniteAutomaton()
+        dfa.add_transitions([(0, "a", 0), (0, "b", 1), (1, "a", 1),
+                             (1, "b", 0), (0, "c", 2)])
+        dfa.add_start_state(0)
+        dfa.add_final_state(1)
+        words = list(itertools.islice(dfa.iter_words(), 6))
+        self.assertEqual([len(word) for word in words], [1, 2, 2, 3, 3, 3])
+        self.assertEqual(words[1], [Symbol("a"), Symbol("b")])
+        self.assertEqual(words[2], [Symbol("b"), Symbol("a")])
+
+    def test_resume(self):
+        enfa = EpsilonNFA()
+        enfa.add_transitions([(0, "a", 0), (0, "b", 0), (0, "epsilon", 1),
+                              (1, "a", 2)])
+        enfa.add_start_state(0)
+        enfa.add_final_state(2)
+        words = list(enfa.iter_words(max_length=6))
+        self.assertEqual(len(words), 1 + 2 + 4 + 8 + 16 + 32)
+        for position in [0, 5, 20, 62]:
+            resumed = list(enfa.iter_words(max_length=6,
+                                           start_after=words[position]))
+            self.assertEqual(resumed, words[position + 1:])
+        resumed = enfa.iter_words(start_after=["b", "b"])
+        self.assertEqual(next(resumed), [Symbol("a")] * 3)
+        # The cursor is checked before the first word is asked
+        with self.assertRaises(ValueError):
+            enfa.iter_words(start_after=["c"])
+
+    def test_resume_random(self):
+        random.seed(23)
+        for _ in range(20):
+            enfa = get_random_enfa(5, 12)
+            enfa.add_symbol("a")
+            enfa.add_symbol("b")
+            words = list(enfa.iter_words(max_length=5))
+            known = {str(symbol) for symbol in enfa.to_deterministic().symbols}
+            cursors = words + [[Symbol(symbol) for symbol in word]
+                               for word in ["", "b", "ab", "bba", "aaaaa"]
+                               if known.issuperset(word)]
+            for cursor in cursors:
+                following = [word for word in words
+                             if (len(word), [str(symbol) for symbol in word])
+                             > (len(cursor),
+                                [str(symbol) for symbol in cursor])]
+                self.assertEqual(list(enfa.iter_words(max_length=5,
+                                                      start_after=cursor)),
+                                 following)
+
+    def test_resume_long_word(self):
+        # Resuming does not go through the 2 ** 60 words before the cursor
+        dfa = DeterministicFiniteAutomaton()
+        dfa.add_transitions([(0, "a", 0), (0, "b", 0)])
+        dfa.add_start_state(0)
+        dfa.add_final_state(0)
+        words = dfa.iter_words(start_after=["a"] * 59 + ["b"])
+        self.assertEqual(next(words),
+                         [Symbol("a")] * 58 + [Symbol("b"), Symbol("a")])
+        words = dfa.iter_words(start_after=["b"] * 60)
+        self.assertEqual(next(words), [Symbol("a")] * 61)
+
+    def test_finite(self):
+        enfa = EpsilonNFA()
+        self.assertEqual(list(enfa.iter_words()), [])
+        enfa.add_transitions([(0, "a", 1), (1, "b", 2), (0, "b", 1),
+                              (2, "a", 3), (3, "a", 3)])
+        enfa.add_start_state(0)
+        enfa.add_final_state(0)
+        enfa.add_final_state(2)
+        self.assertEqual(list(enfa.iter_words()),
+                         [[], [Symbol("a"), Symbol("b")],
+                          [Symbol("b"), Symbol("b")]])
@@ -121,6 +121,29 @@ class TransitionFunction:
             return 1
         return 0
 
+    def copy(self) -> "TransitionFunction":
+        """ Copies the transition function
+
+        Returns
+        ----------
+        copied : :class:`~pyformlang.finite_automaton.TransitionFunction`
+            An independent copy of the function
+
+        Examples
+        --------
+
+        >>> transition = TransitionFunction()
+        >>> transition.add_transition(State(0), Symbol("a"), State(1))
+        >>> transition.copy().get_number_transitions()
+        1
+
+        """
+        copied = TransitionFunction()
+        copied._transitions = {  # pylint: disable=protected-access
+            s_from: dict(transitions)
+            for s_from, transitions in self._transitions.items()}
+        return copied
+
     def __call__(self, s_from: State, symb_by: Symbol = None) -> List[State]:
         """ Calls the transition function as a real function
 
@@ -0,0 +1,200 @@
+"""
+Counting and uniform sampling of the words of a given length accepted by \
+a deterministic automaton
+"""
+
+import random
+from typing import List, Optional
+
+import numpy as np
+
+from .symbol import Symbol
+
+# Above this value, the counts are stored as Python integers, which cannot
+# overflow, instead of 64-bit integers
+MAX_FIXED_SIZE_COUNT = 2 ** 62
+
+
+class WordCounter:
+    """ The number of words of each length accepted from each state of a \
+    deterministic automaton
+
+    The count tables are computed length by length, by a vectorized \
+    dynamic programming: the words of length n accepted from a state are \
+    those starting with a symbol and followed by a word of length n - 1 \
+    accepted from the next state. The tables are kept, so that the next \
+    queries on shorter words are free and those on longer words only \
+    compute the missing lengths.
+
+    Parameters
+    ----------
+    dfa : :class:`~pyformlang.finite_automaton.DeterministicFiniteAutomaton`
+        The automaton
+    """
+
+    def __init__(self, dfa: "DeterministicFiniteAutomaton"):
+        states = list(dfa.states)
+        state_ids = {state: i for i, state in enumerate(states)}
+        # The symbols are sorted so that the samples do not depend on the
+        # hash seed
+        self._symbols = sorted(dfa.symbols, key=str)
+        # The last state is the dead state, reached by the missing
+        # transitions
+        dead = len(states)
+        self._next_states = np.full((len(self._symbols), len(states) + 1),
+                                    dead, dtype=np.intp)
+        for i, symbol in enumerate(self._symbols):
+            for state in states:
+                next_states = dfa(state, symbol)
+                if next_states:
+                    self._next_states[i, state_ids[state]] = \
+                        state_ids[next_states[0]]
+        self._start: Optional[int] = None
+        if dfa.start_states:
+            self._start = state_ids[list(dfa.start_states)[0]]
+        finals = np.zeros(len(states) + 1, dtype=np.int64)
+        for state in dfa.final_states:
+            finals[state_ids[state]] = 1
+        self._counts: List[np.ndarray] = [finals]
+
+    def get_counts(self, length: int) -> np.ndarray:
+        """ Gives, for each state, the number of words of a given length \
+        accepted from it """
+        while len(self._counts) <= length:
+            previous = self._counts[-1]
+            if previous.dtype != object and \
+                    int(previous.max()) * len(self._symbols) \
+                    >= MAX_FIXED_SIZE_COUNT:
+                previous = previous.astype(object)
+            counts = np.zeros_like(previous)
+            for next_states in self._next_states:
+                counts += previous[next_states]
+            self._counts.append(counts)
+        return self._counts[length]
+
+    def count(self, length: int) -> int:
+        """ The number of accepted words of a given length """
+        if length < 0 or self._start is None:
+            return 0
+        return int(self.get_counts(length)[self._start])
+
+    def sample(self, length: int, n_words: int,
+               generator: random.Random) -> List[List[Symbol]]:
+        """ Draws accepted words of a given length uniformly at random
+
+        Each word is built symbol by symbol. In a state from which r more \
+        symbols must be read, a symbol is drawn with a probability \
+        proportional to the number of words of length r - 1 accepted from \
+        the state it leads to.
+        """
+        n_accepted = self.count(length)
+        if n_accepted == 0:
+            raise ValueError("No word of length " + str(length) +
+                             " is accepted")
+        tables = [counts.tolist() for counts in self._counts[:length + 1]]
+        next_states = self._next_states.T.tolist()
+        words = []
+        for _ in range(n_words):
+            current = self._start
+            word = []
+            for remaining in range(length, 0, -1):
+                counts = tables[remaining - 1]
+                position = generator.randrange(tables[remaining][current])
+                for i, next_state in enumerate(next_states[current]):
+                    position -= counts[next_state]
+                    if position < 0:
+                        word.append(self._symbols[i])
+                        current = next_state
+                        break
+            words.append(word)
+        return words
+
+
+class WordCountingMixin:
+    """ Gives the counting and the sampling of the words accepted by \
+    epsilon NFAs
+    """
+
+    def _get_word_counter(self) -> WordCounter:
+        """ Gives the tables counting the accepted words, kept until the \
+        automaton is modified """
+        counter = self._cache.get("word_counter")
+        if counter is None:
+            counter = WordCounter(self.to_deterministic())
+            self._cache["word_counter"] = counter
+        return counter
+
+    def count_words(self, length: int) -> int:
+        """ Counts the accepted words of a given length
+
+        The automaton is determinized, then the number of words accepted \
+        from each state is computed for each length up to the one asked, \
+        with one vectorized step per length. The counts are exact, even \
+        when they exceed 64 bits. The tables are kept until the automaton \
+        is modified, so later queries only compute the missing lengths.
+
+        Parameters
+        ----------
+        length : int
+            The length of the words
+
+        Returns
+        ----------
+        n_words : int
+            The number of accepted words of this length
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "a", 0), (0, "b", 0), (0, "a", 1)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> enfa.count_words(3)
+        4
+
+        """
+        return self._get_word_counter().count(length)
+
+    def sample_words(self, length: int, n_words: int = 1,
+                     seed: int = None) -> List[List[Symbol]]:
+        """ Draws accepted words of a given length, uniformly at random
+
+        The words are drawn symbol by symbol, using the tables of \
+        count_words: each symbol is chosen with a probability proportional \
+        to the number of accepted words continuing with it. The tables are \
+        computed once for all the words drawn.
+
+        Parameters
+        ----------
+        length : int
+            The length of the words
+        n_words : int, optional
+            The number of words to draw, independently
+        seed : int, optional
+            The seed of the random generator, for reproducible draws
+
+        Returns
+        ----------
+        words : list of lists of :class:`~pyformlang.finite_automaton.Symbol`
+            The words drawn
+
+        Raises
+        ----------
+        ValueError
+            If no word of this length is accepted
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "a", 0), (0, "b", 0), (0, "a", 1)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> words = enfa.sample_words(3, n_words=10, seed=42)
+        >>> all(enfa.accepts(word) for word in words)
+        True
+
+        """
+        return self._get_word_counter().sample(length, n_words,
+                                               random.Random(seed))
@@ -0,0 +1,234 @@
+"""
+Enumeration of the words accepted by a deterministic automaton, in \
+shortlex order
+"""
+
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, \
+    Tuple
+
+from .state import State
+from .symbol import Symbol
+from .finite_automaton import to_symbol
+
+
+def iter_words(dfa: "DeterministicFiniteAutomaton",
+               max_length: Optional[int] = None,
+               start_after: Optional[Iterable[Symbol]] = None) \
+        -> Iterator[List[Symbol]]:
+    """ Enumerates the words accepted by a deterministic automaton, by \
+    increasing length and then in lexicographic order
+
+    The automaton is trimmed to its useful states. For each length, the \
+    states from which an accepted word of exactly the remaining length can \
+    be read are computed, and the words of this length are explored depth \
+    first, without ever entering a dead end. The memory used is \
+    proportional to the length times the number of states, and each word \
+    costs at most its length times the number of symbols.
+
+    The enumeration resumes from a word by walking along its path in the \
+    automaton, which costs its length times the number of symbols, after \
+    computing the states of each length up to its length.
+
+    Parameters
+    ----------
+    dfa : :class:`~pyformlang.finite_automaton.DeterministicFiniteAutomaton`
+        The automaton
+    max_length : int, optional
+        The maximum length of the words, unbounded by default
+    start_after : iterable of :class:`~pyformlang.finite_automaton.Symbol`, \
+    optional
+        A word after which to resume the enumeration, like the last word \
+        given by a previous enumeration
+
+    Returns
+    ----------
+    words : iterator of lists of :class:`~pyformlang.finite_automaton.Symbol`
+        The accepted words
+
+    Raises
+    ----------
+    ValueError
+        If the word after which to resume contains an unknown symbol
+    """
+    # The symbols are sorted so that the order does not depend on the hash
+    # seed
+    symbols = sorted(dfa.symbols, key=str)
+    # The cursor is checked now, and not on the first word asked
+    cursor = _get_cursor(start_after, symbols)
+    return _iter_words(dfa, symbols, max_length, cursor)
+
+
+def _iter_words(dfa: "DeterministicFiniteAutomaton",
+                symbols: List[Symbol],
+                max_length: Optional[int],
+                cursor: Optional[List[int]]) -> Iterator[List[Symbol]]:
+    """ Enumerates the accepted words, the symbols being sorted and the \
+    cursor given by the ids of its symbols """
+    useful_states = dfa.get_useful_states()
+    transitions = {
+        state: [(i, next_state)
+                for i, symbol in enumerate(symbols)
+                for next_state in dfa(state, symbol)
+                if next_state in useful_states]
+        for state in useful_states}
+    starts = [start for start in dfa.start_states if start in useful_states]
+    if not starts:
+        return
+    longest_word_length = dfa.get_longest_word_length()
+    if max_length is None or longest_word_length < max_length:
+        max_length = longest_word_length
+    # For each length, the states from which an accepted word of this
+    # length can be read
+    completions = [useful_states.intersection(dfa.final_states)]
+    length = 0 if cursor is None else len(cursor)
+    while length <= max_length:
+        while len(completions) <= length:
+            completions.append(frozenset(
+                state for state in useful_states
+                if any(next_state in completions[-1]
+                       for _, next_state in transitions[state])))
+        for word in _iter_words_of_length(starts[0], transitions,
+                                          completions, length, cursor):
+            yield [symbols[i] for i in word]
+        cursor = None
+        length += 1
+
+
+def _iter_words_of_length(
+        start: State,
+        transitions: Dict[State, List[Tuple[int, State]]],
+        completions: List[FrozenSet[State]],
+        length: int,
+        cursor: Optional[List[int]]) -> Iterator[List[int]]:
+    """ Enumerates the ids of the symbols of the accepted words of a \
+    length, in lexicographic order, after the cursor if any """
+    if start not in completions[length]:
+        return
+    # The states of the path being explored, with the position in their
+    # transitions of the next one to try
+    stack = [[start, 0]]
+    word = []
+    if cursor is not None:
+        _follow_cursor(stack, word, transitions, completions, cursor)
+    while stack:
+        state, position = stack[-1]
+        if len(word) == length:
+            yield list(word)
+            _backtrack(stack, word)
+            continue
+        state_transitions = transitions[state]
+        remaining = completions[length - len(word) - 1]
+        while position < len(state_transitions) and \
+                state_transitions[position][1] not in remaining:
+            position += 1
+        if position == len(state_transitions):
+            _backtrack(stack, word)
+            continue
+        stack[-1][1] = position + 1
+        symbol_id, next_state = state_transitions[position]
+        word.append(symbol_id)
+        stack.append([next_state, 0])
+
+
+def _follow_cursor(stack, word, transitions, completions, cursor):
+    """ Walks along the path of the cursor, so that the exploration \
+    resumes with the word following it """
+    length = len(cursor)
+    for symbol_id in cursor:
+        state = stack[-1][0]
+        state_transitions = transitions[state]
+        position = 0
+        while position < len(state_transitions) and \
+                state_transitions[position][0] < symbol_id:
+            position += 1
+        if position == len(state_transitions) or \
+                state_transitions[position][0] != symbol_id:
+            # The cursor leaves the automaton, so the following words
+            # branch off here with a greater symbol
+            stack[-1][1] = position
+            return
+        stack[-1][1] = position + 1
+        next_state = state_transitions[position][1]
+        if next_state not in completions[length - len(word) - 1]:
+            return
+        word.append(symbol_id)
+        stack.append([next_state, 0])
+    # The cursor itself is skipped
+    _backtrack(stack, word)
+
+
+def _backtrack(stack, word):
+    """ Removes the last state of the path being explored """
+    stack.pop()
+    if word:
+        word.pop()
+
+
+def _get_cursor(start_after: Optional[Iterable[Symbol]],
+                symbols: List[Symbol]) -> Optional[List[int]]:
+    """ Gives the ids of the symbols of the word after which to resume """
+    if start_after is None:
+        return None
+    symbol_ids = {symbol: i for i, symbol in enumerate(symbols)}
+    try:
+        return [symbol_ids[to_symbol(symbol)] for symbol in start_after]
+    except KeyError as error:
+        raise ValueError("Unknown symbol in the word after which to "
+                         "resume: " + str(error)) from error
+
+
+class WordEnumerationMixin:  # pylint: disable=too-few-public-methods
+    """ Gives the enumeration of the words accepted by epsilon NFAs """
+
+    def iter_words(self, max_length: int = None,
+                   start_after: Iterable[Symbol] = None) \
+            -> Iterator[List[Symbol]]:
+        """ Enumerates the accepted words lazily, in shortlex order
+
+        The words are given by increasing length, and the words of the \
+        same length in lexicographic order, the symbols being compared by \
+        their string representation. They are explored depth first on the \
+        determinized automaton, trimmed to its useful states, one length \
+        at a time, and the language is never stored. Resuming after a word \
+        takes a time linear in its length times the size of the automaton, \
+        to find the states able to end a word of each length and to walk \
+        along its path.
+
+        Parameters
+        ----------
+        max_length : int, optional
+            The maximum length of the words. By default, the enumeration \
+            of an infinite language never stops.
+        start_after : iterable of \
+        :class:`~pyformlang.finite_automaton.Symbol`, optional
+            A word after which to resume the enumeration, typically the \
+            last word given by a previous enumeration. It does not need to \
+            be accepted.
+
+        Returns
+        ----------
+        words : iterator of lists of \
+        :class:`~pyformlang.finite_automaton.Symbol`
+            The accepted words
+
+        Raises
+        ----------
+        ValueError
+            If the word after which to resume contains a symbol which is \
+            not in the automaton
+
+        Examples
+        --------
+
+        >>> enfa = EpsilonNFA()
+        >>> enfa.add_transitions([(0, "a", 0), (0, "b", 1)])
+        >>> enfa.add_start_state(0)
+        >>> enfa.add_final_state(1)
+        >>> list(enfa.iter_words(max_length=3))
+        [[b], [a, b], [a, a, b]]
+        >>> words = enfa.iter_words(start_after=["a", "b"])
+        >>> next(words)
+        [a, a, b]
+
+        """
+        return iter_words(self.to_deterministic(), max_length, start_after)
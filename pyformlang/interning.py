@@ -0,0 +1,104 @@
+"""
+Interning of the states and symbols shared by the formalisms
+"""
+
+from typing import Any, Dict
+from weakref import ref
+
+_NO_VALUE = object()
+# The size of a pool under which its dead references are kept
+MIN_PURGE_SIZE = 1024
+
+
+class Interned(type):
+    """ A metaclass whose classes give one canonical instance per value
+
+    Building an instance from a value already in use gives the instance \
+    built first, so equal objects are usually the same object and their \
+    hash is computed once. The classes built without arguments, like the \
+    epsilons, have a single instance.
+
+    The pools only hold weak references, so the instances no longer used \
+    are forgotten, and the dead references are cleared from time to time.
+
+    The values are not interned when they are unhashable, or when an \
+    equal value of another type is already interned.
+
+    Examples
+    --------
+
+    >>> from pyformlang.finite_automaton import State
+    >>> State(0) is State(0)
+    True
+    >>> State(0) is State(0.0)
+    False
+
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        # The instances of the class, by value
+        cls._pool: Dict[Any, ref] = {}
+        cls._purge_size = MIN_PURGE_SIZE
+        cls._instance = None
+
+    def __call__(cls, value=_NO_VALUE):
+        if value is _NO_VALUE:
+            if cls._instance is None:
+                cls._instance = type.__call__(cls)
+            return cls._instance
+        try:
+            reference = cls._pool.get(value)
+        except TypeError:
+            return type.__call__(cls, value)
+        if reference is not None:
+            instance = reference()
+            if instance is not None:
+                if instance.value.__class__ is value.__class__:
+                    return instance
+                # An equal value of another type keeps its own instance
+                return type.__call__(cls, value)
+        instance = type.__call__(cls, value)
+        pool = cls._pool
+        pool[value] = ref(instance)
+        if len(pool) > cls._purge_size:
+            # The purges happen when the pool doubles, so that their cost is
+            # spread over the instances built
+            _forget_dead_references(pool)
+            cls._purge_size = max(MIN_PURGE_SIZE, 2 * len(pool))
+        return instance
+
+    def pool_size(cls) -> int:
+        """ Gives the number of interned instances of the class still alive
+
+        Returns
+        ----------
+        pool_size : int
+            The number of instances in the pool of the class
+        """
+        return sum(1
+                   for reference in list(cls._pool.values())
+                   if reference() is not None)
+
+
+class InternedObject(metaclass=Interned):
+    """ An object interned by its value
+
+    The interned objects are immutable, so they are not copied.
+    """
+    # pylint: disable=too-few-public-methods
+
+    __slots__ = ["__weakref__"]
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
+def _forget_dead_references(pool: Dict[Any, ref]):
+    """ Removes the references to dead instances from a pool """
+    for value, reference in list(pool.items()):
+        if reference() is None:
+            del pool[value]
@@ -0,0 +1,24 @@
+"""
+:mod:`pyformlang.path_query`
+============================
+
+This module deals with path queries over labeled graphs, given as \
+networkx.MultiDiGraph whose edges have a "label" attribute.
+
+Available Functions
+-------------------
+
+:func:`~pyformlang.path_query.regular_path_query`
+    Gives the pairs of nodes connected by a path whose labels form a word \
+    of a regular language
+:func:`~pyformlang.path_query.context_free_path_query`
+    Gives the pairs of nodes connected by a path whose labels form a word \
+    of a context-free language
+
+"""
+
+from .regular_queries import regular_path_query
+from .context_free_queries import context_free_path_query
+
+__all__ = ["regular_path_query",
+           "context_free_path_query"]
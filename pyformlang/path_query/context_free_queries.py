@@ -0,0 +1,384 @@
+"""
+Context-free path queries over labeled graphs
+"""
+
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, NamedTuple, Optional, \
+    Set, Tuple, Union
+
+import networkx as nx
+import numpy as np
+
+from pyformlang.cfg import CFG, Variable
+from pyformlang.finite_automaton import BooleanMatrix, Epsilon, Symbol
+from pyformlang.finite_automaton.finite_automaton import to_symbol
+from pyformlang.rsa import RecursiveAutomaton
+
+from .labeled_graph import get_labeled_edges, get_matrices, get_sources
+from .matrix_search import get_reached
+from .query_conversion import cfg_to_rsa, rsa_to_cfg
+
+ENGINES = ("hellings", "matrix", "tensor")
+
+
+class NormalFormRules(NamedTuple):
+    """ The productions of a grammar in Chomsky normal form, indexed for \
+    the path queries """
+    start_symbol: Optional[Variable]
+    generates_epsilon: bool
+    # The heads of the productions A -> a of each terminal a
+    terminal_rules: Dict[Symbol, List[Variable]]
+    # The productions A -> B C, as (A, B, C)
+    binary_rules: List[Tuple[Variable, Variable, Variable]]
+
+
+def context_free_path_query(graph: nx.MultiDiGraph,
+                            query: Union[CFG, RecursiveAutomaton],
+                            sources: Optional[Iterable[Hashable]] = None,
+                            engine: str = "hellings") \
+        -> Set[Tuple[Hashable, Hashable]]:
+    """ Gives the pairs of nodes connected by a path whose labels form a \
+    word of a context-free language
+
+    The edges are labeled by their "label" attribute, as in \
+    :func:`~pyformlang.path_query.regular_path_query`, and the labels are \
+    matched against the terminals of the query. The engines are:
+
+    * "hellings" (default), the worklist algorithm of Hellings on the \
+    Chomsky normal form of the grammar. It derives the triples (u, A, v) \
+    one by one, and each triple is combined only with the triples \
+    adjacent to it.
+    * "matrix", the algorithm of Azimov on the Chomsky normal form of the \
+    grammar. Each variable A has a sparse boolean matrix of the pairs \
+    (u, v) such that A derives a path from u to v, and each production \
+    A -> B C adds the product of the matrices of B and of C to the matrix \
+    of A, until a fixpoint. When sources are given, the matrix of a \
+    variable only holds the rows of the nodes from which it is needed, \
+    which are propagated from the sources along the productions.
+    * "tensor", the tensor algorithm on a recursive automaton. The \
+    boxes and the graph, whose edges are completed by the nonterminals \
+    derived so far, are intersected with Kronecker products. The paths of \
+    the intersection from a start state to a final state of a box then \
+    give new edges labeled by the nonterminal of the box, until a \
+    fixpoint. The paths already found are kept, and each round only \
+    extends them through the new edges.
+
+    A grammar is converted into a recursive automaton for the tensor \
+    engine, and a recursive automaton into a grammar for the others. The \
+    hellings and tensor engines compute all the pairs before keeping the \
+    ones of the sources.
+
+    The engine to choose depends on the graph and on the grammar, as \
+    measured by ``python -m benchmarks.context_free_path_queries``. \
+    Hellings is the safe default, and the fastest for all the pairs of a \
+    large sparse graph. It also handles deep derivations well, such as \
+    a^n b^n on long cycles, where the other engines need one round per \
+    level of derivation and are about a hundred times slower. The matrix \
+    engine is the best choice when only a few sources are needed on a \
+    large graph, as it only computes their rows: from 100 sources over \
+    100k edges, it is about three times faster than Hellings. The tensor \
+    engine only pays off on small graphs with many pairs in the answer, \
+    like a Dyck query on 600 random edges. Its products grow with the \
+    number of states of the query times the number of nodes, and it \
+    ignores the sources, so it should not be used on large sparse graphs, \
+    where it is about four times slower than Hellings.
+
+    Parameters
+    ----------
+    graph : networkx.MultiDiGraph
+        The labeled graph
+    query : :class:`~pyformlang.cfg.CFG` or \
+    :class:`~pyformlang.rsa.RecursiveAutomaton`
+        The context-free language of the paths
+    sources : iterable of nodes, optional
+        The nodes from which the paths start, all the nodes by default
+    engine : str, optional
+        The engine, "hellings" (default), "matrix" or "tensor"
+
+    Returns
+    ----------
+    pairs : set of (node, node)
+        The pairs of the first and the last nodes of the paths
+
+    Raises
+    ----------
+    ValueError
+        If the engine is unknown or if a source is not in the graph
+
+    Examples
+    --------
+
+    >>> graph = nx.MultiDiGraph()
+    >>> graph.add_edge(0, 1, label="a")
+    >>> graph.add_edge(1, 2, label="a")
+    >>> graph.add_edge(2, 3, label="b")
+    >>> graph.add_edge(3, 4, label="b")
+    >>> cfg = CFG.from_text("S -> a S b | a b")
+    >>> sorted(context_free_path_query(graph, cfg))
+    [(0, 4), (1, 3)]
+    >>> sorted(context_free_path_query(graph, cfg, sources=[1], \
+engine="matrix"))
+    [(1, 3)]
+
+    """
+    if engine not in ENGINES:
+        raise ValueError("Unknown engine " + str(engine) + ", expected one "
+                         "of " + ", ".join(ENGINES))
+    sources = get_sources(graph, sources)
+    if engine == "tensor":
+        if isinstance(query, CFG):
+            query = cfg_to_rsa(query)
+        pairs = _query_tensor(graph, query)
+    else:
+        if isinstance(query, RecursiveAutomaton):
+            query = rsa_to_cfg(query)
+        rules = get_normal_form_rules(query)
+        if engine == "hellings":
+            pairs = _query_hellings(graph, rules)
+        else:
+            pairs = _query_matrix(graph, rules, sources)
+        if rules.generates_epsilon:
+            pairs.update((node, node) for node in graph.nodes)
+    if len(sources) == len(graph):
+        return pairs
+    source_set = set(sources)
+    return {(u, v) for u, v in pairs if u in source_set}
+
+
+def get_normal_form_rules(cfg: CFG) -> NormalFormRules:
+    """ Indexes the productions of the Chomsky normal form of a grammar
+
+    Parameters
+    ----------
+    cfg : :class:`~pyformlang.cfg.CFG`
+        The grammar
+
+    Returns
+    ----------
+    rules : :class:`~pyformlang.path_query.context_free_queries.\
+NormalFormRules`
+        The productions of the normal form
+    """
+    normal_form = cfg.to_normal_form()
+    terminal_rules: Dict[Symbol, List[Variable]] = {}
+    binary_rules = []
+    for production in normal_form.productions:
+        body = production.body
+        if len(body) == 1:
+            terminal_rules.setdefault(to_symbol(body[0].value), []).append(
+                production.head)
+        elif len(body) == 2:
+            binary_rules.append((production.head, body[0], body[1]))
+    return NormalFormRules(normal_form.start_symbol,
+                           cfg.start_symbol is not None
+                           and cfg.generate_epsilon(),
+                           terminal_rules, binary_rules)
+
+
+def _query_hellings(graph: nx.MultiDiGraph, rules: NormalFormRules) \
+        -> Set[Tuple[Hashable, Hashable]]:
+    """ Runs the query with the worklist algorithm of Hellings """
+    # pylint: disable=too-many-locals
+    # The productions A -> B C, by B and by C
+    by_left: Dict[Variable, List[Tuple[Variable, Variable]]] = {}
+    by_right: Dict[Variable, List[Tuple[Variable, Variable]]] = {}
+    for head, left, right in rules.binary_rules:
+        by_left.setdefault(left, []).append((head, right))
+        by_right.setdefault(right, []).append((head, left))
+    # The triples (u, A, v) derived, by u and by v
+    outgoing: Dict[Hashable, Dict[Variable, Set[Hashable]]] = \
+        {node: {} for node in graph.nodes}
+    incoming: Dict[Hashable, Dict[Variable, Set[Hashable]]] = \
+        {node: {} for node in graph.nodes}
+    to_process = deque()
+
+    def add(u, variable, v):
+        targets = outgoing[u].setdefault(variable, set())
+        if v not in targets:
+            targets.add(v)
+            incoming[v].setdefault(variable, set()).add(u)
+            to_process.append((u, variable, v))
+
+    for u, symbol, v in get_labeled_edges(graph):
+        for head in rules.terminal_rules.get(symbol, ()):
+            add(u, head, v)
+    while to_process:
+        u, variable, v = to_process.popleft()
+        for head, right in by_left.get(variable, ()):
+            for w in list(outgoing[v].get(right, ())):
+                add(u, head, w)
+        for head, left in by_right.get(variable, ()):
+            for w in list(incoming[u].get(left, ())):
+                add(w, head, v)
+    return {(u, v)
+            for u, targets in outgoing.items()
+            for v in targets.get(rules.start_symbol, ())}
+
+
+def _query_matrix(graph: nx.MultiDiGraph, rules: NormalFormRules,
+                  sources: List[Hashable]) -> Set[Tuple[Hashable, Hashable]]:
+    """ Runs the query with the boolean matrix algorithm of Azimov, \
+    restricted to the rows needed by the sources """
+    # pylint: disable=too-many-locals
+    nodes = list(graph.nodes)
+    graph_matrices = get_matrices(graph)
+    size = len(nodes)
+    empty = BooleanMatrix.from_pairs([], [], (size, size))
+    variables = {head for heads in rules.terminal_rules.values()
+                 for head in heads}
+    variables.update(variable for rule in rules.binary_rules
+                     for variable in rule)
+    if rules.start_symbol not in variables:
+        return set()
+    terminal_matrices = dict.fromkeys(variables, empty)
+    for symbol, matrix in graph_matrices.matrices.items():
+        for head in rules.terminal_rules.get(symbol, ()):
+            terminal_matrices[head] = terminal_matrices[head] | matrix
+    # The rows needed for each variable, starting from the sources
+    needed = {variable: np.zeros(size, dtype=bool) for variable in variables}
+    for source in sources:
+        needed[rules.start_symbol][
+            graph_matrices.get_state_index(source)] = True
+    matrices = dict.fromkeys(variables, empty)
+    # The successive new entries of each variable, and for each production
+    # the number of them already combined and its rows already computed
+    logs = {variable: [] for variable in variables}
+    positions = [(0, 0)] * len(rules.binary_rules)
+    computed_rows = [np.zeros(size, dtype=bool)] * len(rules.binary_rules)
+    terminal_rows = {variable: np.zeros(size, dtype=bool)
+                     for variable in variables}
+
+    def add(variable, candidate):
+        delta = candidate - matrices[variable]
+        if delta.nnz:
+            matrices[variable] = matrices[variable] | delta
+            logs[variable].append(delta)
+        return delta.nnz > 0
+
+    changed = True
+    while changed:
+        changed = False
+        for variable in variables:
+            new_rows = needed[variable] & ~terminal_rows[variable]
+            terminal_rows[variable] = needed[variable].copy()
+            changed |= add(variable, _get_rows(terminal_matrices[variable],
+                                               new_rows))
+        for i, (head, left, right) in enumerate(rules.binary_rules):
+            changed |= _extend(needed[left], needed[head])
+            # Only the products involving new entries or new rows can give
+            # new entries
+            new_left = _get_union(logs[left][positions[i][0]:], empty)
+            new_right = _get_union(logs[right][positions[i][1]:], empty)
+            positions[i] = (len(logs[left]), len(logs[right]))
+            new_rows = needed[head] & ~computed_rows[i]
+            new_prefix = _get_rows(new_left, computed_rows[i]) \
+                | _get_rows(matrices[left], new_rows)
+            candidate = new_prefix @ matrices[right] \
+                | _get_rows(matrices[left], computed_rows[i]) @ new_right
+            computed_rows[i] = needed[head].copy()
+            is_prefix_end = np.zeros(size, dtype=bool)
+            is_prefix_end[new_prefix.indices] = True
+            changed |= _extend(needed[right], is_prefix_end)
+            changed |= add(head, candidate)
+    rows, columns = matrices[rules.start_symbol].to_pairs()
+    return {(nodes[u], nodes[v])
+            for u, v in zip(rows.tolist(), columns.tolist())}
+
+
+def _get_union(matrices: List[BooleanMatrix], empty: BooleanMatrix) \
+        -> BooleanMatrix:
+    """ Gives the union of matrices """
+    union = empty
+    for matrix in matrices:
+        union = union | matrix
+    return union
+
+
+def _extend(mask: np.ndarray, other: np.ndarray) -> bool:
+    """ Adds a boolean vector to another one, in place, and tells whether \
+    it changed """
+    is_new = other & ~mask
+    mask |= is_new
+    return bool(is_new.any())
+
+
+def _get_rows(matrix: BooleanMatrix, mask: np.ndarray) -> BooleanMatrix:
+    """ Keeps some rows of a matrix, the others being emptied """
+    if not matrix.nnz or mask.all():
+        return matrix
+    rows, columns = matrix.to_pairs()
+    is_kept = mask[rows]
+    return BooleanMatrix.from_pairs(rows[is_kept], columns[is_kept],
+                                    matrix.shape)
+
+
+def _query_tensor(graph: nx.MultiDiGraph, rsa: RecursiveAutomaton) \
+        -> Set[Tuple[Hashable, Hashable]]:
+    """ Runs the query with the tensor algorithm """
+    # pylint: disable=too-many-locals
+    nodes = list(graph.nodes)
+    graph_matrices = get_matrices(graph).matrices
+    size = len(nodes)
+    # The states of the boxes are numbered together
+    box_ids, is_start, is_final = [], [], []
+    state_ids: Dict[Tuple[Symbol, Hashable], int] = {}
+    nonterminals = list(rsa.boxes)
+    for i, nonterminal in enumerate(nonterminals):
+        box = rsa.boxes[nonterminal]
+        for state in box.dfa.states:
+            state_ids[(nonterminal, state)] = len(state_ids)
+            box_ids.append(i)
+            is_start.append(state in box.start_states)
+            is_final.append(state in box.final_states)
+    box_ids = np.array(box_ids, dtype=np.int64)
+    n_states = len(state_ids)
+    pairs: Dict[Symbol, List[Tuple[int, int]]] = {}
+    for nonterminal in nonterminals:
+        for s_from, symbol, s_to in rsa.boxes[nonterminal].dfa:
+            pairs.setdefault(symbol, []).append(
+                (state_ids[(nonterminal, s_from)],
+                 state_ids[(nonterminal, s_to)]))
+    box_matrices = {}
+    for symbol, symbol_pairs in pairs.items():
+        symbol_pairs = np.array(symbol_pairs, dtype=np.int64)
+        box_matrices[symbol] = BooleanMatrix.from_pairs(
+            symbol_pairs[:, 0], symbol_pairs[:, 1], (n_states, n_states))
+    empty = BooleanMatrix.from_pairs([], [], (size, size))
+    derived = {nonterminal: empty for nonterminal in nonterminals}
+    # The searches start from the pairs of a start state and of a node
+    start_ids = np.flatnonzero(is_start)
+    n_starts = len(start_ids) * size
+    frontier = BooleanMatrix.from_pairs(
+        np.arange(n_starts),
+        (start_ids[:, np.newaxis] * size + np.arange(size)).ravel(),
+        (n_starts, n_states * size))
+    reached = BooleanMatrix.from_pairs([], [], frontier.shape)
+    is_final = np.array(is_final, dtype=bool)
+    step = BooleanMatrix.from_pairs([], [], (n_states * size,) * 2)
+    for symbol, matrix in box_matrices.items():
+        if symbol == Epsilon():
+            step = step | matrix.kron(BooleanMatrix.identity(size))
+        elif symbol not in rsa.nonterminals:
+            step = step | matrix.kron(graph_matrices.get(symbol, empty))
+    while frontier.nnz:
+        rows, columns = get_reached(frontier, step, reached)
+        reached = reached | BooleanMatrix.from_pairs(rows, columns,
+                                                     reached.shape)
+        start_states, nodes_from = np.divmod(rows, max(size, 1))
+        states_to, nodes_to = np.divmod(columns, max(size, 1))
+        is_new = is_final[states_to]
+        # The searches go on only through the new nonterminal edges
+        new_step = BooleanMatrix.from_pairs([], [], step.shape)
+        for i, nonterminal in enumerate(nonterminals):
+            is_box = is_new & (box_ids[start_ids[start_states]] == i)
+            delta = BooleanMatrix.from_pairs(
+                nodes_from[is_box], nodes_to[is_box], (size, size)) \
+                - derived[nonterminal]
+            derived[nonterminal] = derived[nonterminal] | delta
+            if delta.nnz and nonterminal in box_matrices:
+                new_step = new_step | box_matrices[nonterminal].kron(delta)
+        step = step | new_step
+        frontier = reached @ new_step
+    rows, columns = derived.get(rsa.start_nonterminal, empty).to_pairs()
+    return {(nodes[u], nodes[v])
+            for u, v in zip(rows.tolist(), columns.tolist())}
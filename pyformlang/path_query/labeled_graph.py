@@ -0,0 +1,118 @@
+"""
+Access to the labeled graphs on which the paths are queried
+"""
+
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import networkx as nx
+import numpy as np
+
+from pyformlang.finite_automaton import AutomatonMatrices, BooleanMatrix, \
+    Symbol
+from pyformlang.finite_automaton.finite_automaton import to_symbol
+
+
+def get_labeled_edges(graph: nx.MultiDiGraph) \
+        -> List[Tuple[Hashable, Symbol, Hashable]]:
+    """ Gives the edges of a graph with their label as a symbol
+
+    As in :meth:`~pyformlang.finite_automaton.FiniteAutomaton.from_networkx`, \
+    the label of an edge is its "label" attribute, and the edges without \
+    label are ignored.
+
+    Parameters
+    ----------
+    graph : networkx.MultiDiGraph
+        The graph
+
+    Returns
+    ----------
+    edges : list of (node, :class:`~pyformlang.finite_automaton.Symbol`, \
+    node)
+        The labeled edges
+    """
+    return [(u, to_symbol(label), v)
+            for u, v, label in graph.edges(data="label")
+            if label is not None]
+
+
+def get_adjacency(graph: nx.MultiDiGraph) \
+        -> Dict[Hashable, Dict[Symbol, List[Hashable]]]:
+    """ Gives the successors of each node of a graph by each label
+
+    Parameters
+    ----------
+    graph : networkx.MultiDiGraph
+        The graph
+
+    Returns
+    ----------
+    adjacency : dict of node to dict of \
+    :class:`~pyformlang.finite_automaton.Symbol` to list of nodes
+        The successors of the nodes
+    """
+    adjacency = {node: {} for node in graph.nodes}
+    for u, symbol, v in get_labeled_edges(graph):
+        adjacency[u].setdefault(symbol, []).append(v)
+    return adjacency
+
+
+def get_matrices(graph: nx.MultiDiGraph) -> AutomatonMatrices:
+    """ Decomposes a graph into one boolean matrix per label
+
+    The graph is seen as an automaton whose states, which are the nodes, \
+    are all start and final states.
+
+    Parameters
+    ----------
+    graph : networkx.MultiDiGraph
+        The graph
+
+    Returns
+    ----------
+    matrices : :class:`~pyformlang.finite_automaton.AutomatonMatrices`
+        The decomposition of the graph
+    """
+    node_ids = {node: i for i, node in enumerate(graph.nodes)}
+    size = len(node_ids)
+    pairs: Dict[Symbol, List[Tuple[int, int]]] = {}
+    for u, symbol, v in get_labeled_edges(graph):
+        pairs.setdefault(symbol, []).append((node_ids[u], node_ids[v]))
+    matrices = {}
+    for symbol, symbol_pairs in pairs.items():
+        symbol_pairs = np.array(symbol_pairs, dtype=np.int64)
+        matrices[symbol] = BooleanMatrix.from_pairs(
+            symbol_pairs[:, 0], symbol_pairs[:, 1], (size, size))
+    mask = np.ones(size, dtype=bool)
+    return AutomatonMatrices(list(node_ids), matrices, mask, mask)
+
+
+def get_sources(graph: nx.MultiDiGraph,
+                sources: Optional[Iterable[Hashable]]) -> List[Hashable]:
+    """ Gives the nodes from which the paths start
+
+    Parameters
+    ----------
+    graph : networkx.MultiDiGraph
+        The graph
+    sources : iterable of nodes, optional
+        The nodes, all the nodes of the graph by default
+
+    Returns
+    ----------
+    sources : list of nodes
+        The nodes, without duplicates
+
+    Raises
+    ----------
+    ValueError
+        If a node is not in the graph
+    """
+    if sources is None:
+        return list(graph.nodes)
+    sources = list(dict.fromkeys(sources))
+    for source in sources:
+        if source not in graph:
+            raise ValueError("The source " + str(source) +
+                             " is not a node of the graph")
+    return sources
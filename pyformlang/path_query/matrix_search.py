@@ -0,0 +1,91 @@
+"""
+Multi-source searches on graphs given as boolean matrices
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from pyformlang.finite_automaton import BooleanMatrix
+
+# The maximum number of entries of the dense mask of the reached entries of a
+# batch of rows
+MAX_BATCH_ENTRIES = 2 ** 24
+
+
+def get_reached(frontier: BooleanMatrix, step: BooleanMatrix,
+                known: Optional[BooleanMatrix] = None) \
+        -> Tuple[np.ndarray, np.ndarray]:
+    """ Gives the entries reached from a frontier by repeated products by \
+    a step matrix
+
+    Each row of the frontier is a search, whose entries are the vertices it \
+    starts from. The non-empty rows are processed by batches, whose reached \
+    entries fit in a dense mask of bounded size, and each vertex reached by \
+    a row is expanded only once.
+
+    Parameters
+    ----------
+    frontier : :class:`~pyformlang.finite_automaton.BooleanMatrix`
+        The vertices from which each search starts
+    step : :class:`~pyformlang.finite_automaton.BooleanMatrix`
+        The adjacency matrix of the graph
+    known : :class:`~pyformlang.finite_automaton.BooleanMatrix`, optional
+        Entries already reached, which are neither given nor expanded \
+        again
+
+    Returns
+    ----------
+    rows : numpy.ndarray
+        The rows of the reached entries which are not known, the entries \
+        of the frontier included
+    columns : numpy.ndarray
+        The reached vertices
+    """
+    # pylint: disable=too-many-locals
+    size = frontier.shape[1]
+    batch_size = max(1, MAX_BATCH_ENTRIES // max(size, 1))
+    if known is None:
+        known = BooleanMatrix.from_pairs([], [], frontier.shape)
+    rows, columns = frontier.to_pairs()
+    known_rows, known_columns = known.to_pairs()
+    reached_rows = [np.zeros(0, dtype=np.int64)]
+    reached_columns = [np.zeros(0, dtype=np.int64)]
+    # Only the rows of the frontier are searched, renumbered in each batch
+    frontier_rows = np.flatnonzero(np.diff(frontier.indptr))
+    for first in range(0, len(frontier_rows), batch_size):
+        batch_rows = frontier_rows[first:first + batch_size]
+        begin = np.searchsorted(rows, batch_rows[0])
+        end = np.searchsorted(rows, batch_rows[-1], side="right")
+        batch = BooleanMatrix.from_pairs(
+            np.searchsorted(batch_rows, rows[begin:end]),
+            columns[begin:end], (len(batch_rows), size))
+        is_reached = np.zeros(len(batch_rows) * size, dtype=bool)
+        begin = np.searchsorted(known_rows, batch_rows[0])
+        end = np.searchsorted(known_rows, batch_rows[-1], side="right")
+        positions = np.searchsorted(batch_rows, known_rows[begin:end])
+        is_in_batch = batch_rows[positions] == known_rows[begin:end]
+        is_reached[positions[is_in_batch] * size
+                   + known_columns[begin:end][is_in_batch]] = True
+        for new_rows, new_columns in _iterate_frontiers(batch, step,
+                                                        is_reached):
+            reached_rows.append(batch_rows[new_rows])
+            reached_columns.append(new_columns)
+    return np.concatenate(reached_rows), np.concatenate(reached_columns)
+
+
+def _iterate_frontiers(frontier: BooleanMatrix, step: BooleanMatrix,
+                       is_reached: np.ndarray):
+    """ Gives the new entries of the successive frontiers of a batch, \
+    given the mask of its reached entries """
+    n_rows, size = frontier.shape
+    rows, columns = frontier.to_pairs()
+    while True:
+        is_new = ~is_reached[rows * size + columns]
+        rows, columns = rows[is_new], columns[is_new]
+        if rows.size == 0:
+            return
+        is_reached[rows * size + columns] = True
+        yield rows, columns
+        frontier = BooleanMatrix.from_pairs(rows, columns, (n_rows, size))
+        rows, columns = (frontier @ step).to_pairs()
@@ -0,0 +1,94 @@
+"""
+Conversions between the grammars and the recursive automata used as \
+context-free queries
+"""
+
+from pyformlang.cfg import CFG, Production, Terminal, Variable
+from pyformlang.finite_automaton import EpsilonNFA, Epsilon, State, Symbol
+from pyformlang.rsa import Box, RecursiveAutomaton
+
+
+def cfg_to_rsa(cfg: CFG) -> RecursiveAutomaton:
+    """ Turns a context-free grammar into a recursive automaton
+
+    Each variable gets a box, which reads the bodies of its productions \
+    from its start state to its final state. The variables of the bodies \
+    become nonterminal symbols, with the same value.
+
+    Parameters
+    ----------
+    cfg : :class:`~pyformlang.cfg.CFG`
+        The grammar
+
+    Returns
+    ----------
+    rsa : :class:`~pyformlang.rsa.RecursiveAutomaton`
+        An equivalent recursive automaton
+    """
+    enfas = {}
+    n_states = 2
+    for production in cfg.productions:
+        enfa = enfas.setdefault(production.head, _get_empty_box_enfa())
+        body = production.body
+        if not body:
+            enfa.add_transition(State(0), Epsilon(), State(1))
+            continue
+        states = [State(0)] + [State(n_states + i)
+                               for i in range(len(body) - 1)] + [State(1)]
+        n_states += len(body) - 1
+        for s_from, cfg_object, s_to in zip(states, body, states[1:]):
+            enfa.add_transition(s_from, Symbol(cfg_object.value), s_to)
+    boxes = {Box(enfa, Symbol(variable.value))
+             for variable, enfa in enfas.items()}
+    start_symbol = cfg.start_symbol
+    if start_symbol is None:
+        start_symbol = Variable("S")
+    start_box = Box(enfas.get(start_symbol, _get_empty_box_enfa()),
+                    Symbol(start_symbol.value))
+    return RecursiveAutomaton(start_box, boxes)
+
+
+def _get_empty_box_enfa() -> EpsilonNFA:
+    """ Gives the automaton of a box before the productions are added """
+    enfa = EpsilonNFA()
+    enfa.add_start_state(State(0))
+    enfa.add_final_state(State(1))
+    return enfa
+
+
+def rsa_to_cfg(rsa: RecursiveAutomaton) -> CFG:
+    """ Turns a recursive automaton into a context-free grammar
+
+    Each state of a box gets a variable, whose value is the pair of the \
+    nonterminal of the box and of the value of the state, deriving the \
+    words read from this state to a final state of the box.
+
+    Parameters
+    ----------
+    rsa : :class:`~pyformlang.rsa.RecursiveAutomaton`
+        The recursive automaton
+
+    Returns
+    ----------
+    cfg : :class:`~pyformlang.cfg.CFG`
+        An equivalent grammar
+    """
+    productions = set()
+    for nonterminal, box in rsa.boxes.items():
+        head = Variable(nonterminal.value)
+        for start_state in box.start_states:
+            productions.add(Production(
+                head, [Variable((nonterminal.value, start_state.value))]))
+        for final_state in box.final_states:
+            productions.add(Production(
+                Variable((nonterminal.value, final_state.value)), []))
+        for s_from, symbol, s_to in box.dfa:
+            body = [Variable((nonterminal.value, s_to.value))]
+            if symbol in rsa.nonterminals:
+                body.insert(0, Variable(symbol.value))
+            elif symbol != Epsilon():
+                body.insert(0, Terminal(symbol.value))
+            productions.add(Production(
+                Variable((nonterminal.value, s_from.value)), body))
+    return CFG(start_symbol=Variable(rsa.start_nonterminal.value),
+               productions=productions)
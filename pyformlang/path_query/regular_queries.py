@@ -0,0 +1,193 @@
+"""
+Regular path queries over labeled graphs
+"""
+
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple, \
+    Union
+
+import networkx as nx
+import numpy as np
+
+from pyformlang.finite_automaton import BooleanMatrix, Epsilon, \
+    FiniteAutomaton, State, Symbol
+from pyformlang.finite_automaton.bitset_nfa import iterate_bits
+from pyformlang.regular_expression import Regex
+
+from .labeled_graph import get_adjacency, get_matrices, get_sources
+from .matrix_search import get_reached
+
+ENGINES = ("bfs", "matrix")
+
+
+def regular_path_query(graph: nx.MultiDiGraph,
+                       query: Union[Regex, FiniteAutomaton],
+                       sources: Optional[Iterable[Hashable]] = None,
+                       engine: str = "bfs") \
+        -> Set[Tuple[Hashable, Hashable]]:
+    """ Gives the pairs of nodes connected by a path whose labels form a \
+    word of a regular language
+
+    The edges are labeled by their "label" attribute, as in the graphs \
+    read by :meth:`~pyformlang.finite_automaton.FiniteAutomaton.\
+from_networkx`. An edge labeled by epsilon can be followed without \
+    reading a symbol of the query.
+
+    Two engines are available, and both process all the sources together \
+    in a single traversal:
+
+    * "bfs" explores the product of the graph and of the query on the fly, \
+    from the pairs of a source and a start state only. Each pair of a node \
+    and a state carries the set of the sources which reach it, as the bits \
+    of an integer, and is explored again only when this set grows.
+    * "matrix" builds the product of the graph and of the query as \
+    Kronecker products of their boolean matrices, and then computes the \
+    reachable pairs of all the sources at once by repeated products of a \
+    matrix having one row per source. It is suited to all-pairs queries \
+    on graphs whose product is not too big.
+
+    Parameters
+    ----------
+    graph : networkx.MultiDiGraph
+        The labeled graph
+    query : :class:`~pyformlang.regular_expression.Regex` or \
+    :class:`~pyformlang.finite_automaton.FiniteAutomaton`
+        The regular language of the paths
+    sources : iterable of nodes, optional
+        The nodes from which the paths start, all the nodes by default
+    engine : str, optional
+        The engine, "bfs" (default) or "matrix"
+
+    Returns
+    ----------
+    pairs : set of (node, node)
+        The pairs of the first and the last nodes of the paths
+
+    Raises
+    ----------
+    ValueError
+        If the engine is unknown or if a source is not in the graph
+
+    Examples
+    --------
+
+    >>> graph = nx.MultiDiGraph()
+    >>> graph.add_edge(0, 1, label="a")
+    >>> graph.add_edge(1, 2, label="b")
+    >>> graph.add_edge(2, 0, label="a")
+    >>> sorted(regular_path_query(graph, Regex("a b")))
+    [(0, 2)]
+    >>> sorted(regular_path_query(graph, Regex("(a b)*"), sources=[1]))
+    [(1, 1)]
+
+    """
+    if engine not in ENGINES:
+        raise ValueError("Unknown engine " + str(engine) + ", expected one "
+                         "of " + ", ".join(ENGINES))
+    if isinstance(query, Regex):
+        query = query.to_epsilon_nfa()
+    sources = get_sources(graph, sources)
+    if engine == "bfs":
+        return _query_bfs(graph, query, sources)
+    return _query_matrix(graph, query, sources)
+
+
+def _query_bfs(graph: nx.MultiDiGraph, query: FiniteAutomaton,
+               sources: List[Hashable]) -> Set[Tuple[Hashable, Hashable]]:
+    """ Runs the query with a multi-source search on the product """
+    # pylint: disable=too-many-locals
+    adjacency = get_adjacency(graph)
+    transitions = _get_transitions(query)
+    # The bit i of reached[(node, state)] tells whether the source i
+    # reaches it
+    reached: Dict[Tuple[Hashable, State], int] = {}
+    pending: Dict[Tuple[Hashable, State], int] = {}
+    for i, source in enumerate(sources):
+        for start in query.start_states:
+            pair = (source, start)
+            reached[pair] = reached.get(pair, 0) | 1 << i
+    pending.update(reached)
+    to_process = deque(pending)
+    while to_process:
+        node, state = to_process.popleft()
+        current = pending.pop((node, state))
+        next_states = transitions.get(state, {})
+        for next_pair in _get_next_pairs(adjacency[node], next_states, node,
+                                         state):
+            new = current & ~reached.get(next_pair, 0)
+            if new:
+                reached[next_pair] = reached.get(next_pair, 0) | new
+                if next_pair not in pending:
+                    pending[next_pair] = 0
+                    to_process.append(next_pair)
+                pending[next_pair] |= new
+    return {(sources[i], node)
+            for (node, state), bits in reached.items()
+            if state in query.final_states
+            for i in iterate_bits(bits)}
+
+
+def _get_transitions(query: FiniteAutomaton) \
+        -> Dict[State, Dict[Symbol, Set[State]]]:
+    """ Gives the next states of each state of the query by each symbol """
+    transitions: Dict[State, Dict[Symbol, Set[State]]] = {}
+    for s_from, symbol, s_to in query:
+        transitions.setdefault(s_from, {}).setdefault(symbol, set()).add(s_to)
+    return transitions
+
+
+def _get_next_pairs(successors: Dict[Symbol, List[Hashable]],
+                    next_states: Dict[Symbol, Set[State]],
+                    node: Hashable, state: State) \
+        -> Iterable[Tuple[Hashable, State]]:
+    """ Gives the successors of a pair of a node and a state in the \
+    product """
+    for next_state in next_states.get(Epsilon(), ()):
+        yield node, next_state
+    for symbol, next_nodes in successors.items():
+        if symbol == Epsilon():
+            for next_node in next_nodes:
+                yield next_node, state
+            continue
+        for next_state in next_states.get(symbol, ()):
+            for next_node in next_nodes:
+                yield next_node, next_state
+
+
+def _query_matrix(graph: nx.MultiDiGraph, query: FiniteAutomaton,
+                  sources: List[Hashable]) -> Set[Tuple[Hashable, Hashable]]:
+    """ Runs the query with boolean matrices """
+    # pylint: disable=too-many-locals
+    nodes = list(graph.nodes)
+    graph_matrices = get_matrices(graph)
+    query_matrices = query.to_matrices()
+    n_states = len(query_matrices.states)
+    size = len(nodes) * n_states
+    # Following a symbol in the product is followed by an epsilon closure
+    # in the product, which is the Kronecker product of the closures
+    closure = graph_matrices.get_epsilon_closure().kron(
+        query_matrices.get_epsilon_closure())
+    step = BooleanMatrix.from_pairs([], [], (size, size))
+    for matrix in graph_matrices.intersect(query_matrices).matrices.values():
+        step = step | matrix
+    source_ids = np.array([graph_matrices.get_state_index(source)
+                           for source in sources], dtype=np.int64)
+    start_matrix = _get_start_matrix(source_ids, query_matrices.start_states,
+                                     size)
+    rows, columns = get_reached(start_matrix @ closure, step)
+    node_ids, states = np.divmod(columns, max(n_states, 1))
+    is_final = query_matrices.final_states[states]
+    return {(sources[i], nodes[node_id])
+            for i, node_id in zip(rows[is_final].tolist(),
+                                  node_ids[is_final].tolist())}
+
+
+def _get_start_matrix(source_ids: np.ndarray, start_states: np.ndarray,
+                      size: int) -> BooleanMatrix:
+    """ Gives the matrix whose row i is the pairs of the source i and of a \
+    start state """
+    starts = np.flatnonzero(start_states)
+    rows = np.repeat(np.arange(len(source_ids)), len(starts))
+    columns = (source_ids[:, np.newaxis] * len(start_states)
+               + starts).ravel()
+    return BooleanMatrix.from_pairs(rows, columns, (len(source_ids), size))
@@ -0,0 +1,106 @@
+"""
+Tests for the context-free path queries
+"""
+
+import random
+import unittest
+
+import networkx as nx
+
+from pyformlang.cfg import CFG
+from pyformlang.path_query import context_free_path_query
+from pyformlang.path_query.query_conversion import cfg_to_rsa, rsa_to_cfg
+from pyformlang.rsa import RecursiveAutomaton
+
+from .test_regular_queries import get_random_graph, get_path_enfa
+
+ENGINES = ["hellings", "matrix", "tensor"]
+
+
+def get_pairs(graph, cfg):
+    """ The answer of a query, by intersecting the grammar with the paths \
+    between each pair of nodes """
+    return {(source, target)
+            for source in graph.nodes
+            for target in graph.nodes
+            if not cfg.intersection(get_path_enfa(
+                graph, source, target).to_deterministic()).is_empty()}
+
+
+class TestContextFreeQueries(unittest.TestCase):
+    """ Tests for the context-free path queries """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_random(self):
+        random.seed(25)
+        for text in ["S -> a S b | epsilon",
+                     "S -> a S b S | b | S S",
+                     "S -> A B\nA -> a A | a\nB -> b | B S"]:
+            cfg = CFG.from_text(text)
+            rsa = RecursiveAutomaton.from_ebnf(text.replace("epsilon", "$"))
+            for _ in range(3):
+                graph = get_random_graph(5, 8)
+                expected = get_pairs(graph, cfg)
+                for engine in ENGINES:
+                    for query in [cfg, rsa]:
+                        self.assertEqual(
+                            context_free_path_query(graph, query,
+                                                    engine=engine),
+                            expected)
+                        self.assertEqual(
+                            context_free_path_query(graph, query,
+                                                    sources=[0, 2],
+                                                    engine=engine),
+                            {(u, v) for u, v in expected if u in [0, 2]})
+
+    def test_same_generation(self):
+        # Two trees whose nodes of the same depth are in the same generation
+        graph = nx.MultiDiGraph()
+        for parent, child in [("r", "x"), ("r", "y"), ("x", "x0"),
+                              ("y", "y0"), ("y", "y1")]:
+            graph.add_edge(parent, child, label="sub")
+            graph.add_edge(child, parent, label="sub_r")
+        cfg = CFG.from_text("S -> sub_r S sub | sub_r sub")
+        generations = [{"x", "y"}, {"x0", "y0", "y1"}]
+        expected = {(u, v) for generation in generations
+                    for u in generation for v in generation}
+        for engine in ENGINES:
+            self.assertEqual(context_free_path_query(graph, cfg,
+                                                     engine=engine),
+                             expected)
+            self.assertEqual(context_free_path_query(graph, cfg,
+                                                     sources=["y1"],
+                                                     engine=engine),
+                             {("y1", "x0"), ("y1", "y0"), ("y1", "y1")})
+
+    def test_empty(self):
+        graph = get_random_graph(3, 4)
+        for engine in ENGINES:
+            self.assertEqual(
+                context_free_path_query(graph, CFG(), engine=engine), set())
+            self.assertEqual(
+                context_free_path_query(graph, CFG.from_text("S -> c"),
+                                        engine=engine),
+                set())
+            self.assertEqual(
+                context_free_path_query(graph, CFG.from_text("S -> epsilon"),
+                                        engine=engine),
+                {(node, node) for node in graph.nodes})
+
+    def test_conversion(self):
+        cfg = CFG.from_text("S -> a S b | A\nA -> c A | epsilon")
+        converted = rsa_to_cfg(cfg_to_rsa(cfg))
+        for word in ["", "ab", "acb", "aaccbb", "cc"]:
+            self.assertTrue(converted.contains(list(word)))
+        for word in ["a", "abc", "ba"]:
+            self.assertFalse(converted.contains(list(word)))
+
+    def test_invalid(self):
+        graph = get_random_graph(3, 3)
+        with self.assertRaises(ValueError):
+            context_free_path_query(graph, CFG.from_text("S -> a"),
+                                    engine="cyk")
+        with self.assertRaises(ValueError):
+            context_free_path_query(graph, CFG.from_text("S -> a"),
+                                    sources=["x"])
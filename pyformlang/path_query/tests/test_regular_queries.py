@@ -0,0 +1,104 @@
+"""
+Tests for the regular path queries
+"""
+
+import random
+import unittest
+from unittest import mock
+
+import networkx as nx
+
+from pyformlang.finite_automaton import EpsilonNFA, \
+    DeterministicFiniteAutomaton, intersection_is_empty
+from pyformlang.path_query import regular_path_query
+from pyformlang.path_query import matrix_search
+from pyformlang.regular_expression import Regex
+
+
+def get_random_graph(n_nodes, n_edges, labels="ab"):
+    """ A random labeled graph """
+    graph = nx.MultiDiGraph()
+    graph.add_nodes_from(range(n_nodes))
+    for _ in range(n_edges):
+        graph.add_edge(random.randrange(n_nodes), random.randrange(n_nodes),
+                       label=random.choice(labels))
+    return graph
+
+
+def get_path_enfa(graph, source, target):
+    """ The automaton of the paths of a graph between two nodes """
+    enfa = EpsilonNFA()
+    for u, v, label in graph.edges(data="label"):
+        enfa.add_transition(u, label, v)
+    enfa.add_start_state(source)
+    enfa.add_final_state(target)
+    return enfa
+
+
+def get_pairs(graph, query):
+    """ The answer of a query, by checking each pair of nodes """
+    return {(source, target)
+            for source in graph.nodes
+            for target in graph.nodes
+            if not intersection_is_empty(
+                get_path_enfa(graph, source, target), query)}
+
+
+class TestRegularPathQuery(unittest.TestCase):
+    """ Tests for the regular path queries """
+
+    # pylint: disable=missing-function-docstring
+
+    def test_random(self):
+        random.seed(24)
+        for regex in ["a*", "a b* a", "(a|b)* b", "(a b)* | b epsilon"]:
+            query = Regex(regex)
+            for _ in range(5):
+                graph = get_random_graph(6, 10, ["a", "b", "epsilon"])
+                expected = get_pairs(graph, query.to_epsilon_nfa())
+                for engine in ["bfs", "matrix"]:
+                    self.assertEqual(
+                        regular_path_query(graph, query, engine=engine),
+                        expected)
+                    self.assertEqual(
+                        regular_path_query(graph, query, sources=[1, 3],
+                                           engine=engine),
+                        {(u, v) for u, v in expected if u in [1, 3]})
+
+    def test_automaton(self):
+        graph = nx.MultiDiGraph()
+        graph.add_edges_from([("x", "y", {"label": "a"}),
+                              ("y", "z", {"label": "a"}),
+                              ("z", "x", {"label": "b"}),
+                              ("x", "z", {})])
+        dfa = DeterministicFiniteAutomaton()
+        dfa.add_transitions([(0, "a", 1), (1, "a", 0)])
+        dfa.add_start_state(0)
+        dfa.add_final_state(0)
+        for engine in ["bfs", "matrix"]:
+            self.assertEqual(
+                regular_path_query(graph, dfa, engine=engine),
+                {("x", "x"), ("y", "y"), ("z", "z"), ("x", "z")})
+            self.assertEqual(
+                regular_path_query(graph, dfa, sources=["y", "y"],
+                                   engine=engine),
+                {("y", "y")})
+            self.assertEqual(
+                regular_path_query(graph, EpsilonNFA(), engine=engine),
+                set())
+
+    def test_batches(self):
+        random.seed(240)
+        graph = get_random_graph(10, 25)
+        query = Regex("a (a|b)*")
+        expected = regular_path_query(graph, query)
+        with mock.patch.object(matrix_search, "MAX_BATCH_ENTRIES", 50):
+            self.assertEqual(
+                regular_path_query(graph, query, engine="matrix"), expected)
+
+    def test_invalid(self):
+        graph = get_random_graph(3, 3)
+        with self.assertRaises(ValueError):
+            regular_path_query(graph, Regex("a"), engine="dfs")
+        with self.assertRaises(ValueError):
+            regular_path_query(graph, Regex("a"), sources=[3])
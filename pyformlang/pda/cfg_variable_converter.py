@@ -12,43 +12,37 @@ class CFGVariableConverter:
         self._counter_state = 0
         for self._counter_state, state in enumerate(states):
             self._inverse_states_d[state] = self._counter_state
-            state.index_cfg_converter = self._counter_state
         self._counter_state += 1
         self._inverse_stack_symbol_d = {}
         self._counter_symbol = 0
         for self._counter_symbol, symbol in enumerate(stack_symbols):
             self._inverse_stack_symbol_d[symbol] = self._counter_symbol
-            symbol.index_cfg_converter = self._counter_symbol
         self._counter_symbol += 1
         self._conversions = [[[(False, None) for _ in range(len(states))]
                               for _ in range(len(stack_symbols))] for _ in
                              range(len(states))]
 
     def _get_state_index(self, state):
-        """Get the state index"""
-        if state.index_cfg_converter is None:
-            self._set_index_state(state)
-        return state.index_cfg_converter
+        """Get the state index
 
-    def _set_index_state(self, state):
-        """Set the state index"""
-        if state not in self._inverse_states_d:
-            self._inverse_states_d[state] = self._counter_state
+        The indexes are kept by the converter and not on the states, as the \
+        states are shared by all the automata.
+        """
+        index = self._inverse_states_d.get(state)
+        if index is None:
+            index = self._counter_state
+            self._inverse_states_d[state] = index
             self._counter_state += 1
-        state.index_cfg_converter = self._inverse_states_d[state]
+        return index
 
     def _get_symbol_index(self, symbol):
         """Get the symbol index"""
-        if symbol.index_cfg_converter is None:
-            self._set_index_symbol(symbol)
-        return symbol.index_cfg_converter
-
-    def _set_index_symbol(self, symbol):
-        """ Set the symbol index """
-        if symbol not in self._inverse_stack_symbol_d:
-            self._inverse_stack_symbol_d[symbol] = self._counter_symbol
+        index = self._inverse_stack_symbol_d.get(symbol)
+        if index is None:
+            index = self._counter_symbol
+            self._inverse_stack_symbol_d[symbol] = index
             self._counter_symbol += 1
-        symbol.index_cfg_converter = self._inverse_stack_symbol_d[symbol]
+        return index
 
     def to_cfg_combined_variable(self, state0, stack_symbol, state1):
         """ Conversion used in the to_pda method """
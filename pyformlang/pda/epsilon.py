@@ -4,8 +4,10 @@ from .symbol import Symbol
 
 
 class Epsilon(Symbol):
-    """ An epsilon symbol """
+    """ An epsilon symbol, of which there is a single instance """
     # pylint: disable=too-few-public-methods
 
+    __slots__ = []
+
     def __init__(self):
         super().__init__("epsilon")
@@ -1,7 +1,9 @@
 """ A StackSymbol in a pushdown automaton """
 
+from pyformlang.interning import InternedObject
 
-class StackSymbol:
+
+class StackSymbol(InternedObject):
     """ A StackSymbol in a pushdown automaton
 
     Parameters
@@ -11,10 +13,11 @@ class StackSymbol:
 
     """
 
+    __slots__ = ["_value", "_hash"]
+
     def __init__(self, value):
         self._value = value
         self._hash = None
-        self.index_cfg_converter = None
 
     @property
     def value(self):
@@ -33,7 +36,7 @@ class StackSymbol:
         return self._hash
 
     def __eq__(self, other):
-        return self._value == other.value
+        return self is other or self._value == other.value
 
     def __repr__(self):
         return "StackSymbol(" + str(self._value) + ")"
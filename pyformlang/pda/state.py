@@ -1,7 +1,9 @@
 """ A State in a pushdown automaton """
 
+from pyformlang.interning import InternedObject
 
-class State:
+
+class State(InternedObject):
     """ A State in a pushdown automaton
 
     Parameters
@@ -11,10 +13,11 @@ class State:
 
     """
 
+    __slots__ = ["_value", "_hash"]
+
     def __init__(self, value):
         self._value = value
         self._hash = None
-        self.index_cfg_converter = None
 
     def __hash__(self):
         if self._hash is None:
@@ -33,6 +36,8 @@ class State:
         return self._value
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, State):
             return self._value == other.value
         return False
@@ -1,7 +1,9 @@
 """ A Symbol in a pushdown automaton """
 
+from pyformlang.interning import InternedObject
 
-class Symbol:
+
+class Symbol(InternedObject):
     """ A Symbol in a pushdown automaton
 
     Parameters
@@ -11,11 +13,16 @@ class Symbol:
 
     """
 
+    __slots__ = ["_value", "_hash"]
+
     def __init__(self, value):
         self._value = value
+        self._hash = None
 
     def __hash__(self):
-        return hash(str(self._value))
+        if self._hash is None:
+            self._hash = hash(str(self._value))
+        return self._hash
 
     @property
     def value(self):
@@ -29,6 +36,8 @@ class Symbol:
         return self._value
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, Symbol):
             return self._value == other.value
         return False
@@ -333,6 +333,12 @@ class TestPDA(unittest.TestCase):
         poc = PDAObjectCreator()
         self.assertEqual(poc.to_stack_symbol(Epsilon()), Epsilon())
 
+    def test_slots(self):
+        """ Tests that the objects have no attribute dictionary """
+        for pda_object in [State("q"), Symbol("a"), StackSymbol("Z"),
+                           Epsilon(), Terminal("a")]:
+            self.assertFalse(hasattr(pda_object, "__dict__"))
+
     def test_pda_paper(self):
         """ Code in the paper """
         pda = PDA()
@@ -1,7 +1,7 @@
 """
 Representation of a regular expression
 """
-from typing import Iterable
+from typing import Iterable, List
 
 from pyformlang import finite_automaton
 # pylint: disable=cyclic-import
@@ -96,6 +96,34 @@ class Regex(RegexReader):
     def _initialize_enfa(self):
         self._enfa = finite_automaton.EpsilonNFA()
 
+    @classmethod
+    def _from_node(cls, head: "Node", sons: List["Regex"]) -> "Regex":
+        """ Builds a regex from its head and its sons, without parsing a \
+        string
+
+        CAUTION: For internal use only! The sons are shared, not copied, \
+        and the state of the parser is not set.
+
+        Parameters
+        ----------
+        head : :class:`~pyformlang.regular_expression.regex_objects.Node`
+            The operator or the symbol at the root of the regex
+        sons : list of :class:`~pyformlang.regular_expression.Regex`
+            The operands of the operator
+
+        Returns
+        ----------
+        regex : :class:`~pyformlang.regular_expression.Regex`
+            The regex
+        """
+        # pylint: disable=protected-access
+        regex = cls.__new__(cls)
+        regex.head = head
+        regex.sons = sons
+        regex._counter = 0
+        regex._enfa = None
+        return regex
+
     def get_number_symbols(self) -> int:
         """ Gives the number of symbols in the regex
 
@@ -356,10 +384,9 @@ class Regex(RegexReader):
         >>> regex_union.accepts(["a", "b"])
 
         """
-        regex = Regex("")
-        regex.head = pyformlang.regular_expression.regex_objects.Union()
-        regex.sons = [self, other]
-        return regex
+        return Regex._from_node(
+            pyformlang.regular_expression.regex_objects.Union(),
+            [self, other])
 
     def __or__(self, other):
         """ Makes the union with another regex
@@ -426,11 +453,9 @@ class Regex(RegexReader):
         >>> regex_union.accepts(["a", "b", "c"])
         True
         """
-        regex = Regex("")
-        regex.head = \
-            pyformlang.regular_expression.regex_objects.Concatenation()
-        regex.sons = [self, other]
-        return regex
+        return Regex._from_node(
+            pyformlang.regular_expression.regex_objects.Concatenation(),
+            [self, other])
 
     def __add__(self, other):
         """ Concatenates a regular expression with an other one
@@ -484,10 +509,8 @@ class Regex(RegexReader):
         True
 
         """
-        regex = Regex("")
-        regex.head = pyformlang.regular_expression.regex_objects.KleeneStar()
-        regex.sons = [self]
-        return regex
+        return Regex._from_node(
+            pyformlang.regular_expression.regex_objects.KleeneStar(), [self])
 
     def from_string(self, regex_str: str):
         """ Construct a regex from a string. For internal usage.
@@ -0,0 +1,98 @@
+"""
+Tests the interning of the states and symbols
+"""
+
+import copy
+import gc
+import unittest
+
+from pyformlang import cfg, finite_automaton, pda
+from pyformlang.pda.cfg_variable_converter import CFGVariableConverter
+
+
+class TestInterning(unittest.TestCase):
+    """ Tests the interning of the states and symbols
+    """
+
+    def test_same_instance(self):
+        """ Tests that equal values give the same instance
+        """
+        for cls in [finite_automaton.State, finite_automaton.Symbol,
+                    cfg.Variable, cfg.Terminal,
+                    pda.State, pda.Symbol, pda.StackSymbol]:
+            self.assertIs(cls("a"), cls("a"))
+            self.assertIsNot(cls("a"), cls("b"))
+        self.assertIs(finite_automaton.State(1),
+                      finite_automaton.State(1))
+        self.assertIsNot(finite_automaton.State(1),
+                         finite_automaton.Symbol(1))
+
+    def test_epsilon(self):
+        """ Tests that there is a single epsilon
+        """
+        for cls in [finite_automaton.Epsilon, cfg.Epsilon, pda.Epsilon]:
+            self.assertIs(cls(), cls())
+        self.assertIsNot(finite_automaton.Symbol("epsilon"),
+                         finite_automaton.Epsilon())
+        self.assertNotEqual(finite_automaton.Symbol("epsilon"),
+                            finite_automaton.Epsilon())
+
+    def test_types_kept_apart(self):
+        """ Tests that equal values of different types are not mixed
+        """
+        state0 = finite_automaton.State(2)
+        state1 = finite_automaton.State(2.0)
+        self.assertIsNot(state0, state1)
+        self.assertEqual(state0, state1)
+        self.assertIsInstance(state0.value, int)
+        self.assertIsInstance(state1.value, float)
+        self.assertEqual(state0, 2)
+
+    def test_unhashable(self):
+        """ Tests that the unhashable values are not interned
+        """
+        state0 = finite_automaton.State([0, 1])
+        state1 = finite_automaton.State([0, 1])
+        self.assertIsNot(state0, state1)
+        self.assertEqual(state0, state1)
+
+    def test_release(self):
+        """ Tests that the unused instances are forgotten
+        """
+        symbol_class = finite_automaton.Symbol
+        gc.collect()
+        size = symbol_class.pool_size()
+        symbols = [symbol_class(("release", i)) for i in range(5000)]
+        self.assertEqual(symbol_class.pool_size(), size + 5000)
+        del symbols
+        gc.collect()
+        self.assertEqual(symbol_class.pool_size(), size)
+        # The dead references are purged as the pool grows
+        for i in range(20000):
+            symbol_class(("purge", i))
+        self.assertLess(len(symbol_class._pool),  # pylint: disable=W0212
+                        20000)
+
+    def test_copy(self):
+        """ Tests that the copies are the same instances
+        """
+        state = finite_automaton.State("copy")
+        self.assertIs(copy.copy(state), state)
+        self.assertIs(copy.deepcopy([state])[0], state)
+        variable = cfg.Variable("copy")
+        self.assertIs(copy.deepcopy(variable), variable)
+
+    def test_converters_share_states(self):
+        """ Tests that the converters of PDAs do not mix their indexes
+        """
+        states = [pda.State("q0"), pda.State("q1")]
+        stack_symbol = pda.StackSymbol("Z0")
+        converter0 = CFGVariableConverter(states, [stack_symbol])
+        converter1 = CFGVariableConverter(states[1:], [stack_symbol])
+        self.assertIsNotNone(converter1.to_cfg_combined_variable(
+            states[1], stack_symbol, states[1]))
+        self.assertNotEqual(
+            converter0.to_cfg_combined_variable(states[0], stack_symbol,
+                                                states[0]),
+            converter0.to_cfg_combined_variable(states[0], stack_symbol,
+                                                states[1]))